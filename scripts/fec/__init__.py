@@ -13,6 +13,8 @@ Commands:
     individual      - Individual contributions commands (coming soon)
     bioguide        - Bioguide crosswalk commands (coming soon)
     verify          - Verify data integrity
+    migrate         - Apply pending name/date migrations in one pass per file
+    pipeline run    - Run all stages whose inputs changed, in dependency order
 """
 
 __version__ = "1.0.0"
@@ -13,6 +13,7 @@ import httpx
 from rich.console import Console
 from rich.progress import Progress
 
+from ..utils.instrument import file_size, span
 from ..utils.progress import create_download_progress
 
 console = Console()
@@ -47,36 +48,40 @@ async def download_with_retry(
     Returns:
         True if download succeeded, False otherwise
     """
-    for attempt in range(max_retries):
-        try:
-            async with client.stream("GET", url, follow_redirects=True) as response:
-                response.raise_for_status()
-
-                total = int(response.headers.get("content-length", 0))
-                task_id = progress.add_task(
-                    f"[cyan]Downloading {dest.name}",
-                    total=total,
-                )
-
-                with open(dest, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=chunk_size):
-                        f.write(chunk)
-                        progress.update(task_id, advance=len(chunk))
-
-                progress.remove_task(task_id)
-                return True
-
-        except httpx.HTTPError as e:
-            if attempt < max_retries - 1:
-                console.print(
-                    f"[yellow]Retry {attempt + 1}/{max_retries} for {url}: {e}[/yellow]"
-                )
-                await asyncio.sleep(retry_delay * (attempt + 1))
-            else:
-                console.print(
-                    f"[red]Failed to download {url} after {max_retries} attempts: {e}[/red]"
-                )
-                return False
+    with span("download", url=url) as s:
+        for attempt in range(max_retries):
+            s.set(attempts=attempt + 1)
+            try:
+                async with client.stream("GET", url, follow_redirects=True) as response:
+                    response.raise_for_status()
+
+                    total = int(response.headers.get("content-length", 0))
+                    task_id = progress.add_task(
+                        f"[cyan]Downloading {dest.name}",
+                        total=total,
+                    )
+
+                    with open(dest, "wb") as f:
+                        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                            f.write(chunk)
+                            progress.update(task_id, advance=len(chunk))
+
+                    progress.remove_task(task_id)
+                    s.add(bytes_written=file_size(dest))
+                    return True
+
+            except httpx.HTTPError as e:
+                if attempt < max_retries - 1:
+                    console.print(
+                        f"[yellow]Retry {attempt + 1}/{max_retries} for {url}: {e}[/yellow]"
+                    )
+                    await asyncio.sleep(retry_delay * (attempt + 1))
+                else:
+                    console.print(
+                        f"[red]Failed to download {url} after {max_retries} attempts: {e}[/red]"
+                    )
+                    s.set(failed=True)
+                    return False
 
     return False
 
@@ -100,7 +105,8 @@ def extract_zip(
     """
     extracted_files: list[Path] = []
 
-    with zipfile.ZipFile(zip_path, "r") as zf:
+    with span("extract_zip", zip=zip_path.name) as s, zipfile.ZipFile(zip_path, "r") as zf:
+        s.add(bytes_read=file_size(zip_path))
         for info in zf.infolist():
             if info.is_dir():
                 continue
@@ -120,6 +126,7 @@ def extract_zip(
             with zf.open(info) as src, open(dest_path, "wb") as dst:
                 dst.write(src.read())
 
+            s.add(bytes_written=info.file_size)
             extracted_files.append(dest_path)
 
     return extracted_files
@@ -0,0 +1,15 @@
+"""Benchmarking tools for the FEC pipeline.
+
+- generate: synthetic FEC bulk-data files packaged as FEC-style ZIPs
+- run: end-to-end processor benchmarks recording rows/s and peak RSS
+- server: local FEC bulk-download server with fault injection
+- throughput: download MB/s and retry overhead against the local server
+"""
+
+from .generate import generate_bulk_data
+from .run import run_benchmarks
+
+__all__ = [
+    "generate_bulk_data",
+    "run_benchmarks",
+]
@@ -0,0 +1,408 @@
+"""Synthetic FEC bulk-data generator.
+
+Generates pipe-delimited files for every dataset in datasets.yaml plus the
+individual contributions file, using the configured column lists and the
+individual header file. Files are packaged like the FEC bulk downloads:
+
+    {out_dir}/{cycle}/{prefix}{yy}.zip   containing {prefix}{yy}.txt
+    {out_dir}/{cycle}/indiv{yy}.zip      containing itcont.txt
+
+so the directory can also be served in place of
+https://www.fec.gov/files/bulk-downloads.
+
+Committee and candidate IDs come from shared pools, so transactions,
+registrations, and links join the way real data does.
+"""
+
+import json
+import random
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import polars as pl
+from rich.console import Console
+
+from ..config import Config
+
+console = Console()
+
+MANIFEST_FILE = "manifest.json"
+HEADER_FILE = "indiv_header_file.csv"
+
+# Individual contribution file columns (FEC indiv_header_file.csv)
+DEFAULT_INDIVIDUAL_COLUMNS = [
+    "cmte_id", "amndt_ind", "rpt_tp", "transaction_pgi", "image_num", "transaction_tp",
+    "entity_tp", "name", "city", "state", "zip_code", "employer", "occupation",
+    "transaction_dt", "transaction_amt", "other_id", "tran_id", "file_num", "memo_cd",
+    "memo_text", "sub_id",
+]
+
+# Rows of each transaction file relative to the individual contributions file
+TRANSACTION_SCALE = 0.25
+
+STATES = [
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN",
+    "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV",
+    "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN",
+    "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+]
+CITIES = [
+    "NEW YORK", "LOS ANGELES", "CHICAGO", "HOUSTON", "PHOENIX", "PHILADELPHIA",
+    "SAN ANTONIO", "SAN DIEGO", "DALLAS", "AUSTIN", "COLUMBUS", "CHARLOTTE", "DENVER",
+    "BOSTON", "SEATTLE", "NASHVILLE", "PORTLAND", "LAS VEGAS", "MEMPHIS", "MIAMI",
+]
+LAST_NAMES = [
+    "SMITH", "JOHNSON", "WILLIAMS", "BROWN", "JONES", "GARCIA", "MILLER", "DAVIS",
+    "RODRIGUEZ", "MARTINEZ", "HERNANDEZ", "LOPEZ", "GONZALEZ", "WILSON", "ANDERSON",
+    "THOMAS", "TAYLOR", "MOORE", "JACKSON", "MARTIN", "O'BRIEN", "MCDONALD", "VAN DYKE",
+]
+FIRST_NAMES = [
+    "JAMES", "MARY", "ROBERT", "PATRICIA", "JOHN", "JENNIFER", "MICHAEL", "LINDA",
+    "DAVID", "ELIZABETH", "WILLIAM", "BARBARA", "RICHARD", "SUSAN", "JOSEPH", "JESSICA",
+]
+EMPLOYERS = [
+    "SELF-EMPLOYED", "RETIRED", "NOT EMPLOYED", "ACME CORP", "GLOBEX INC",
+    "INITECH LLC", "UNIVERSITY OF MICHIGAN", "STATE OF CALIFORNIA", "US ARMY",
+]
+OCCUPATIONS = [
+    "RETIRED", "ATTORNEY", "PHYSICIAN", "CEO", "ENGINEER", "TEACHER", "CONSULTANT",
+    "NOT EMPLOYED", "HOMEMAKER", "SALES", "PROFESSOR", "REAL ESTATE",
+]
+ORG_WORDS = ["AMERICANS", "FRIENDS", "VICTORY", "FUND", "PAC", "ALLIANCE", "FOR", "PROGRESS"]
+PURPOSES = ["PAYROLL", "RENT", "CONSULTING", "PRINTING", "TRAVEL", "POSTAGE", "MEDIA BUY"]
+CATEGORIES = [("001", "ADMINISTRATIVE/SALARY/OVERHEAD EXPENSES"), ("003", "SOLICITATION AND FUNDRAISING EXPENSES"),
+              ("004", "ADVERTISING EXPENSES"), ("005", "POLLING EXPENSES"), ("007", "TRAVEL EXPENSES")]
+
+# Candidate committee types; other committee types have no candidate
+CANDIDATE_COMMITTEE_TYPES = ["H", "S", "P"]
+OTHER_COMMITTEE_TYPES = ["Q", "N", "X", "Y", "O"]
+
+# Low-cardinality code columns and their values (repeats weight a value)
+CODE_VALUES = {
+    "amndt_ind": ["N"] * 9 + ["A"],
+    "memo_cd": [""] * 9 + ["X"],
+    "rpt_tp": ["Q1", "Q2", "Q3", "YE", "M3", "M6", "12G", "30G"],
+    "transaction_pgi": ["P", "G", "P2024", "G2024"],
+    "transaction_tp": ["15", "15E", "24K", "24A", "22Y"],
+    "entity_tp": ["IND"] * 8 + ["ORG", "PAC"],
+    "cmte_dsgn": ["P", "A", "U", "B", "D", "J"],
+    "cmte_filing_freq": ["Q", "M", "T"],
+    "org_tp": ["", "C", "L", "M", "T", "V", "W"],
+    "cand_ici": ["I", "C", "O"],
+    "cand_status": ["C", "F", "N", "P"],
+    "cand_pty_affiliation": ["DEM", "REP", "IND", "LIB", "GRE"],
+    "cmte_pty_affiliation": ["DEM", "REP", "", ""],
+    "pty_cd": ["1", "2", "3"],
+    "form_tp_cd": ["F3", "F3P", "F3X"],
+    "sched_tp_cd": ["SB17", "SB21B", "SB29"],
+    "line_num": ["17", "21B", "29"],
+    "linkage_id": [""],
+    "spec_election": ["", "W", "L"],
+    "prim_election": ["", "W", "L"],
+    "run_election": ["", "W", "L"],
+    "gen_election": ["", "W", "L"],
+}
+
+AMOUNT_PREFIXES = (
+    "ttl_", "coh_", "trans_", "indv_", "indiv_", "cand_contrib", "cand_loan", "other_loan",
+    "other_pol_cmte", "pol_pty_contrib", "debts_owed", "cmte_refunds", "loan_repay",
+    "ind_exp", "nonfed_", "pty_coord_exp", "contrib_to_other", "gen_election_precent",
+)
+
+
+@dataclass
+class GeneratedFile:
+    """A generated bulk-data ZIP."""
+
+    dataset: str
+    cycle: int
+    zip_path: str
+    member: str
+    rows: int
+
+
+@dataclass
+class GenerationManifest:
+    """Description of a generated data set, written to manifest.json."""
+
+    scale: int
+    seed: int
+    cycles: list[int]
+    individual_columns: list[str]
+    files: list[GeneratedFile] = field(default_factory=list)
+
+    def save(self, out_dir: Path) -> None:
+        """Write the manifest to the output directory."""
+        with open(out_dir / MANIFEST_FILE, "w") as f:
+            json.dump(asdict(self), f, indent=2)
+
+    @classmethod
+    def load(cls, out_dir: Path) -> "GenerationManifest":
+        """Load the manifest from a generated directory."""
+        with open(out_dir / MANIFEST_FILE) as f:
+            raw = json.load(f)
+        raw["files"] = [GeneratedFile(**entry) for entry in raw["files"]]
+        return cls(**raw)
+
+
+class _Sampler:
+    """Vectorized random column builders with deterministic seeds."""
+
+    def __init__(self, seed: int):
+        self.rng = random.Random(seed)
+
+    def _seed(self) -> int:
+        return self.rng.randrange(2**32)
+
+    def choice(self, values: list, n: int) -> pl.Series:
+        return pl.Series(values, dtype=pl.Utf8).sample(n, with_replacement=True, seed=self._seed())
+
+    def integers(self, low: int, high: int, n: int) -> pl.Series:
+        """Random integers in [low, high)."""
+        values = pl.int_range(low, high, eager=True)
+        return values.sample(n, with_replacement=True, seed=self._seed())
+
+    def amounts(self, n: int, max_dollars: int = 5000) -> pl.Series:
+        cents = self.integers(100, max_dollars * 100, n)
+        return pl.select(
+            (cents // 100).cast(pl.Utf8) + "." + (cents % 100).cast(pl.Utf8).str.zfill(2)
+        ).to_series()
+
+    def dates(self, cycle: int, n: int, slashed: bool = False) -> pl.Series:
+        month = self.integers(1, 13, n).cast(pl.Utf8).str.zfill(2)
+        day = self.integers(1, 29, n).cast(pl.Utf8).str.zfill(2)
+        year = self.integers(cycle - 1, cycle + 1, n).cast(pl.Utf8)
+        if slashed:
+            return pl.select(month + "/" + day + "/" + year).to_series()
+        return pl.select(month + day + year).to_series()
+
+    def names(self, n: int) -> pl.Series:
+        last = self.choice(LAST_NAMES, n)
+        first = self.choice(FIRST_NAMES, n)
+        return pl.select(last + ", " + first).to_series()
+
+    def org_names(self, n: int) -> pl.Series:
+        words = [self.choice(ORG_WORDS, n) for _ in range(3)]
+        return pl.select(words[0] + " " + words[1] + " " + words[2]).to_series()
+
+    def zips(self, n: int) -> pl.Series:
+        return self.integers(10000, 99999, n).cast(pl.Utf8) + "1234"
+
+
+def _column_values(col: str, n: int, cycle: int, sampler: _Sampler) -> pl.Series:
+    """Build realistic values for a column based on its FEC name."""
+    if col in CODE_VALUES:
+        values = sampler.choice(CODE_VALUES[col], n)
+    elif col == "transaction_amt" or col.startswith(AMOUNT_PREFIXES):
+        values = sampler.amounts(n)
+    elif col == "transaction_dt":
+        values = sampler.dates(cycle, n)
+    elif col == "cvg_end_dt":
+        values = sampler.dates(cycle, n, slashed=True)
+    elif col in ("name", "tres_nm"):
+        values = sampler.names(n)
+    elif col in ("cmte_nm", "connected_org_nm"):
+        values = sampler.org_names(n)
+    elif col == "employer":
+        values = sampler.choice(EMPLOYERS, n)
+    elif col == "occupation":
+        values = sampler.choice(OCCUPATIONS, n)
+    elif col in ("city", "cand_city", "cmte_city"):
+        values = sampler.choice(CITIES, n)
+    elif col in ("state", "cand_st", "cmte_st", "cand_office_st"):
+        values = sampler.choice(STATES, n)
+    elif col in ("zip_code", "cand_zip", "cmte_zip"):
+        values = sampler.zips(n)
+    elif col in ("cand_election_yr", "fec_election_yr", "rpt_yr"):
+        values = pl.Series([str(cycle)] * n)
+    elif col in ("image_num", "file_num"):
+        values = sampler.integers(1_000_000, 9_999_999, n).cast(pl.Utf8)
+    elif col in ("tran_id", "back_ref_tran_id"):
+        values = "SA11AI." + sampler.integers(0, 10_000_000, n).cast(pl.Utf8)
+    elif col == "purpose":
+        values = sampler.choice(PURPOSES, n)
+    elif col == "memo_text":
+        values = sampler.choice([""] * 9 + ["EARMARKED"], n)
+    elif col == "cand_office_district":
+        values = sampler.integers(0, 53, n).cast(pl.Utf8).str.zfill(2)
+    elif col in ("cand_st1", "cand_st2", "cmte_st1", "cmte_st2"):
+        values = sampler.integers(1, 9999, n).cast(pl.Utf8) + " MAIN ST"
+    else:
+        values = sampler.choice(["A", "B", "C"], n)
+    return values.alias(col)
+
+
+def _build_entities(scale: int, sampler: _Sampler) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Build the shared committee and candidate pools."""
+    n_candidates = max(20, scale // 500)
+    n_committees = max(50, scale // 200)
+
+    offices = sampler.choice(["H"] * 8 + ["S", "P"], n_candidates)
+    states = sampler.choice(STATES, n_candidates)
+    candidates = pl.DataFrame({"cand_office": offices, "cand_office_st": states}).with_columns(
+        cand_id=pl.col("cand_office")
+        + pl.int_range(pl.len()).mod(10).cast(pl.Utf8)
+        + pl.col("cand_office_st")
+        + pl.int_range(pl.len()).cast(pl.Utf8).str.zfill(5),
+        cand_name=sampler.names(n_candidates),
+    )
+
+    # Most committees are candidate committees so individual contributions
+    # produce a realistic share of matched rows
+    cmte_tp = sampler.choice(CANDIDATE_COMMITTEE_TYPES * 2 + OTHER_COMMITTEE_TYPES, n_committees)
+    cand_ids = candidates["cand_id"].sample(n_committees, with_replacement=True, seed=sampler._seed())
+    committees = pl.DataFrame({"cmte_tp": cmte_tp, "cand_id": cand_ids}).with_columns(
+        cmte_id="C" + pl.int_range(pl.len()).cast(pl.Utf8).str.zfill(8),
+        cand_id=pl.when(pl.col("cmte_tp").is_in(CANDIDATE_COMMITTEE_TYPES))
+        .then(pl.col("cand_id"))
+        .otherwise(pl.lit("")),
+    )
+
+    return committees, candidates
+
+
+def _build_file(
+    columns: list[str],
+    n: int,
+    cycle: int,
+    sampler: _Sampler,
+    entities: pl.DataFrame | None = None,
+    sub_id_start: int = 0,
+) -> pl.DataFrame:
+    """Build one data file.
+
+    Columns present in entities are taken from it (one row per entity when
+    n equals its length, sampled otherwise); the rest are generated.
+    """
+    if entities is not None:
+        if n == len(entities):
+            base = entities
+        else:
+            base = entities.sample(n, with_replacement=True, seed=sampler._seed())
+    else:
+        base = pl.DataFrame()
+
+    series = []
+    for col in columns:
+        if col in base.columns:
+            series.append(base[col])
+        elif col == "sub_id":
+            series.append(pl.int_range(sub_id_start, sub_id_start + n, eager=True).cast(pl.Utf8).alias(col))
+        elif col in ("other_id", "cand_pcc") and entities is not None and "cmte_id" in entities.columns:
+            series.append(entities["cmte_id"].sample(n, with_replacement=True, seed=sampler._seed()).alias(col))
+        else:
+            series.append(_column_values(col, n, cycle, sampler))
+
+    df = pl.DataFrame(series)
+
+    if "category" in columns and "category_desc" in columns:
+        codes = pl.DataFrame({"category": [c for c, _ in CATEGORIES], "category_desc": [d for _, d in CATEGORIES]})
+        picked = codes.sample(n, with_replacement=True, seed=sampler._seed())
+        df = df.with_columns(picked["category"], picked["category_desc"])
+
+    return df
+
+
+def _write_zip(df: pl.DataFrame, zip_path: Path, member: str) -> None:
+    """Write a DataFrame as a headerless pipe-delimited file inside a ZIP."""
+    zip_path.parent.mkdir(parents=True, exist_ok=True)
+    txt_path = zip_path.with_suffix(".txt.tmp")
+    df.write_csv(txt_path, separator="|", include_header=False, quote_style="never")
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.write(txt_path, arcname=member)
+    txt_path.unlink()
+
+
+def load_individual_columns(header_file: Path | None) -> list[str]:
+    """Read individual contribution columns from a header file, or use the FEC defaults."""
+    if header_file is None or not header_file.exists():
+        return list(DEFAULT_INDIVIDUAL_COLUMNS)
+    with open(header_file) as f:
+        return [h.lower() for h in f.read().strip().split(",")]
+
+
+def generate_bulk_data(
+    config: Config,
+    out_dir: Path,
+    cycles: list[int],
+    scale: int = 100_000,
+    seed: int = 0,
+    header_file: Path | None = None,
+) -> GenerationManifest:
+    """Generate synthetic FEC bulk-data ZIPs for the given cycles.
+
+    Args:
+        config: Loaded configuration (dataset column lists and prefixes)
+        out_dir: Output directory (laid out like the FEC bulk-download site)
+        cycles: Election cycles to generate
+        scale: Individual contribution rows per cycle; other files scale from it
+        seed: Random seed (the same seed and scale give identical files)
+        header_file: Individual contributions header file (FEC defaults if None)
+
+    Returns:
+        Manifest describing the generated files (also written to manifest.json)
+    """
+    sampler = _Sampler(seed)
+    committees, candidates = _build_entities(scale, sampler)
+    individual_columns = load_individual_columns(header_file)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with open(out_dir / HEADER_FILE, "w") as f:
+        f.write(",".join(col.upper() for col in individual_columns) + "\n")
+
+    manifest = GenerationManifest(
+        scale=scale, seed=seed, cycles=cycles, individual_columns=individual_columns
+    )
+    transaction_rows = max(1, int(scale * TRANSACTION_SCALE))
+    candidate_committees = committees.filter(pl.col("cmte_tp").is_in(CANDIDATE_COMMITTEE_TYPES))
+
+    def emit(dataset: str, cycle: int, prefix: str, df: pl.DataFrame, member: str | None = None) -> None:
+        yy = str(cycle)[2:]
+        zip_path = out_dir / str(cycle) / f"{prefix}{yy}.zip"
+        member = member or f"{prefix}{yy}.txt"
+        _write_zip(df, zip_path, member)
+        manifest.files.append(
+            GeneratedFile(dataset, cycle, str(zip_path.relative_to(out_dir)), member, len(df))
+        )
+        console.print(f"  {zip_path.relative_to(out_dir)}: {len(df):,} rows")
+
+    for cycle in cycles:
+        console.print(f"[bold]{cycle}[/bold]")
+        sub_id = cycle * 10**9
+
+        emit(
+            "individual_contributions",
+            cycle,
+            "indiv",
+            _build_file(individual_columns, scale, cycle, sampler, candidate_committees, sub_id),
+            member="itcont.txt",
+        )
+
+        for name, dataset in config.combine_datasets.items():
+            if cycle < dataset.start_year:
+                continue
+            # One row per candidate, per committee, or per candidate committee link
+            if "cmte_id" not in dataset.columns:
+                entities = candidates
+            elif "cand_id" in dataset.columns and "cmte_nm" not in dataset.columns:
+                entities = candidate_committees
+            else:
+                entities = committees
+            df = _build_file(dataset.columns, len(entities), cycle, sampler, entities)
+            emit(name, cycle, dataset.fec_prefix, df)
+
+        emitted = set()
+        for name, dataset in config.summarize_datasets.items():
+            # Datasets sharing a source file (e.g. oppexp) are generated once
+            if cycle < dataset.start_year or dataset.fec_prefix in emitted:
+                continue
+            emitted.add(dataset.fec_prefix)
+            df = _build_file(
+                dataset.input_columns, transaction_rows, cycle, sampler, committees,
+                sub_id + scale + len(emitted) * transaction_rows,
+            )
+            emit(name, cycle, dataset.fec_prefix, df)
+
+    manifest.save(out_dir)
+    return manifest
@@ -0,0 +1,385 @@
+"""End-to-end processor benchmarks on generated bulk data.
+
+Each benchmark runs in a fresh (spawned) process, so its peak RSS is its
+own and not inflated by earlier benchmarks. Results are appended to a JSON
+file so runs can be compared over time.
+"""
+
+import json
+import multiprocessing
+import os
+import platform
+import queue as queue_module
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+from ..utils.instrument import peak_rss_mb
+from .generate import HEADER_FILE, GeneratedFile, GenerationManifest
+
+console = Console()
+
+RESULTS_FILE = "bench_results.json"
+
+# Seconds between checks that a benchmark process is still alive
+POLL_INTERVAL = 1.0
+
+
+@dataclass
+class BenchContext:
+    """Paths shared by the benchmarks of one run (must be picklable)."""
+
+    generated_dir: Path
+    run_dir: Path
+    config_path: Path
+    sidecar: bool = False
+
+    @property
+    def data_dir(self) -> Path:
+        return self.run_dir / "data"
+
+    @property
+    def individual_dir(self) -> Path:
+        return self.run_dir / "individual_contributions"
+
+    @property
+    def extracted_dir(self) -> Path:
+        return self.run_dir / "extracted"
+
+    def manifest(self) -> GenerationManifest:
+        return GenerationManifest.load(self.generated_dir)
+
+    def files_for_prefix(self, prefix: str) -> list[GeneratedFile]:
+        """Generated files whose ZIP has the given FEC prefix."""
+        return [
+            f for f in self.manifest().files
+            if Path(f.zip_path).name == f"{prefix}{str(f.cycle)[2:]}.zip"
+        ]
+
+
+@dataclass
+class BenchResult:
+    """Timing and memory of one benchmark."""
+
+    name: str
+    seconds: float
+    rows: int
+    rows_per_sec: float
+    peak_rss_mb: float | None
+    error: str | None = None
+
+
+@dataclass
+class BenchRun:
+    """One run of the benchmark suite."""
+
+    started_at: str
+    scale: int
+    cycles: list[int]
+    seed: int
+    git_commit: str | None
+    python_version: str
+    polars_version: str
+    cpu_count: int | None
+    results: list[BenchResult] = field(default_factory=list)
+
+
+# Benchmarks run in worker processes, so they must be module-level functions.
+# Each returns the number of input rows it processed.
+
+
+def _bench_process_zip(ctx: BenchContext) -> int:
+    from ..processors.individual import IndividualDownloader
+
+    downloader = IndividualDownloader(ctx.individual_dir, ctx.generated_dir / HEADER_FILE)
+    headers = downloader.load_headers()
+
+    rows = 0
+    for f in ctx.files_for_prefix("indiv"):
+        if not downloader.process_zip(
+            ctx.generated_dir / f.zip_path, f.cycle, headers, downloader.get_output_path(f.cycle)
+        ):
+            raise RuntimeError(f"process_zip failed for {f.zip_path}")
+        rows += f.rows
+    return rows
+
+
+def _bench_combine(ctx: BenchContext) -> int:
+    from ..config import Config
+    from ..integrate import find_input_file
+    from ..processors import CombineProcessor
+
+    config = Config.load(ctx.config_path, ctx.data_dir)
+    rows = 0
+    for dataset in config.combine_datasets.values():
+        processor = CombineProcessor(dataset, config.data_dir)
+        for f in ctx.files_for_prefix(dataset.fec_prefix):
+            processor.update_cycle(find_input_file(ctx.extracted_dir, dataset.fec_prefix, f.cycle), f.cycle)
+            rows += f.rows
+    return rows
+
+
+def _bench_summarize(ctx: BenchContext) -> int:
+    from ..config import Config
+    from ..integrate import find_input_file
+    from ..processors import SummarizeProcessor
+
+    config = Config.load(ctx.config_path, ctx.data_dir)
+    rows = 0
+    for dataset in config.summarize_datasets.values():
+        processor = SummarizeProcessor(dataset, config.data_dir)
+        for f in ctx.files_for_prefix(dataset.fec_prefix):
+            processor.update_cycle(find_input_file(ctx.extracted_dir, dataset.fec_prefix, f.cycle), f.cycle)
+            rows += f.rows
+    return rows
+
+
+def _bench_add_year(ctx: BenchContext) -> int:
+    from ..processors.individual import TransactionYearAdder
+
+    return TransactionYearAdder(ctx.individual_dir, sidecar=ctx.sidecar).process_all(force=True)
+
+
+def _bench_individual_summarize(ctx: BenchContext) -> int:
+    from ..processors.individual import IndividualSummarizer
+
+    output_file = ctx.data_dir / "candidate_individual_contribution_summaries_1980-2026.csv"
+    IndividualSummarizer(ctx.data_dir, ctx.individual_dir, output_file, use_cache=False).summarize_all()
+    return sum(f.rows for f in ctx.files_for_prefix("indiv"))
+
+
+# Benchmarks in run order, with the benchmarks whose outputs they read
+BENCHMARKS: dict[str, tuple[Callable[[BenchContext], int], list[str]]] = {
+    "process_zip": (_bench_process_zip, []),
+    "combine": (_bench_combine, []),
+    "summarize": (_bench_summarize, []),
+    "add_year": (_bench_add_year, ["process_zip"]),
+    "individual_summarize": (_bench_individual_summarize, ["process_zip", "combine"]),
+}
+
+
+def _run_benchmark_process(name: str, ctx: BenchContext, queue: Any, quiet: bool) -> None:
+    """Run one benchmark and report its result through the queue."""
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+
+    func, _ = BENCHMARKS[name]
+    started = time.perf_counter()
+    try:
+        rows = func(ctx)
+        error = None
+    except (Exception, SystemExit) as e:
+        rows = 0
+        error = f"{type(e).__name__}: {e}"
+    seconds = time.perf_counter() - started
+
+    queue.put(asdict(BenchResult(
+        name=name,
+        seconds=seconds,
+        rows=rows,
+        rows_per_sec=rows / seconds if seconds > 0 else 0.0,
+        peak_rss_mb=peak_rss_mb(),
+        error=error,
+    )))
+
+
+def _run_isolated(name: str, ctx: BenchContext, quiet: bool) -> BenchResult:
+    """Run a benchmark in a fresh spawned process.
+
+    A process that dies without reporting (e.g. killed for running out of
+    memory) is recorded as a failed result.
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_run_benchmark_process, args=(name, ctx, queue, quiet))
+    started = time.perf_counter()
+    process.start()
+
+    raw = None
+    while raw is None:
+        alive = process.is_alive()
+        try:
+            raw = queue.get(timeout=POLL_INTERVAL)
+        except queue_module.Empty:
+            # Checked before waiting, so a result put just before exit is still read
+            if not alive:
+                break
+    process.join()
+
+    if raw is None:
+        return BenchResult(
+            name=name,
+            seconds=time.perf_counter() - started,
+            rows=0,
+            rows_per_sec=0.0,
+            peak_rss_mb=None,
+            error=f"Benchmark process exited with code {process.exitcode} without a result",
+        )
+    return BenchResult(**raw)
+
+
+def prepare_run_dir(ctx: BenchContext) -> None:
+    """Create a clean run directory and extract the non-individual ZIPs."""
+    import shutil
+
+    from ..async_utils.download import extract_zip
+
+    if ctx.run_dir.exists():
+        shutil.rmtree(ctx.run_dir)
+    for path in (ctx.data_dir, ctx.individual_dir, ctx.extracted_dir):
+        path.mkdir(parents=True)
+
+    for f in ctx.manifest().files:
+        if f.member != "itcont.txt":
+            extract_zip(ctx.generated_dir / f.zip_path, ctx.extracted_dir, f.cycle)
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmarks(
+    ctx: BenchContext,
+    only: list[str] | None = None,
+    results_file: Path | None = None,
+    quiet: bool = True,
+) -> BenchRun:
+    """Run the benchmark suite and append the results to a JSON file.
+
+    Args:
+        ctx: Benchmark paths (generated data and a scratch run directory)
+        only: Benchmarks to record (their prerequisites still run, unrecorded)
+        results_file: JSON file to append to (default: bench_results.json in
+            the generated directory)
+        quiet: If True, silence processor output
+
+    Returns:
+        The run with its results
+    """
+    selected = only or list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    needed = set(selected)
+    for name in selected:
+        needed.update(BENCHMARKS[name][1])
+
+    manifest = ctx.manifest()
+    run = BenchRun(
+        started_at=datetime.now().isoformat(),
+        scale=manifest.scale,
+        cycles=manifest.cycles,
+        seed=manifest.seed,
+        git_commit=_git_commit(),
+        python_version=platform.python_version(),
+        polars_version=pl.__version__,
+        cpu_count=os.cpu_count(),
+    )
+
+    prepare_run_dir(ctx)
+
+    for name in BENCHMARKS:
+        if name not in needed:
+            continue
+
+        recorded = name in selected
+        console.print(f"{'Running' if recorded else 'Preparing'} {name}...")
+        result = _run_isolated(name, ctx, quiet)
+
+        if result.error:
+            console.print(f"  [red]{name} failed: {result.error}[/red]")
+        elif recorded:
+            console.print(
+                f"  {result.rows:,} rows in {result.seconds:.2f}s "
+                f"({result.rows_per_sec:,.0f} rows/s)"
+            )
+        if recorded:
+            run.results.append(result)
+
+    results_file = results_file or ctx.generated_dir / RESULTS_FILE
+    history = load_results(results_file)
+    print_results(run, _previous_run(history, run))
+    save_results(results_file, history + [run])
+
+    return run
+
+
+def load_results(results_file: Path) -> list[BenchRun]:
+    """Load previous benchmark runs."""
+    if not results_file.exists():
+        return []
+
+    with open(results_file) as f:
+        raw = json.load(f)
+
+    runs = []
+    for entry in raw.get("runs", []):
+        entry["results"] = [BenchResult(**r) for r in entry.get("results", [])]
+        runs.append(BenchRun(**entry))
+    return runs
+
+
+def save_results(results_file: Path, runs: list[BenchRun]) -> None:
+    """Write benchmark runs to the results file."""
+    with open(results_file, "w") as f:
+        json.dump({"runs": [asdict(run) for run in runs]}, f, indent=2)
+
+
+def _previous_run(history: list[BenchRun], run: BenchRun) -> BenchRun | None:
+    """Most recent earlier run at the same scale and cycles."""
+    for previous in reversed(history):
+        if previous.scale == run.scale and previous.cycles == run.cycles:
+            return previous
+    return None
+
+
+def print_results(run: BenchRun, previous: BenchRun | None = None) -> None:
+    """Print a run's results, with the change in rows/s against a previous run."""
+    before = {r.name: r for r in previous.results} if previous else {}
+
+    table = Table(title=f"Benchmarks (scale {run.scale:,}, cycles {', '.join(map(str, run.cycles))})")
+    table.add_column("Benchmark")
+    table.add_column("Rows", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Rows/s", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column("vs previous", justify="right")
+
+    for result in run.results:
+        if result.error:
+            table.add_row(result.name, "-", "-", "-", "-", "[red]failed[/red]")
+            continue
+
+        change = "-"
+        prior = before.get(result.name)
+        if prior and not prior.error and prior.rows_per_sec > 0:
+            change = f"{result.rows_per_sec / prior.rows_per_sec:.2f}x"
+
+        table.add_row(
+            result.name,
+            f"{result.rows:,}",
+            f"{result.seconds:.2f}",
+            f"{result.rows_per_sec:,.0f}",
+            f"{result.peak_rss_mb:,.0f}" if result.peak_rss_mb is not None else "-",
+            change,
+        )
+
+    console.print(table)
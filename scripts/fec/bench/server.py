@@ -0,0 +1,319 @@
+"""Local stand-in for the FEC bulk-download server.
+
+Serves a directory laid out like https://www.fec.gov/files/bulk-downloads
+(for example one written by `fec bench generate`):
+
+    {root}/{cycle}/{prefix}{yy}.zip
+
+with the headers change detection and downloads rely on (ETag,
+Last-Modified, Content-Length), conditional requests (304), and byte ranges
+(206). Bandwidth, latency, 429/503 responses, and mid-stream disconnects can
+be injected, so fec_base_url in datasets.yaml can point at it to exercise
+the retry paths.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+# Bytes written per socket send; bandwidth is throttled per chunk
+SEND_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class FaultConfig:
+    """Faults injected into responses.
+
+    Rates are probabilities per request. Bandwidth is per connection, in
+    MB/s (None for unthrottled).
+    """
+
+    latency_ms: float = 0.0
+    bandwidth_mbps: float | None = None
+    rate_429: float = 0.0
+    rate_503: float = 0.0
+    disconnect_rate: float = 0.0
+    retry_after: int = 1
+    seed: int | None = None
+
+
+@dataclass
+class ServerStats:
+    """Request counters, shared by all handler threads."""
+
+    requests: int = 0
+    bytes_sent: int = 0
+    disconnects: int = 0
+    status_counts: dict[int, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, status: int, bytes_sent: int = 0, disconnected: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += bytes_sent
+            self.disconnects += disconnected
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "bytes_sent": self.bytes_sent,
+                "disconnects": self.disconnects,
+                "status_counts": dict(self.status_counts),
+            }
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a single-range Range header into inclusive (start, end).
+
+    Returns None if the range cannot be satisfied. Raises ValueError if the
+    header is malformed or asks for several ranges, in which case the whole
+    file is served (as RFC 9110 allows).
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        raise ValueError(f"Unsupported range: {header}")
+
+    first, _, last = spec.strip().partition("-")
+    if first:
+        start = int(first)
+        end = int(last) if last else size - 1
+    elif last:
+        # Suffix range: the last N bytes
+        start = max(size - int(last), 0)
+        end = size - 1
+    else:
+        raise ValueError(f"Malformed range: {header}")
+
+    if start > end or start >= size:
+        return None
+    return start, min(end, size - 1)
+
+
+class FecRequestHandler(BaseHTTPRequestHandler):
+    """Serves files under the server root with injected faults."""
+
+    server: "FecBulkServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_HEAD(self) -> None:
+        self._serve(send_body=False)
+
+    def do_GET(self) -> None:
+        self._serve(send_body=True)
+
+    def _resolve(self) -> Path | None:
+        """Map the request path to a file under the root, if any."""
+        path = unquote(urlsplit(self.path).path).lstrip("/")
+        prefix = self.server.path_prefix.strip("/")
+        if prefix:
+            if not (path == prefix or path.startswith(prefix + "/")):
+                return None
+            path = path[len(prefix):].lstrip("/")
+
+        root = self.server.root
+        target = (root / path).resolve()
+        if not target.is_relative_to(root) or not target.is_file():
+            return None
+        return target
+
+    def _send_status(self, status: int, headers: dict[str, str] | None = None) -> None:
+        """Send a response with no body."""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        self.server.stats.record(status)
+
+    def _serve(self, send_body: bool) -> None:
+        faults = self.server.faults
+        if faults.latency_ms:
+            time.sleep(faults.latency_ms / 1000)
+
+        roll = self.server.roll()
+        if roll < faults.rate_429:
+            self._send_status(HTTPStatus.TOO_MANY_REQUESTS, {"Retry-After": str(faults.retry_after)})
+            return
+        if roll < faults.rate_429 + faults.rate_503:
+            self._send_status(HTTPStatus.SERVICE_UNAVAILABLE, {"Retry-After": str(faults.retry_after)})
+            return
+
+        target = self._resolve()
+        if target is None:
+            self._send_status(HTTPStatus.NOT_FOUND)
+            return
+
+        stat = target.stat()
+        size = stat.st_size
+        etag = f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        last_modified = formatdate(stat.st_mtime, usegmt=True)
+        validators = {"ETag": etag, "Last-Modified": last_modified, "Accept-Ranges": "bytes"}
+
+        if self._not_modified(etag, stat.st_mtime):
+            self._send_status(HTTPStatus.NOT_MODIFIED, validators)
+            return
+
+        status = HTTPStatus.OK
+        start, end = 0, size - 1
+        range_header = self.headers.get("Range")
+        if range_header and self._range_applies(etag, last_modified):
+            try:
+                byte_range = parse_range(range_header, size)
+            except ValueError:
+                byte_range = (0, size - 1)
+            if byte_range is None:
+                self._send_status(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, {"Content-Range": f"bytes */{size}"})
+                return
+            if byte_range != (0, size - 1):
+                status = HTTPStatus.PARTIAL_CONTENT
+            start, end = byte_range
+
+        length = max(end - start + 1, 0)
+        self.send_response(status)
+        for name, value in validators.items():
+            self.send_header(name, value)
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+
+        if not send_body:
+            self.server.stats.record(status)
+            return
+
+        # Drop the connection at a random point in the body
+        cutoff = None
+        if self.server.roll() < faults.disconnect_rate and length > 0:
+            cutoff = int(length * self.server.roll())
+
+        sent = self._send_file(target, start, length, cutoff)
+        disconnected = cutoff is not None
+        if disconnected:
+            self.close_connection = True
+        self.server.stats.record(status, sent, disconnected)
+
+    def _send_file(self, target: Path, start: int, length: int, cutoff: int | None) -> int:
+        """Write the body, throttled to the configured bandwidth."""
+        bandwidth = self.server.faults.bandwidth_mbps
+        limit = length if cutoff is None else cutoff
+        sent = 0
+        started = time.perf_counter()
+
+        with open(target, "rb") as f:
+            f.seek(start)
+            while sent < limit:
+                chunk = f.read(min(SEND_CHUNK_SIZE, limit - sent))
+                if not chunk:
+                    break
+                try:
+                    self.wfile.write(chunk)
+                except (BrokenPipeError, ConnectionResetError):
+                    break
+                sent += len(chunk)
+
+                if bandwidth:
+                    ahead = sent / (bandwidth * 1024 * 1024) - (time.perf_counter() - started)
+                    if ahead > 0:
+                        time.sleep(ahead)
+
+        return sent
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        """Evaluate If-None-Match / If-Modified-Since."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            modified = datetime.fromtimestamp(int(mtime), tz=timezone.utc)
+            return modified <= since
+        return False
+
+    def _range_applies(self, etag: str, last_modified: str) -> bool:
+        """Evaluate If-Range: serve the range only if the validator matches."""
+        if_range = self.headers.get("If-Range")
+        return not if_range or if_range in (etag, last_modified)
+
+
+class FecBulkServer(ThreadingHTTPServer):
+    """Threaded HTTP server for a bulk-download directory.
+
+    Usable as a context manager, which serves from a background thread:
+
+        with FecBulkServer(Path("bench_data")) as server:
+            config.fec_base_url = server.base_url
+    """
+
+    daemon_threads = True
+    # Concurrent HEAD checks open many connections at once
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        root: Path,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        faults: FaultConfig | None = None,
+        path_prefix: str = "/files/bulk-downloads",
+        verbose: bool = False,
+    ):
+        super().__init__((host, port), FecRequestHandler)
+        self.root = root.resolve()
+        self.faults = faults or FaultConfig()
+        self.path_prefix = path_prefix
+        self.verbose = verbose
+        self.stats = ServerStats()
+        self._random = random.Random(self.faults.seed)
+        self._random_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """URL to use as fec_base_url."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{self.path_prefix.rstrip('/')}"
+
+    def roll(self) -> float:
+        """Draw a fault probability (thread-safe and reproducible per seed)."""
+        with self._random_lock:
+            return self._random.random()
+
+    def start(self) -> "FecBulkServer":
+        """Serve from a daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> "FecBulkServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,208 @@
+"""Download throughput benchmark against the local bulk-download server.
+
+Runs the real change-detection (HEAD) and download-with-retry code against
+a FecBulkServer serving generated data, and reports MB/s plus what retries
+cost: extra requests, bytes thrown away by broken transfers, and the extra
+time compared with a fault-free pass.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import httpx
+from rich.console import Console
+from rich.progress import Progress
+from rich.table import Table
+
+from ..config import get_fec_zip_url
+from .generate import GenerationManifest
+from .server import FaultConfig, FecBulkServer
+
+console = Console()
+
+
+@dataclass
+class DownloadBenchResult:
+    """Outcome of one download pass."""
+
+    label: str
+    files: int
+    failed: int
+    bytes: int
+    seconds: float
+    check_seconds: float
+    requests: int
+    wasted_bytes: int
+    disconnects: int
+    throttled: int
+
+    @property
+    def mb_per_sec(self) -> float:
+        return self.bytes / (1024 * 1024) / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def retries(self) -> int:
+        # Requests beyond one HEAD and one GET per file
+        return max(self.requests - 2 * self.files, 0)
+
+
+async def _download_all(
+    urls: list[tuple[str, Path]],
+    concurrency: int,
+    max_retries: int,
+    retry_delay: float,
+    progress: Progress,
+) -> tuple[float, list[bool]]:
+    """HEAD every URL, then download them all; returns (HEAD seconds, successes)."""
+    from ..async_utils.download import download_with_retry
+    from ..detect import check_url
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        async def fetch(url: str, dest: Path) -> bool:
+            async with semaphore:
+                return await download_with_retry(
+                    client, url, dest, progress, max_retries=max_retries, retry_delay=retry_delay
+                )
+
+        started = time.perf_counter()
+        await asyncio.gather(*(check_url(client, url) for url, _ in urls))
+        check_seconds = time.perf_counter() - started
+
+        results = await asyncio.gather(*(fetch(url, dest) for url, dest in urls))
+
+    return check_seconds, results
+
+
+def _run_pass(
+    label: str,
+    generated_dir: Path,
+    files: list[Path],
+    faults: FaultConfig,
+    concurrency: int,
+    max_retries: int,
+    retry_delay: float,
+    quiet: bool,
+) -> DownloadBenchResult:
+    """Serve the generated directory and download every file once."""
+    with FecBulkServer(generated_dir, faults=faults) as server, TemporaryDirectory() as tmpdir:
+        urls = []
+        for i, path in enumerate(files):
+            cycle = int(path.parent.name)
+            prefix = path.stem[:-2]
+            urls.append((get_fec_zip_url(server.base_url, prefix, cycle), Path(tmpdir) / f"{i}_{path.name}"))
+
+        with Progress(console=console, disable=quiet) as progress:
+            started = time.perf_counter()
+            check_seconds, results = asyncio.run(
+                _download_all(urls, concurrency, max_retries, retry_delay, progress)
+            )
+            seconds = time.perf_counter() - started - check_seconds
+
+        downloaded = sum(
+            dest.stat().st_size for (_, dest), ok in zip(urls, results) if ok and dest.exists()
+        )
+        stats = server.stats.snapshot()
+
+    return DownloadBenchResult(
+        label=label,
+        files=len(files),
+        failed=results.count(False),
+        bytes=downloaded,
+        seconds=seconds,
+        check_seconds=check_seconds,
+        requests=stats["requests"],
+        wasted_bytes=max(stats["bytes_sent"] - downloaded, 0),
+        disconnects=stats["disconnects"],
+        throttled=stats["status_counts"].get(429, 0) + stats["status_counts"].get(503, 0),
+    )
+
+
+def run_download_benchmark(
+    generated_dir: Path,
+    faults: FaultConfig,
+    concurrency: int = 1,
+    max_retries: int = 5,
+    retry_delay: float = 0.1,
+    quiet: bool = True,
+) -> list[DownloadBenchResult]:
+    """Download every generated ZIP through the local server.
+
+    If any faults that trigger retries are configured, a fault-free pass
+    (same bandwidth and latency) runs first so the retry overhead can be
+    measured against it.
+
+    Args:
+        generated_dir: Directory written by `bench generate`
+        faults: Faults to inject
+        concurrency: Simultaneous downloads
+        max_retries: Attempts per file (passed to download_with_retry)
+        retry_delay: Base retry delay in seconds (passed to download_with_retry)
+        quiet: If True, hide download progress bars
+
+    Returns:
+        Results of the baseline pass (if run) and the faulted pass
+    """
+    manifest = GenerationManifest.load(generated_dir)
+    files = sorted({generated_dir / f.zip_path for f in manifest.files})
+
+    passes = []
+    if faults.rate_429 or faults.rate_503 or faults.disconnect_rate:
+        clean = replace(faults, rate_429=0.0, rate_503=0.0, disconnect_rate=0.0)
+        passes.append(("fault-free", clean))
+    passes.append(("faulted" if passes else "download", faults))
+
+    results = []
+    for label, pass_faults in passes:
+        console.print(f"Running {label} pass ({len(files)} files)...")
+        results.append(_run_pass(
+            label, generated_dir, files, pass_faults, concurrency, max_retries, retry_delay, quiet
+        ))
+    return results
+
+
+def print_download_results(results: list[DownloadBenchResult]) -> None:
+    """Print download passes, with overhead relative to the first pass."""
+    baseline = results[0] if len(results) > 1 else None
+
+    table = Table(title="Download throughput")
+    table.add_column("Pass")
+    table.add_column("Files", justify="right")
+    table.add_column("MB", justify="right")
+    table.add_column("Sec", justify="right")
+    table.add_column("MB/s", justify="right")
+    table.add_column("HEAD s", justify="right")
+    table.add_column("Retries", justify="right")
+    table.add_column("429/503", justify="right")
+    table.add_column("Drops", justify="right")
+    table.add_column("Wasted", justify="right")
+    table.add_column("Overhead", justify="right")
+
+    for result in results:
+        overhead = "-"
+        if baseline is not None and result is not baseline and baseline.seconds > 0:
+            overhead = f"{(result.seconds - baseline.seconds) / baseline.seconds:+.0%}"
+
+        files = f"{result.files - result.failed}/{result.files}"
+        if result.failed:
+            files = f"[red]{files}[/red]"
+
+        table.add_row(
+            result.label,
+            files,
+            f"{result.bytes / (1024 * 1024):,.1f}",
+            f"{result.seconds:.2f}",
+            f"{result.mb_per_sec:,.1f}",
+            f"{result.check_seconds:.2f}",
+            f"{result.retries:,}",
+            f"{result.throttled:,}",
+            f"{result.disconnects:,}",
+            f"{result.wasted_bytes / (1024 * 1024):,.1f}",
+            overhead,
+        )
+
+    console.print(table)
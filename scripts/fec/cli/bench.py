@@ -0,0 +1,309 @@
+"""Benchmark CLI commands."""
+
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from ..config import Config, get_cycles_to_check
+from .individual import HEADER_FILE
+
+console = Console()
+
+# Default paths
+SCRIPT_DIR = Path(__file__).parent.parent.parent
+BENCH_DIR = SCRIPT_DIR.parent / "bench_data"
+
+
+@click.group()
+def bench() -> None:
+    """Benchmark commands.
+
+    Generate synthetic FEC bulk data and time the processors on it.
+    """
+    pass
+
+
+@bench.command()
+@click.option(
+    "--out",
+    type=click.Path(path_type=Path),
+    default=BENCH_DIR,
+    show_default=True,
+    help="Output directory (laid out like the FEC bulk-download site)",
+)
+@click.option(
+    "--cycle",
+    type=int,
+    multiple=True,
+    help="Cycle(s) to generate. Default: current + 2 prior",
+)
+@click.option(
+    "--scale",
+    type=int,
+    default=100_000,
+    show_default=True,
+    help="Individual contribution rows per cycle (other files scale from it)",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Random seed",
+)
+@click.pass_context
+def generate(ctx: click.Context, out: Path, cycle: tuple[int, ...], scale: int, seed: int) -> None:
+    """Generate synthetic FEC bulk-data ZIPs.
+
+    Column lists come from datasets.yaml and the individual contributions
+    header file.
+
+    Examples:
+
+        python -m fec bench generate --scale 1000000
+
+        python -m fec bench generate --cycle 2024 --cycle 2026 --out /tmp/fec-bench
+    """
+    from ..bench.generate import generate_bulk_data
+
+    config: Config | None = ctx.obj.get("config")
+    if config is None:
+        console.print("[red]Error: Configuration not loaded. Check --config and --data-dir paths.[/red]")
+        raise SystemExit(1)
+
+    cycles = sorted(cycle) if cycle else get_cycles_to_check()
+
+    console.print("[bold]Generating synthetic FEC bulk data[/bold]")
+    console.print(f"Output: {out}, scale: {scale:,}, cycles: {', '.join(map(str, cycles))}\n")
+
+    manifest = generate_bulk_data(
+        config, out, cycles, scale=scale, seed=seed, header_file=HEADER_FILE
+    )
+
+    total = sum(f.rows for f in manifest.files)
+    console.print(f"\n[green]Done![/green] {len(manifest.files)} files, {total:,} rows")
+
+
+@bench.command()
+@click.option(
+    "--data",
+    type=click.Path(exists=True, path_type=Path),
+    default=BENCH_DIR,
+    show_default=True,
+    help="Directory written by `bench generate`",
+)
+@click.option(
+    "--run-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Scratch directory for outputs (recreated). Default: <data>/run",
+)
+@click.option(
+    "--only",
+    multiple=True,
+    help="Record only these benchmarks (prerequisites still run)",
+)
+@click.option(
+    "--results",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="JSON results file to append to. Default: <data>/bench_results.json",
+)
+@click.option(
+    "--sidecar",
+    is_flag=True,
+    help="Benchmark add-year in sidecar mode",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    help="Show processor output",
+)
+@click.pass_context
+def run(
+    ctx: click.Context,
+    data: Path,
+    run_dir: Path | None,
+    only: tuple[str, ...],
+    results: Path | None,
+    sidecar: bool,
+    verbose: bool,
+) -> None:
+    """Time the processors on generated data.
+
+    Benchmarks: process_zip, combine, summarize, add_year,
+    individual_summarize. Each runs in its own process; rows/s and peak
+    RSS are appended to the results file and compared with the previous
+    run at the same scale.
+    """
+    from ..bench.run import BenchContext, run_benchmarks
+
+    bench_ctx = BenchContext(
+        generated_dir=data,
+        run_dir=run_dir or data / "run",
+        config_path=ctx.obj["config_path"],
+        sidecar=sidecar,
+    )
+
+    try:
+        bench_run = run_benchmarks(
+            bench_ctx, only=list(only) or None, results_file=results, quiet=not verbose
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+    if any(result.error for result in bench_run.results):
+        raise SystemExit(1)
+
+
+def fault_options(func):
+    """Fault-injection options shared by `serve` and `download`."""
+    options = [
+        click.option("--latency-ms", type=float, default=0.0, show_default=True,
+                     help="Delay before every response"),
+        click.option("--bandwidth", type=float, default=None,
+                     help="Per-connection bandwidth limit in MB/s"),
+        click.option("--rate-429", type=float, default=0.0, show_default=True,
+                     help="Fraction of requests answered 429 Too Many Requests"),
+        click.option("--rate-503", type=float, default=0.0, show_default=True,
+                     help="Fraction of requests answered 503 Service Unavailable"),
+        click.option("--disconnect-rate", type=float, default=0.0, show_default=True,
+                     help="Fraction of downloads cut off mid-stream"),
+        click.option("--fault-seed", type=int, default=None,
+                     help="Random seed for fault injection"),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+def _fault_config(
+    latency_ms: float,
+    bandwidth: float | None,
+    rate_429: float,
+    rate_503: float,
+    disconnect_rate: float,
+    fault_seed: int | None,
+):
+    from ..bench.server import FaultConfig
+
+    return FaultConfig(
+        latency_ms=latency_ms,
+        bandwidth_mbps=bandwidth,
+        rate_429=rate_429,
+        rate_503=rate_503,
+        disconnect_rate=disconnect_rate,
+        seed=fault_seed,
+    )
+
+
+@bench.command()
+@click.option(
+    "--data",
+    type=click.Path(exists=True, path_type=Path),
+    default=BENCH_DIR,
+    show_default=True,
+    help="Directory to serve (laid out like the FEC bulk-download site)",
+)
+@click.option("--host", default="127.0.0.1", show_default=True, help="Address to bind")
+@click.option("--port", type=int, default=8800, show_default=True, help="Port to bind")
+@fault_options
+@click.option("--verbose", is_flag=True, help="Log every request")
+def serve(data: Path, host: str, port: int, verbose: bool, **faults) -> None:
+    """Serve generated data as a local FEC bulk-download server.
+
+    Supports ETag, Last-Modified, Range and conditional (304) requests.
+    Point fec_base_url in datasets.yaml at the printed URL to run
+    `fec update` against it.
+
+    Examples:
+
+        python -m fec bench serve
+
+        python -m fec bench serve --bandwidth 5 --rate-503 0.1 --disconnect-rate 0.05
+    """
+    from ..bench.server import FecBulkServer
+
+    server = FecBulkServer(data, host=host, port=port, faults=_fault_config(**faults), verbose=verbose)
+    console.print(f"[bold]Serving {data}[/bold]")
+    console.print(f"fec_base_url: {server.base_url}")
+    console.print("[dim]Press Ctrl+C to stop[/dim]")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    stats = server.stats.snapshot()
+    console.print(f"\n{stats['requests']:,} requests, {stats['bytes_sent'] / (1024 * 1024):,.1f} MB sent")
+
+
+@bench.command()
+@click.option(
+    "--data",
+    type=click.Path(exists=True, path_type=Path),
+    default=BENCH_DIR,
+    show_default=True,
+    help="Directory written by `bench generate`",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Simultaneous downloads",
+)
+@click.option(
+    "--max-retries",
+    type=int,
+    default=5,
+    show_default=True,
+    help="Download attempts per file",
+)
+@click.option(
+    "--retry-delay",
+    type=float,
+    default=0.1,
+    show_default=True,
+    help="Base delay between retries in seconds",
+)
+@fault_options
+@click.option("--verbose", is_flag=True, help="Show download progress bars")
+def download(
+    data: Path,
+    concurrency: int,
+    max_retries: int,
+    retry_delay: float,
+    verbose: bool,
+    **faults,
+) -> None:
+    """Measure download throughput and retry overhead.
+
+    Serves the generated data locally and fetches every ZIP with the same
+    HEAD check and download-with-retry code `fec update` uses. With
+    429/503/disconnect faults, a fault-free pass runs first for comparison.
+
+    Examples:
+
+        python -m fec bench download --bandwidth 20
+
+        python -m fec bench download --rate-429 0.2 --disconnect-rate 0.1 --fault-seed 1
+    """
+    from ..bench.throughput import print_download_results, run_download_benchmark
+
+    results = run_download_benchmark(
+        data,
+        _fault_config(**faults),
+        concurrency=concurrency,
+        max_retries=max_retries,
+        retry_delay=retry_delay,
+        quiet=not verbose,
+    )
+    print_download_results(results)
+
+    if any(result.failed for result in results):
+        raise SystemExit(1)
@@ -1,13 +1,20 @@
 """Name capitalization CLI commands."""
 
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 
 import click
 import polars as pl
 from rich.console import Console
 
+from ..utils.fingerprint import fingerprint_file
 from ..utils.names import capitalize_name
-from ..utils.io import atomic_write_csv, read_fec_csv
+from ..utils.io import atomic_write_csv, read_fec_csv, stream_rewrite_csv
+from ..utils.transforms import map_distinct
 
 console = Console()
 
@@ -25,6 +32,16 @@ DATA_FILE_NAME_COLUMNS = {
 # Individual contribution columns to capitalize
 INDIVIDUAL_NAME_COLUMNS = ["name", "employer", "occupation"]
 
+# Checkpoint of completed individual files, kept in the individual directory
+MIGRATE_CHECKPOINT_FILE = ".capitalize_migrate_checkpoint.json"
+
+# Parsed strings, the distinct-value mapping, and the CSV writer buffer each
+# hold a copy of a streaming batch, so budget several times the raw row size
+CHUNK_MEMORY_FACTOR = 8
+
+MIN_CHUNK_ROWS = 1_000
+MAX_CHUNK_ROWS = 1_000_000
+
 
 @click.group()
 def capitalize() -> None:
@@ -60,6 +77,30 @@ def capitalize() -> None:
     default=None,
     help="Path to individual contributions directory",
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=min(4, os.cpu_count() or 1),
+    show_default=True,
+    help="Individual contribution files to migrate in parallel",
+)
+@click.option(
+    "--memory-budget",
+    type=int,
+    default=4096,
+    show_default=True,
+    help="Total memory budget in MB shared by all workers",
+)
+@click.option(
+    "--keep-backup",
+    is_flag=True,
+    help="Keep a .csv.bak copy of each individual contribution file",
+)
+@click.option(
+    "--restart",
+    is_flag=True,
+    help="Ignore the checkpoint and migrate every individual file again",
+)
 @click.pass_context
 def migrate(
     ctx: click.Context,
@@ -68,6 +109,10 @@ def migrate(
     dry_run: bool,
     data_dir: Path | None,
     individual_dir: Path | None,
+    workers: int,
+    memory_budget: int,
+    keep_backup: bool,
+    restart: bool,
 ) -> None:
     """Convert ALL-CAPS names to Capital Case in existing data files.
 
@@ -87,6 +132,13 @@ def migrate(
 
         # Also migrate individual contributions (large files)
         python -m fec capitalize migrate --include-individual
+
+        # Individual files on a small box: 2 workers sharing 2 GB
+        python -m fec capitalize migrate --include-individual --workers 2 --memory-budget 2048
+
+    Individual contribution files are streamed in bounded batches rather than
+    loaded whole. Completed files are checkpointed, so an interrupted run
+    resumes with the files that are not yet done.
     """
     if dry_run:
         console.print("[yellow]DRY RUN - no files will be modified[/yellow]\n")
@@ -119,9 +171,13 @@ def migrate(
             ind_files = sorted(ind_path.glob("*_individual_contributions.csv"))
             if not ind_files:
                 console.print("[yellow]No individual contribution files found[/yellow]")
-            else:
+            elif dry_run:
                 for filepath in ind_files:
-                    _process_file(filepath, INDIVIDUAL_NAME_COLUMNS, dry_run)
+                    _preview_file(filepath, INDIVIDUAL_NAME_COLUMNS)
+            else:
+                _migrate_individual_files(
+                    ind_path, ind_files, workers, memory_budget * 1024 * 1024, keep_backup, restart
+                )
 
     console.print("\n[green]Done![/green]")
 
@@ -131,7 +187,7 @@ def _process_file(filepath: Path, name_cols: list[str], dry_run: bool) -> None:
     console.print(f"[bold]{filepath.name}[/bold]")
     console.print(f"  Columns: {', '.join(name_cols)}")
 
-    df = read_fec_csv(filepath)
+    df = read_fec_csv(filepath, with_sidecar=False)
     original_count = len(df)
 
     for col in name_cols:
@@ -142,11 +198,7 @@ def _process_file(filepath: Path, name_cols: list[str], dry_run: bool) -> None:
         # Sample before/after
         sample_before = df[col].drop_nulls().head(3).to_list()
 
-        df = df.with_columns(
-            pl.col(col)
-            .map_elements(capitalize_name, return_dtype=pl.Utf8)
-            .alias(col)
-        )
+        df = df.with_columns(map_distinct(pl.col(col), capitalize_name, pl.Utf8).alias(col))
 
         sample_after = df[col].drop_nulls().head(3).to_list()
 
@@ -162,6 +214,144 @@ def _process_file(filepath: Path, name_cols: list[str], dry_run: bool) -> None:
         console.print(f"  [green]Wrote {original_count:,} rows[/green]")
 
 
+def _preview_file(filepath: Path, name_cols: list[str]) -> None:
+    """Show sample changes for a file using only its first rows."""
+    console.print(f"[bold]{filepath.name}[/bold]")
+    console.print(f"  Columns: {', '.join(name_cols)}")
+
+    head = read_fec_csv(filepath, lazy=True, with_sidecar=False).head(1000).collect()
+    for col in name_cols:
+        if col not in head.columns:
+            console.print(f"  [yellow]Column '{col}' not found, skipping[/yellow]")
+            continue
+        for before in head[col].drop_nulls().head(3).to_list():
+            after = capitalize_name(before)
+            if before != after:
+                console.print(f"    {before} -> {after}")
+
+
+def _estimate_chunk_rows(filepath: Path, budget_bytes: int) -> int:
+    """Estimate how many rows per streaming batch fit in a memory budget."""
+    with open(filepath, "rb") as f:
+        sample = f.read(1024 * 1024)
+    bytes_per_row = len(sample) / max(sample.count(b"\n"), 1)
+
+    rows = int(budget_bytes / (bytes_per_row * CHUNK_MEMORY_FACTOR))
+    return max(MIN_CHUNK_ROWS, min(rows, MAX_CHUNK_ROWS))
+
+
+def _load_checkpoint(checkpoint_file: Path) -> dict[str, dict]:
+    """Load completed-file fingerprints from the migration checkpoint."""
+    if not checkpoint_file.exists():
+        return {}
+    try:
+        with open(checkpoint_file) as f:
+            return json.load(f).get("files", {})
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_checkpoint(checkpoint_file: Path, completed: dict[str, dict]) -> None:
+    """Write the migration checkpoint atomically."""
+    temp_file = checkpoint_file.with_suffix(".json.tmp")
+    with open(temp_file, "w") as f:
+        json.dump({"files": completed}, f, indent=2)
+    temp_file.rename(checkpoint_file)
+
+
+def _migrate_individual_file(
+    filepath: Path, name_cols: list[str], chunk_rows: int, backup: bool
+) -> int:
+    """Stream one individual contribution file through capitalization.
+
+    Runs in a worker process, so it must stay module-level and picklable.
+
+    Returns:
+        Number of rows written
+    """
+    # Left behind by an interrupted run of this file
+    filepath.with_suffix(".csv.tmp").unlink(missing_ok=True)
+
+    def transform(lf: pl.LazyFrame) -> pl.LazyFrame:
+        present = [col for col in name_cols if col in lf.collect_schema().names()]
+        return lf.with_columns(
+            map_distinct(pl.col(col), capitalize_name, pl.Utf8).alias(col) for col in present
+        )
+
+    return stream_rewrite_csv(filepath, transform, backup=backup, chunk_rows=chunk_rows)
+
+
+def _migrate_individual_files(
+    ind_path: Path,
+    ind_files: list[Path],
+    workers: int,
+    budget_bytes: int,
+    backup: bool,
+    restart: bool,
+) -> None:
+    """Migrate individual contribution files in parallel with checkpointing.
+
+    The memory budget is split evenly across workers and converted to a
+    streaming batch size per file. A file is recorded in the checkpoint with
+    its post-migration fingerprint, so it is skipped on resume unless it has
+    changed since (e.g. was re-downloaded in ALL-CAPS).
+    """
+    checkpoint_file = ind_path / MIGRATE_CHECKPOINT_FILE
+    completed = {} if restart else _load_checkpoint(checkpoint_file)
+
+    pending = []
+    for filepath in ind_files:
+        entry = completed.get(filepath.name)
+        fingerprint = fingerprint_file(filepath)
+        if entry and fingerprint and entry["fingerprint"] == fingerprint.to_dict():
+            console.print(f"[dim]{filepath.name}: already migrated[/dim]")
+        else:
+            pending.append(filepath)
+
+    if not pending:
+        return
+
+    workers = max(1, min(workers, len(pending)))
+    per_worker_budget = budget_bytes // workers
+    console.print(
+        f"Migrating {len(pending)} file(s) with {workers} worker(s), "
+        f"{per_worker_budget / 1024 / 1024:,.0f} MB each"
+    )
+
+    failed = 0
+    # Spawn (not fork) so each worker starts with a fresh Polars thread pool
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {}
+        for filepath in pending:
+            chunk_rows = _estimate_chunk_rows(filepath, per_worker_budget)
+            future = pool.submit(
+                _migrate_individual_file, filepath, INDIVIDUAL_NAME_COLUMNS, chunk_rows, backup
+            )
+            futures[future] = filepath
+
+        for future in as_completed(futures):
+            filepath = futures[future]
+            try:
+                rows = future.result()
+            except Exception as e:
+                failed += 1
+                console.print(f"  [red]{filepath.name}: failed: {e}[/red]")
+                continue
+
+            fingerprint = fingerprint_file(filepath)
+            completed[filepath.name] = {
+                "fingerprint": fingerprint.to_dict() if fingerprint else None,
+                "completed_at": datetime.now().isoformat(),
+            }
+            _save_checkpoint(checkpoint_file, completed)
+            console.print(f"  [green]{filepath.name}: wrote {rows:,} rows[/green]")
+
+    if failed:
+        console.print(f"[red]{failed} file(s) failed; re-run to resume[/red]")
+        raise SystemExit(1)
+
+
 @capitalize.command()
 @click.argument("name")
 def test(name: str) -> None:
@@ -8,6 +8,7 @@ from rich.console import Console
 
 from ..utils.dates import convert_to_iso_date
 from ..utils.io import atomic_write_csv, read_fec_csv
+from ..utils.transforms import map_distinct
 
 console = Console()
 
@@ -97,7 +98,7 @@ def _process_file(filepath: Path, date_cols: list[str], dry_run: bool) -> None:
     console.print(f"[bold]{filepath.name}[/bold]")
     console.print(f"  Columns: {', '.join(date_cols)}")
 
-    df = read_fec_csv(filepath)
+    df = read_fec_csv(filepath, with_sidecar=False)
     original_count = len(df)
 
     for col in date_cols:
@@ -108,11 +109,7 @@ def _process_file(filepath: Path, date_cols: list[str], dry_run: bool) -> None:
         # Sample before/after
         sample_before = df[col].drop_nulls().head(3).to_list()
 
-        df = df.with_columns(
-            pl.col(col)
-            .map_elements(convert_to_iso_date, return_dtype=pl.Utf8)
-            .alias(col)
-        )
+        df = df.with_columns(map_distinct(pl.col(col), convert_to_iso_date, pl.Utf8).alias(col))
 
         sample_after = df[col].drop_nulls().head(3).to_list()
 
@@ -36,8 +36,13 @@ def individual() -> None:
     is_flag=True,
     help="Show what would be downloaded without downloading",
 )
+@click.option(
+    "--quarantine",
+    is_flag=True,
+    help="Write malformed input lines to per-cycle files in .fec_quarantine/",
+)
 @click.pass_context
-def download(ctx: click.Context, cycle: int | None, dry_run: bool) -> None:
+def download(ctx: click.Context, cycle: int | None, dry_run: bool, quarantine: bool) -> None:
     """Download FEC individual contributions data (1980-2026).
 
     Downloads ZIP files from FEC, extracts pipe-delimited data, and
@@ -55,7 +60,7 @@ def download(ctx: click.Context, cycle: int | None, dry_run: bool) -> None:
         console.print(f"[red]Error: Output directory not found: {INDIVIDUAL_DIR}[/red]")
         raise SystemExit(1)
 
-    downloader = IndividualDownloader(INDIVIDUAL_DIR, HEADER_FILE)
+    downloader = IndividualDownloader(INDIVIDUAL_DIR, HEADER_FILE, quarantine=quarantine)
 
     cycles = [cycle] if cycle else None
     successful, skipped, failed = downloader.download_all(dry_run=dry_run, cycles=cycles)
@@ -92,11 +97,27 @@ def download(ctx: click.Context, cycle: int | None, dry_run: bool) -> None:
     default=INDIVIDUAL_DIR,
     help="Directory containing individual contribution files",
 )
+@click.option(
+    "--sidecar",
+    is_flag=True,
+    help="Write derived date columns to a per-cycle sidecar instead of rewriting the CSV",
+)
 @click.pass_context
-def add_year(ctx: click.Context, cycle: int | None, dry_run: bool, force: bool, input_dir: Path) -> None:
+def add_year(
+    ctx: click.Context,
+    cycle: int | None,
+    dry_run: bool,
+    force: bool,
+    input_dir: Path,
+    sidecar: bool,
+) -> None:
     """Add transaction_year column to individual contribution files.
 
     Extracts the year from transaction_dt and inserts it as the second column.
+
+    With --sidecar, transaction_year, transaction_month, and transaction_date
+    (ISO 8601) are written to {cycle}_individual_contributions.derived.parquet
+    instead, and readers zip them onto the CSV transparently.
     """
     from ..processors.individual import TransactionYearAdder
 
@@ -106,7 +127,7 @@ def add_year(ctx: click.Context, cycle: int | None, dry_run: bool, force: bool,
     console.print("[bold]Add Transaction Year Column[/bold]")
     console.print(f"Input directory: {input_dir}\n")
 
-    adder = TransactionYearAdder(input_dir)
+    adder = TransactionYearAdder(input_dir, sidecar=sidecar)
     total_rows = adder.process_all(cycle=cycle, dry_run=dry_run, force=force)
 
     console.print(f"\n[green]Done![/green] Processed {total_rows:,} total rows")
@@ -129,8 +150,27 @@ def add_year(ctx: click.Context, cycle: int | None, dry_run: bool, force: bool,
     default=OUTPUT_FILE,
     help="Output file path",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Rebuild the committee and bioguide lookups instead of using the cache",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Process up to this many cycles in parallel (capped by available memory)",
+)
 @click.pass_context
-def summarize(ctx: click.Context, cycle: int | None, dry_run: bool, output: Path) -> None:
+def summarize(
+    ctx: click.Context,
+    cycle: int | None,
+    dry_run: bool,
+    output: Path,
+    no_cache: bool,
+    workers: int,
+) -> None:
     """Aggregate individual contributions by candidate.
 
     Creates a summary file with total contributions and counts per candidate,
@@ -144,5 +184,7 @@ def summarize(ctx: click.Context, cycle: int | None, dry_run: bool, output: Path
     console.print("[bold]Individual Contributions Summary[/bold]")
     console.print(f"Output file: {output}\n")
 
-    summarizer = IndividualSummarizer(DATA_DIR, INDIVIDUAL_DIR, output)
+    summarizer = IndividualSummarizer(
+        DATA_DIR, INDIVIDUAL_DIR, output, use_cache=not no_cache, workers=workers
+    )
     summarizer.summarize_all(cycle=cycle, dry_run=dry_run)
@@ -13,6 +13,7 @@ console = Console()
 SCRIPT_DIR = Path(__file__).parent.parent.parent
 CONFIG_PATH = SCRIPT_DIR / "fec" / "config" / "datasets.yaml"
 DATA_DIR = SCRIPT_DIR.parent / "data"
+PROFILE_DIR = SCRIPT_DIR.parent / "profiles"
 
 
 @click.group()
@@ -28,18 +29,63 @@ DATA_DIR = SCRIPT_DIR.parent / "data"
     default=None,
     help="Path to data directory",
 )
+@click.option(
+    "--report",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write per-stage timings, rows, bytes and memory to this JSON file",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the command (pstats, collapsed stacks, Polars query plans)",
+)
+@click.option(
+    "--profile-mode",
+    type=click.Choice(["deterministic", "sampling"]),
+    default="deterministic",
+    show_default=True,
+    help="cProfile plus stack sampling, or stack sampling only (lower overhead)",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=PROFILE_DIR,
+    show_default=True,
+    help="Directory for profile output",
+)
 @click.pass_context
-def cli(ctx: click.Context, config: Path | None, data_dir: Path | None) -> None:
+def cli(
+    ctx: click.Context,
+    config: Path | None,
+    data_dir: Path | None,
+    report: Path | None,
+    profile: bool,
+    profile_mode: str,
+    profile_dir: Path,
+) -> None:
     """FEC Data Tools.
 
     Download, process, and manage FEC campaign finance data.
     """
     ctx.ensure_object(dict)
 
+    if profile:
+        from ..utils.profiling import Profiler
+
+        profiler = Profiler(profile_dir, ctx.invoked_subcommand or "fec", mode=profile_mode)
+        ctx.call_on_close(profiler.stop)
+        profiler.start()
+
+    if report is not None:
+        ctx.call_on_close(lambda: _write_report(report))
+
     # Use defaults if not provided
     config_path = config or CONFIG_PATH
     data_path = data_dir or DATA_DIR
 
+    ctx.obj["config_path"] = config_path
+
     # Only load config if it exists (some commands may not need it)
     if config_path.exists() and data_path.exists():
         ctx.obj["config"] = Config.load(config_path, data_path)
@@ -49,6 +95,14 @@ def cli(ctx: click.Context, config: Path | None, data_dir: Path | None) -> None:
         ctx.obj["state"] = None
 
 
+def _write_report(path: Path) -> None:
+    """Write the run report collected by the instrumented stages."""
+    from ..utils.instrument import get_report
+
+    get_report().write(path)
+    console.print(f"[dim]Run report written to {path}[/dim]")
+
+
 # Import and register command groups
 from .update import update
 from .verify import verify
@@ -56,7 +110,10 @@ from .individual import individual
 from .bioguide import bioguide
 from .capitalize import capitalize
 from .dates import dates
+from .migrate import migrate
 from .congress_api import congress
+from .pipeline import pipeline
+from .bench import bench
 
 cli.add_command(update)
 cli.add_command(verify)
@@ -64,7 +121,10 @@ cli.add_command(individual)
 cli.add_command(bioguide)
 cli.add_command(capitalize)
 cli.add_command(dates)
+cli.add_command(migrate)
 cli.add_command(congress)
+cli.add_command(pipeline)
+cli.add_command(bench)
 
 
 def main() -> None:
@@ -0,0 +1,132 @@
+"""Fused migration command for existing data files."""
+
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from .capitalize import DATA_FILE_NAME_COLUMNS, INDIVIDUAL_NAME_COLUMNS
+from .dates import DATA_FILE_DATE_COLUMNS
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--file",
+    type=str,
+    help="Process only this specific file (filename only, not path)",
+)
+@click.option(
+    "--include-individual",
+    is_flag=True,
+    help="Also process individual contributions files (large, may take a long time)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show what would be done without making changes",
+)
+@click.option(
+    "--data-dir",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Path to data directory",
+)
+@click.option(
+    "--individual-dir",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Path to individual contributions directory",
+)
+@click.option(
+    "--keep-backup",
+    is_flag=True,
+    help="Keep a .csv.bak copy of each individual contribution file",
+)
+@click.pass_context
+def migrate(
+    ctx: click.Context,
+    file: str | None,
+    include_individual: bool,
+    dry_run: bool,
+    data_dir: Path | None,
+    individual_dir: Path | None,
+    keep_backup: bool,
+) -> None:
+    """Apply all pending data migrations with one read and write per file.
+
+    Combines `capitalize migrate`, `dates migrate`, and (with
+    --include-individual) `individual add-year`. Name and date columns come
+    from the capitalize and dates registries and from datasets.yaml. The
+    name and date columns of each file are probed first, so transforms that
+    were already applied are skipped and the command is safe to re-run.
+
+    Examples:
+
+        # Preview pending transforms
+        python -m fec migrate --dry-run
+
+        # Migrate main data files
+        python -m fec migrate
+
+        # Also migrate individual contributions (large files)
+        python -m fec migrate --include-individual
+    """
+    from ..migrate import apply_migration, collect_migrations, plan_migration
+
+    if dry_run:
+        console.print("[yellow]DRY RUN - no files will be modified[/yellow]\n")
+
+    # Determine data directory
+    config = ctx.obj.get("config") if ctx.obj else None
+    data_path = data_dir or (config.data_dir if config else Path("data"))
+
+    ind_path = None
+    if include_individual:
+        ind_path = individual_dir or data_path.parent / "individual_contributions"
+        if not ind_path.exists():
+            console.print(f"[yellow]Individual contributions directory not found: {ind_path}[/yellow]")
+            ind_path = None
+
+    migrations = collect_migrations(
+        data_path,
+        config,
+        DATA_FILE_NAME_COLUMNS,
+        DATA_FILE_DATE_COLUMNS,
+        individual_dir=ind_path,
+        individual_name_columns=INDIVIDUAL_NAME_COLUMNS,
+    )
+    if file:
+        migrations = [m for m in migrations if m.path.name == file]
+        if not migrations:
+            console.print(f"[yellow]No migrations for {file}[/yellow]")
+            return
+
+    for migration in migrations:
+        if migration.path.parent == ind_path:
+            migration.backup = keep_backup
+
+    console.print("[bold]Migrating data files...[/bold]\n")
+
+    migrated = 0
+    for migration in migrations:
+        plan = plan_migration(migration)
+        if not plan.is_pending:
+            console.print(f"[dim]{migration.path.name}: up to date[/dim]")
+            continue
+
+        console.print(f"[bold]{migration.path.name}[/bold]")
+        console.print(f"  {plan.describe()}")
+        for before, after in plan.samples:
+            console.print(f"    {before} -> {after}")
+
+        if dry_run:
+            continue
+
+        rows = apply_migration(plan)
+        migrated += 1
+        console.print(f"  [green]Wrote {rows:,} rows[/green]")
+
+    if not dry_run:
+        console.print(f"\n[green]Done! Migrated {migrated} file(s)[/green]")
@@ -0,0 +1,134 @@
+"""Pipeline command for running the full workflow as a dependency graph."""
+
+import os
+import time
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from ..config import Config, get_cycles_to_check
+from .bioguide import OUTPUT_FILE as CROSSWALK_FILE
+from .individual import INDIVIDUAL_DIR, OUTPUT_FILE as INDIVIDUAL_OUTPUT_FILE
+
+console = Console()
+
+
+@click.group()
+@click.pass_context
+def pipeline(ctx: click.Context) -> None:
+    """Run the full workflow as a dependency graph.
+
+    Runs dataset updates, the bioguide crosswalk, and the individual
+    contribution processors in dependency order, in parallel where possible,
+    rebuilding only stages whose inputs changed since the last run.
+    """
+    if ctx.obj.get("config") is None:
+        console.print("[red]Error: Configuration not loaded. Check --config and --data-dir paths.[/red]")
+        raise SystemExit(1)
+
+
+@pipeline.command()
+@click.option(
+    "--cycle",
+    type=int,
+    multiple=True,
+    help="Specific cycle(s) for update stages. Default: current + 2 prior",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=min(4, os.cpu_count() or 1),
+    show_default=True,
+    help="Maximum number of stages to run in parallel",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Rebuild every stage even if its inputs are unchanged",
+)
+@click.option(
+    "--skip-update",
+    is_flag=True,
+    help="Skip the FEC download/update stages (local stages only)",
+)
+@click.option(
+    "--individual-dir",
+    type=click.Path(exists=True, path_type=Path),
+    default=INDIVIDUAL_DIR,
+    help="Directory containing individual contribution files",
+)
+@click.option(
+    "--sidecar",
+    is_flag=True,
+    help="Write add-year derived columns to sidecars instead of rewriting CSVs",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show the stage graph and what is stale without running anything",
+)
+@click.pass_context
+def run(
+    ctx: click.Context,
+    cycle: tuple[int, ...],
+    jobs: int,
+    force: bool,
+    skip_update: bool,
+    individual_dir: Path,
+    sidecar: bool,
+    dry_run: bool,
+) -> None:
+    """Run all pipeline stages whose inputs changed.
+
+    Stages: update:<dataset> for each dataset in datasets.yaml, bioguide,
+    individual:add-year:<cycle> for each individual contribution file, and
+    individual:summarize.
+    """
+    from ..pipeline import (
+        PipelineState,
+        build_stages,
+        get_pipeline_state_file,
+        print_plan,
+        run_pipeline,
+    )
+
+    config: Config = ctx.obj["config"]
+    config_path: Path = ctx.obj["config_path"]
+    cycles = list(cycle) if cycle else get_cycles_to_check()
+
+    stages = build_stages(
+        config,
+        config_path,
+        individual_dir,
+        config.data_dir / INDIVIDUAL_OUTPUT_FILE.name,
+        config.data_dir / CROSSWALK_FILE.name,
+        cycles,
+        include_update=not skip_update,
+        sidecar=sidecar,
+    )
+
+    state_file = get_pipeline_state_file(config)
+    state = PipelineState.load(state_file)
+
+    console.print("[bold]FEC Pipeline[/bold]")
+    console.print(f"Stages: {len(stages)}, jobs: {jobs}\n")
+
+    if dry_run:
+        console.print("[yellow]DRY RUN - no stages will be run[/yellow]\n")
+        print_plan(stages, state)
+        return
+
+    started = time.monotonic()
+    result = run_pipeline(stages, state, state_file, jobs=jobs, force=force)
+    elapsed = time.monotonic() - started
+
+    console.print(f"\n[bold]Summary:[/bold] ({elapsed:.1f}s)")
+    console.print(f"  Ran: {len(result.ran)}")
+    console.print(f"  Up to date: {len(result.skipped)}")
+    console.print(f"  Failed: {len(result.failed)}")
+    console.print(f"  Blocked: {len(result.blocked)}")
+
+    if result.failed or result.blocked:
+        raise SystemExit(1)
@@ -10,6 +10,8 @@ from rich.console import Console
 from ..config import Config, UpdateState, get_cycles_to_check, get_fec_zip_url
 from ..detect import detect_changes, ChangeInfo
 from ..integrate import integrate_changes
+from ..verify import verify_all
+from ..verify_history import check_history, print_anomalies
 
 console = Console()
 
@@ -73,14 +75,20 @@ def check(ctx: click.Context, cycle: tuple[int, ...]) -> None:
     is_flag=True,
     help="Update even if no changes detected",
 )
+@click.option(
+    "--quarantine",
+    is_flag=True,
+    help="Write malformed input lines to per-cycle files in .fec_quarantine/",
+)
 @click.pass_context
-def run(ctx: click.Context, cycle: tuple[int, ...], dry_run: bool, force: bool) -> None:
+def run(ctx: click.Context, cycle: tuple[int, ...], dry_run: bool, force: bool, quarantine: bool) -> None:
     """Run the full update workflow.
 
     1. Check for changes
     2. Download updated files
     3. Process and integrate
     4. Update state
+    5. Flag unusual changes in per-cycle row counts and totals
     """
     config: Config = ctx.obj["config"]
     state: UpdateState = ctx.obj["state"]
@@ -135,7 +143,7 @@ def run(ctx: click.Context, cycle: tuple[int, ...], dry_run: bool, force: bool)
 
     # Step 2 & 3: Download and integrate
     console.print("[bold]Step 2-3: Downloading and integrating...[/bold]")
-    successful, failed = asyncio.run(integrate_changes(changes, config, state, dry_run))
+    successful, failed = asyncio.run(integrate_changes(changes, config, state, dry_run, quarantine))
 
     # Step 4: Save state
     if not dry_run and successful > 0:
@@ -144,6 +152,10 @@ def run(ctx: click.Context, cycle: tuple[int, ...], dry_run: bool, force: bool)
         state.save(config.state_file)
         console.print(f"  State saved to {config.state_file}")
 
+        # Step 5: Compare with verify history (only rewritten files are scanned)
+        console.print("\n[bold]Step 5: Checking for anomalies...[/bold]")
+        print_anomalies(check_history(config, verify_all(config)))
+
     # Summary
     console.print(f"\n[bold]Summary:[/bold]")
     console.print(f"  Successful: {successful}")
@@ -1,10 +1,19 @@
 """Verify command for FEC data validation."""
 
+from pathlib import Path
+
 import click
 from rich.console import Console
 
 from ..config import Config
-from ..verify import print_cycle_summary, print_verification_report, verify_all
+from ..verify import (
+    print_checksum_report,
+    print_cycle_summary,
+    print_verification_report,
+    verify_all,
+    verify_checksums,
+)
+from ..verify_history import check_history, print_anomalies
 
 console = Console()
 
@@ -15,8 +24,71 @@ console = Console()
     is_flag=True,
     help="Show row counts per election cycle",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-validate every file, ignoring cached results",
+)
+@click.option(
+    "--checksums",
+    is_flag=True,
+    help="Check files against their checksum manifests instead of parsing them",
+)
+@click.option(
+    "--integrity",
+    is_flag=True,
+    help="Check committee/candidate IDs against the registration files",
+)
+@click.option(
+    "--individual",
+    is_flag=True,
+    help="Scan individual contribution files for statistics (bounded memory)",
+)
+@click.option(
+    "--individual-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Individual contributions directory (default: <data-dir>/../individual_contributions)",
+)
+@click.option(
+    "--cycle",
+    type=int,
+    multiple=True,
+    help="With --individual, scan only this cycle (repeatable)",
+)
+@click.option(
+    "--sample",
+    type=click.FloatRange(0.0, 1.0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help="With --individual, fraction of each file to sample",
+)
+@click.option(
+    "--time-budget",
+    type=float,
+    default=None,
+    help="With --individual, seconds to spend in total, sampling to fit",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Files verified in parallel (default: one per file, up to the CPU count)",
+)
 @click.pass_context
-def verify(ctx: click.Context, cycle_counts: bool) -> None:
+def verify(
+    ctx: click.Context,
+    cycle_counts: bool,
+    no_cache: bool,
+    checksums: bool,
+    integrity: bool,
+    individual: bool,
+    individual_dir: Path | None,
+    cycle: tuple[int, ...],
+    sample: float,
+    time_budget: float | None,
+    workers: int | None,
+) -> None:
     """Verify data file integrity.
 
     Checks:
@@ -24,6 +96,34 @@ def verify(ctx: click.Context, cycle_counts: bool) -> None:
     - No null election_cycle values
     - Transaction amounts are reasonable
     - Row counts match expectations
+
+    Results are cached per file and reused while the file's fingerprint
+    (size, mtime and content hash) is unchanged. Per-cycle row counts and
+    totals are compared with the history of previous runs, and unusual
+    changes are flagged.
+
+    With --checksums, files in the data and individual contributions
+    directories are instead hashed and compared with the size and hash
+    recorded in their manifest when they were written, which detects
+    corruption and manual edits without parsing anything.
+
+    With --integrity, committee and candidate IDs in the dependent datasets
+    (and the bioguide crosswalk) are checked against the registration files
+    of the same cycle, with orphan counts and sample IDs per cycle.
+
+    With --individual, the individual contribution files are scanned in
+    blocks for row counts, null/invalid transaction_dt rates, duplicate
+    sub_ids, amount percentiles and values lost to ignore_errors. --sample
+    and --time-budget trade exactness for time by scanning a random subset
+    of blocks.
+
+    Examples:
+
+        python -m fec verify --checksums
+
+        python -m fec verify --integrity
+
+        python -m fec verify --individual --time-budget 300
     """
     config: Config = ctx.obj["config"]
 
@@ -31,11 +131,52 @@ def verify(ctx: click.Context, cycle_counts: bool) -> None:
         console.print("[red]Error: Configuration not loaded. Check --config and --data-dir paths.[/red]")
         raise SystemExit(1)
 
-    results = verify_all(config)
+    ind_path = individual_dir or config.data_dir.parent / "individual_contributions"
+
+    if checksums:
+        directories = [config.data_dir] + ([ind_path] if ind_path.exists() else [])
+        checksum_results, untracked = verify_checksums(directories, workers=workers)
+        print_checksum_report(checksum_results, untracked)
+        if any(not r.is_valid for r in checksum_results):
+            raise SystemExit(1)
+        return
+
+    if integrity:
+        from ..verify_integrity import print_integrity_report, verify_integrity
+
+        integrity_results = verify_integrity(config, workers=workers)
+        print_integrity_report(integrity_results)
+        if any(not r.is_valid for r in integrity_results):
+            raise SystemExit(1)
+        return
+
+    if individual:
+        from ..verify_individual import print_individual_report, verify_individual
+
+        if not ind_path.exists():
+            console.print(f"[red]Error: Individual contributions directory not found: {ind_path}[/red]")
+            raise SystemExit(1)
+
+        stats = verify_individual(
+            ind_path,
+            cycles=list(cycle) or None,
+            fraction=sample,
+            time_budget=time_budget,
+            workers=workers,
+        )
+        print_individual_report(stats)
+        if any(not s.is_valid for s in stats):
+            raise SystemExit(1)
+        return
+
+    results = verify_all(config, cycle_counts=cycle_counts, workers=workers, use_cache=not no_cache)
     print_verification_report(results)
 
     if cycle_counts:
-        print_cycle_summary(config)
+        print_cycle_summary(results)
+
+    if any(r.cycle_counts for r in results):
+        print_anomalies(check_history(config, results))
 
     # Exit with error if any validation failed
     if any(not r.is_valid for r in results):
@@ -12,6 +12,7 @@ from .config import (
     get_cycles_to_check,
     get_fec_zip_url,
 )
+from .utils.instrument import span
 
 console = Console()
 
@@ -74,81 +75,95 @@ async def detect_changes(
     config: Config,
     state: UpdateState,
     cycles: list[int] | None = None,
+    datasets: list[str] | None = None,
 ) -> list[ChangeInfo]:
-    """Detect changes across all datasets for specified cycles."""
+    """Detect changes across all datasets for specified cycles.
+
+    If datasets is provided, only those datasets are checked.
+    """
     if cycles is None:
         cycles = get_cycles_to_check()
 
     changes: list[ChangeInfo] = []
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Check combine datasets
-        for name, dataset in config.combine_datasets.items():
-            for cycle in cycles:
-                if cycle < dataset.start_year:
+    with span("detect_changes", cycles=cycles) as s:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            # Check combine datasets
+            for name, dataset in config.combine_datasets.items():
+                if datasets is not None and name not in datasets:
                     continue
 
-                url = get_fec_zip_url(config.fec_base_url, dataset.fec_prefix, cycle)
-                console.print(f"  Checking {name} {cycle}...", end=" ")
-
-                new_state = await check_url(client, url)
-                if new_state is None:
-                    console.print("[yellow]not found[/yellow]")
-                    continue
-
-                old_state = state.get_cycle_state(name, cycle)
-                changed, reason = has_changed(old_state, new_state)
-
-                if changed:
-                    console.print(f"[green]{reason}[/green]")
-                    changes.append(
-                        ChangeInfo(
-                            dataset=name,
-                            cycle=cycle,
-                            url=url,
-                            reason=reason,
-                            new_etag=new_state.etag,
-                            new_last_modified=new_state.last_modified,
-                            new_content_length=new_state.content_length,
+                for cycle in cycles:
+                    if cycle < dataset.start_year:
+                        continue
+
+                    url = get_fec_zip_url(config.fec_base_url, dataset.fec_prefix, cycle)
+                    console.print(f"  Checking {name} {cycle}...", end=" ")
+
+                    new_state = await check_url(client, url)
+                    s.add(rows_in=1)
+                    if new_state is None:
+                        console.print("[yellow]not found[/yellow]")
+                        continue
+
+                    old_state = state.get_cycle_state(name, cycle)
+                    changed, reason = has_changed(old_state, new_state)
+
+                    if changed:
+                        console.print(f"[green]{reason}[/green]")
+                        changes.append(
+                            ChangeInfo(
+                                dataset=name,
+                                cycle=cycle,
+                                url=url,
+                                reason=reason,
+                                new_etag=new_state.etag,
+                                new_last_modified=new_state.last_modified,
+                                new_content_length=new_state.content_length,
+                            )
                         )
-                    )
-                else:
-                    console.print("[dim]unchanged[/dim]")
-
-        # Check summarize datasets (skip expenditures_by_state, same file as by_category)
-        for name, dataset in config.summarize_datasets.items():
-            if name == "expenditures_by_state":
-                continue  # Same file as expenditures_by_category
-
-            for cycle in cycles:
-                if cycle < dataset.start_year:
+                    else:
+                        console.print("[dim]unchanged[/dim]")
+
+            # Check summarize datasets (skip expenditures_by_state, same file as by_category)
+            for name, dataset in config.summarize_datasets.items():
+                if name == "expenditures_by_state":
+                    continue  # Same file as expenditures_by_category
+                if datasets is not None and name not in datasets:
                     continue
 
-                url = get_fec_zip_url(config.fec_base_url, dataset.fec_prefix, cycle)
-                console.print(f"  Checking {name} {cycle}...", end=" ")
-
-                new_state = await check_url(client, url)
-                if new_state is None:
-                    console.print("[yellow]not found[/yellow]")
-                    continue
-
-                old_state = state.get_cycle_state(name, cycle)
-                changed, reason = has_changed(old_state, new_state)
-
-                if changed:
-                    console.print(f"[green]{reason}[/green]")
-                    changes.append(
-                        ChangeInfo(
-                            dataset=name,
-                            cycle=cycle,
-                            url=url,
-                            reason=reason,
-                            new_etag=new_state.etag,
-                            new_last_modified=new_state.last_modified,
-                            new_content_length=new_state.content_length,
+                for cycle in cycles:
+                    if cycle < dataset.start_year:
+                        continue
+
+                    url = get_fec_zip_url(config.fec_base_url, dataset.fec_prefix, cycle)
+                    console.print(f"  Checking {name} {cycle}...", end=" ")
+
+                    new_state = await check_url(client, url)
+                    s.add(rows_in=1)
+                    if new_state is None:
+                        console.print("[yellow]not found[/yellow]")
+                        continue
+
+                    old_state = state.get_cycle_state(name, cycle)
+                    changed, reason = has_changed(old_state, new_state)
+
+                    if changed:
+                        console.print(f"[green]{reason}[/green]")
+                        changes.append(
+                            ChangeInfo(
+                                dataset=name,
+                                cycle=cycle,
+                                url=url,
+                                reason=reason,
+                                new_etag=new_state.etag,
+                                new_last_modified=new_state.last_modified,
+                                new_content_length=new_state.content_length,
+                            )
                         )
-                    )
-                else:
-                    console.print("[dim]unchanged[/dim]")
+                    else:
+                        console.print("[dim]unchanged[/dim]")
+
+        s.add(rows_out=len(changes))
 
     return changes
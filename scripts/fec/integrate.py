@@ -8,7 +8,9 @@ from rich.console import Console
 from .config import Config, UpdateState
 from .detect import ChangeInfo
 from .async_utils.download import download_cycle
+from .probe import probe_file
 from .processors import CombineProcessor, SummarizeProcessor
+from .utils.instrument import span
 
 console = Console()
 
@@ -31,15 +33,27 @@ def find_input_file(work_dir: Path, fec_prefix: str, cycle: int) -> Path | None:
     return None
 
 
+def probe_input(
+    input_file: Path, columns: list[str], key_fields: dict[str, str] | None = None
+) -> bool:
+    """Probe an input file's layout before processing it; print any issues."""
+    result = probe_file(input_file, columns, key_fields)
+    for issue in result.issues:
+        console.print(f"[red]{input_file.name}: {issue}[/red]")
+    return result.is_valid
+
+
 async def process_change(
     change: ChangeInfo,
     config: Config,
     work_dir: Path,
     dry_run: bool = False,
+    quarantine: bool = False,
 ) -> bool:
     """Process a single detected change.
 
-    Downloads the file, processes it, and integrates into existing data.
+    Downloads the file, probes its layout, processes it, and integrates
+    into existing data. A file failing the probe is not processed.
     """
     console.print(f"\n[bold]Processing {change.dataset} cycle {change.cycle}[/bold]")
 
@@ -55,24 +69,31 @@ async def process_change(
     # Determine dataset type and get processor
     if change.dataset in config.combine_datasets:
         dataset = config.combine_datasets[change.dataset]
-        processor = CombineProcessor(dataset, config.data_dir)
+        processor = CombineProcessor(dataset, config.data_dir, quarantine)
         input_file = find_input_file(work_dir, dataset.fec_prefix, change.cycle)
 
         if input_file is None:
             console.print(f"[red]Could not find input file for {change.dataset} {change.cycle}[/red]")
             return False
 
+        if not probe_input(input_file, dataset.columns):
+            return False
+
         processor.update_cycle(input_file, change.cycle, dry_run)
 
     elif change.dataset in config.summarize_datasets:
         dataset = config.summarize_datasets[change.dataset]
-        processor = SummarizeProcessor(dataset, config.data_dir)
+        processor = SummarizeProcessor(dataset, config.data_dir, quarantine)
         input_file = find_input_file(work_dir, dataset.fec_prefix, change.cycle)
 
         if input_file is None:
             console.print(f"[red]Could not find input file for {change.dataset} {change.cycle}[/red]")
             return False
 
+        key_fields = {dataset.sub_id_field: "id", dataset.date_field: "date", dataset.amount_field: "amount"}
+        if not probe_input(input_file, dataset.input_columns, key_fields):
+            return False
+
         processor.update_cycle(input_file, change.cycle, dry_run)
 
         # Special handling: expenditures_by_category and expenditures_by_state use same source
@@ -80,7 +101,7 @@ async def process_change(
             state_dataset = config.summarize_datasets.get("expenditures_by_state")
             if state_dataset:
                 console.print(f"\n[bold]Also processing expenditures_by_state cycle {change.cycle}[/bold]")
-                state_processor = SummarizeProcessor(state_dataset, config.data_dir)
+                state_processor = SummarizeProcessor(state_dataset, config.data_dir, quarantine)
                 state_processor.update_cycle(input_file, change.cycle, dry_run)
 
     else:
@@ -95,9 +116,13 @@ async def integrate_changes(
     config: Config,
     state: UpdateState,
     dry_run: bool = False,
+    quarantine: bool = False,
 ) -> tuple[int, int]:
     """Integrate all detected changes.
 
+    With quarantine, malformed lines of the downloaded files are written to
+    per-dataset, per-cycle files under the data directory's .fec_quarantine/.
+
     Returns:
         Tuple of (successful_count, failed_count)
     """
@@ -113,7 +138,9 @@ async def integrate_changes(
 
         for change in changes:
             try:
-                success = await process_change(change, config, work_dir, dry_run)
+                with span("integrate.process_change", dataset=change.dataset, cycle=change.cycle) as s:
+                    success = await process_change(change, config, work_dir, dry_run, quarantine)
+                    s.set(success=success)
 
                 if success:
                     successful += 1
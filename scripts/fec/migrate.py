@@ -0,0 +1,302 @@
+"""Fused single-pass migrations for existing FEC data files.
+
+Capitalization, ISO date conversion, and the individual contribution
+transaction_year column used to be separate migrations, each reading and
+rewriting the same file. Here every pending transform for a file is folded
+into one lazy plan that is streamed to disk once.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+from rich.console import Console
+
+from .config import Config
+from .utils.dates import convert_to_iso_date, extract_year_from_date
+from .utils.io import collect_streaming, get_sidecar_path, read_fec_csv, stream_rewrite_csv
+from .utils.names import capitalize_name
+from .utils.transforms import map_distinct
+
+console = Console()
+
+# Rows read from the head of a file to show sample changes
+PROBE_ROWS = 1000
+
+ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+@dataclass
+class FileMigration:
+    """Transforms requested for a single file."""
+
+    path: Path
+    name_columns: list[str] = field(default_factory=list)
+    date_columns: list[str] = field(default_factory=list)
+    add_transaction_year: bool = False
+    backup: bool = True
+
+    def merge(self, name_columns: list[str], date_columns: list[str]) -> None:
+        """Add columns from another registry, keeping order and skipping duplicates."""
+        self.name_columns += [c for c in name_columns if c not in self.name_columns]
+        self.date_columns += [c for c in date_columns if c not in self.date_columns]
+
+
+@dataclass
+class MigrationPlan:
+    """Transforms still pending for a file after probing its contents."""
+
+    migration: FileMigration
+    name_columns: list[str]
+    date_columns: list[str]
+    add_transaction_year: bool
+    samples: list[tuple[str, str]]
+
+    @property
+    def is_pending(self) -> bool:
+        return bool(self.name_columns or self.date_columns or self.add_transaction_year)
+
+    def describe(self) -> str:
+        """Describe the pending transforms in one line."""
+        parts = []
+        if self.name_columns:
+            parts.append(f"capitalize {', '.join(self.name_columns)}")
+        if self.date_columns:
+            parts.append(f"ISO dates {', '.join(self.date_columns)}")
+        if self.add_transaction_year:
+            parts.append("add transaction_year")
+        return "; ".join(parts)
+
+
+def collect_migrations(
+    data_dir: Path,
+    config: Config | None,
+    name_registry: dict[str, list[str]],
+    date_registry: dict[str, list[str]],
+    individual_dir: Path | None = None,
+    individual_name_columns: list[str] | None = None,
+) -> list[FileMigration]:
+    """Collect every requested transform per file from all registries.
+
+    Args:
+        data_dir: Directory containing the main data files
+        config: Loaded configuration; its datasets' name_columns and
+            date_columns are merged with the registries
+        name_registry: Mapping of data file names to name columns
+        date_registry: Mapping of data file names to date columns
+        individual_dir: If provided, also migrate individual contribution files
+        individual_name_columns: Name columns of individual contribution files
+
+    Returns:
+        One FileMigration per existing file, in a stable order
+    """
+    migrations: dict[str, FileMigration] = {}
+
+    def add(filename: str, name_columns: list[str], date_columns: list[str]) -> None:
+        migration = migrations.setdefault(filename, FileMigration(data_dir / filename))
+        migration.merge(name_columns, date_columns)
+
+    for filename, columns in name_registry.items():
+        add(filename, columns, [])
+    for filename, columns in date_registry.items():
+        add(filename, [], columns)
+
+    if config is not None:
+        for dataset in config.combine_datasets.values():
+            add(dataset.output_file, dataset.name_columns, dataset.date_columns)
+        for dataset in config.summarize_datasets.values():
+            add(dataset.output_file, dataset.name_columns, [])
+
+    result = [
+        migration
+        for migration in migrations.values()
+        if migration.path.exists() and (migration.name_columns or migration.date_columns)
+    ]
+
+    if individual_dir is not None:
+        for filepath in sorted(individual_dir.glob("*_individual_contributions.csv")):
+            result.append(
+                FileMigration(
+                    filepath,
+                    name_columns=list(individual_name_columns or []),
+                    add_transaction_year=True,
+                    # Individual files are too large to keep a second copy by default
+                    backup=False,
+                )
+            )
+
+    return result
+
+
+def _is_all_caps(value: str) -> bool:
+    return value == value.upper()
+
+
+def _needs_capitalization(values: list[str]) -> bool:
+    """Check whether any of the values are still in FEC ALL-CAPS form.
+
+    Only ALL-CAPS values are checked, since capitalize_name is not meant for
+    already-capitalized input. Values it keeps upper case (e.g. "PAC 54")
+    do not count.
+    """
+    return any(_is_all_caps(v) and capitalize_name(v) != v for v in values)
+
+
+def _capitalize_all_caps(value: str | None) -> str | None:
+    """Capitalize a name still in ALL-CAPS form, passing through the rest.
+
+    A file can mix both forms (e.g. older cycles migrated, newer ones
+    appended in FEC form), and capitalize_name would change names already
+    capitalized (e.g. "DeSantis" to "Desantis").
+    """
+    if value is None or not _is_all_caps(value):
+        return value
+    return capitalize_name(value)
+
+
+def _is_iso_date(value: str) -> bool:
+    return bool(ISO_DATE_PATTERN.match(value.strip()))
+
+
+def _to_iso_date(value: str | None) -> str | None:
+    """Convert a date to ISO 8601, passing through dates already converted.
+
+    convert_to_iso_date returns None for ISO input, and a file can mix both
+    forms (e.g. older cycles migrated, newer ones appended in FEC format).
+    """
+    if value is not None and _is_iso_date(value):
+        return value.strip()
+    return convert_to_iso_date(value)
+
+
+def _pending_columns(
+    lf: pl.LazyFrame, name_columns: list[str], date_columns: list[str]
+) -> tuple[list[str], list[str], dict[str, list[str]]]:
+    """Find the name and date columns with values still to convert anywhere in the file.
+
+    Both checks run in one streaming pass that reads only these columns.
+    Name columns are judged from their distinct ALL-CAPS values, which are
+    few once a column is capitalized.
+
+    Returns:
+        Pending name columns, pending date columns, and the distinct
+        ALL-CAPS values of each name column
+    """
+    if not name_columns and not date_columns:
+        return [], [], {}
+
+    def all_caps(col: str) -> pl.Expr:
+        value = pl.col(col).cast(pl.Utf8)
+        return (
+            value.filter((value == value.str.to_uppercase()) & value.str.contains("[A-Z]"))
+            .unique(maintain_order=True)
+            .implode()
+            .alias(f"name:{col}")
+        )
+
+    def non_iso(col: str) -> pl.Expr:
+        value = pl.col(col).cast(pl.Utf8).str.strip_chars()
+        return ((value != "") & ~value.str.contains(ISO_DATE_PATTERN.pattern)).any().alias(f"date:{col}")
+
+    exprs = [all_caps(col) for col in name_columns] + [non_iso(col) for col in date_columns]
+    row = collect_streaming(lf.select(exprs)).row(0, named=True)
+
+    caps = {col: row[f"name:{col}"] for col in name_columns}
+    return (
+        [col for col in name_columns if _needs_capitalization(caps[col])],
+        [col for col in date_columns if row[f"date:{col}"]],
+        caps,
+    )
+
+
+def plan_migration(migration: FileMigration) -> MigrationPlan:
+    """Find which transforms are still pending for a file.
+
+    Name and date columns are checked over the whole file (only those
+    columns are read), since a file can be converted in part.
+    """
+    lf = read_fec_csv(migration.path, lazy=True, with_sidecar=False)
+    columns = lf.collect_schema().names()
+    head = lf.head(PROBE_ROWS).collect()
+
+    samples: list[tuple[str, str]] = []
+
+    def sampled(col: str) -> list[str]:
+        return head[col].cast(pl.Utf8).drop_nulls().unique(maintain_order=True).to_list()
+
+    name_columns, date_columns, caps = _pending_columns(
+        lf,
+        [col for col in migration.name_columns if col in columns],
+        [col for col in migration.date_columns if col in columns],
+    )
+    for col in name_columns:
+        for before in [v for v in caps[col] if capitalize_name(v) != v][:3]:
+            samples.append((before, capitalize_name(before) or ""))
+
+    for col in date_columns:
+        for before in [v for v in sampled(col) if not _is_iso_date(v)][:3]:
+            samples.append((before, _to_iso_date(before) or ""))
+
+    add_transaction_year = (
+        migration.add_transaction_year
+        and "transaction_dt" in columns
+        and "transaction_year" not in columns
+        and not get_sidecar_path(migration.path).exists()
+    )
+
+    return MigrationPlan(
+        migration=migration,
+        name_columns=name_columns,
+        date_columns=date_columns,
+        add_transaction_year=add_transaction_year,
+        samples=[(b, a) for b, a in samples if b != a],
+    )
+
+
+def build_transform(plan: MigrationPlan) -> Callable[[pl.LazyFrame], pl.LazyFrame]:
+    """Build the lazy transform applying every pending column change at once."""
+
+    def transform(lf: pl.LazyFrame) -> pl.LazyFrame:
+        exprs = [
+            map_distinct(pl.col(col).cast(pl.Utf8), _capitalize_all_caps, pl.Utf8).alias(col)
+            for col in plan.name_columns
+        ]
+        exprs += [
+            map_distinct(pl.col(col).cast(pl.Utf8), _to_iso_date, pl.Utf8).alias(col)
+            for col in plan.date_columns
+        ]
+        if plan.add_transaction_year:
+            exprs.append(
+                map_distinct(
+                    pl.col("transaction_dt").cast(pl.Utf8), extract_year_from_date, pl.Int64
+                ).alias("transaction_year")
+            )
+
+        # All expressions see the original columns, so the year is extracted
+        # from transaction_dt as read regardless of other transforms
+        lf = lf.with_columns(exprs)
+
+        if plan.add_transaction_year:
+            # Same layout as add-year: election_cycle, transaction_year, then the rest
+            cols = [c for c in lf.collect_schema().names() if c != "transaction_year"]
+            lf = lf.select([cols[0], "transaction_year"] + cols[1:])
+
+        return lf
+
+    return transform
+
+
+def apply_migration(plan: MigrationPlan) -> int:
+    """Apply a plan's transforms in a single streaming read and write.
+
+    Returns:
+        Number of rows written
+    """
+    # Left behind by an interrupted run of this file
+    plan.migration.path.with_suffix(".csv.tmp").unlink(missing_ok=True)
+
+    return stream_rewrite_csv(
+        plan.migration.path, build_transform(plan), backup=plan.migration.backup
+    )
@@ -0,0 +1,402 @@
+"""Dependency-aware pipeline runner for the full FEC workflow.
+
+The pipeline knows the inputs and outputs of each stage (dataset updates
+from datasets.yaml, the bioguide crosswalk, and the individual contribution
+processors). Stages whose dependencies are satisfied run in parallel across
+a process pool, and local stages are only rebuilt when the fingerprints of
+their inputs changed since their last successful run (make-style).
+"""
+
+import asyncio
+import json
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from rich.console import Console
+
+from .config import Config, CycleState, UpdateState
+from .utils.instrument import get_report, run_with_spans
+from .utils.io import get_sidecar_path
+
+console = Console()
+
+PIPELINE_STATE_FILE = ".fec_pipeline_state.json"
+
+# Dataset whose output is also produced by another dataset's update
+SHARED_SOURCE_DATASETS = {"expenditures_by_state": "expenditures_by_category"}
+
+
+@dataclass
+class Stage:
+    """A single pipeline stage with its declared inputs and outputs."""
+
+    name: str
+    inputs: list[Path]
+    outputs: list[Path]
+    action: Callable[..., Any]
+    args: tuple = ()
+    always_run: bool = False
+    on_complete: Callable[[Any], None] | None = None
+    depends_on: set[str] = field(default_factory=set)
+
+
+@dataclass
+class PipelineState:
+    """Input fingerprints recorded at each stage's last successful run."""
+
+    stages: dict[str, dict[str, dict[str, Any] | None]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, state_file: Path) -> "PipelineState":
+        """Load state from JSON file."""
+        if not state_file.exists():
+            return cls()
+
+        with open(state_file) as f:
+            raw = json.load(f)
+
+        return cls(stages=raw.get("stages", {}))
+
+    def save(self, state_file: Path) -> None:
+        """Save state to JSON file."""
+        with open(state_file, "w") as f:
+            json.dump({"stages": self.stages}, f, indent=2)
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of a pipeline run."""
+
+    ran: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    blocked: list[str] = field(default_factory=list)
+
+
+def get_pipeline_state_file(config: Config) -> Path:
+    """Get the pipeline state file path (next to the update state file)."""
+    return config.state_file.with_name(PIPELINE_STATE_FILE)
+
+
+# Stage actions run in worker processes, so they must be module-level
+# functions taking only picklable arguments.
+
+
+def _run_dataset_update(
+    config_path: Path, data_dir: Path, dataset: str, cycles: list[int]
+) -> tuple[dict[str, dict[str, Any]], int]:
+    """Detect and integrate changes for one dataset.
+
+    Returns the new cycle states of the changes that succeeded, and the
+    number that failed, so the parent process can merge the states into the
+    shared update state file without concurrent writes (and before failing
+    the stage).
+    """
+    from .detect import detect_changes
+    from .integrate import integrate_changes
+
+    config = Config.load(config_path, data_dir)
+    state = UpdateState.load(config.state_file)
+
+    changes = asyncio.run(detect_changes(config, state, cycles, datasets=[dataset]))
+    if not changes:
+        return {}, 0
+
+    _, failed = asyncio.run(integrate_changes(changes, config, state))
+
+    # Failed changes leave their cycle state untouched
+    cycle_states = {
+        str(change.cycle): asdict(state.cycles[dataset][str(change.cycle)])
+        for change in changes
+        if str(change.cycle) in state.cycles.get(dataset, {})
+    }
+    return cycle_states, failed
+
+
+def _run_bioguide(data_dir: Path, output_file: Path) -> None:
+    from .processors.bioguide import BioguideProcessor
+
+    BioguideProcessor(data_dir, output_file).create_crosswalk()
+
+
+def _run_add_year(individual_dir: Path, cycle: int, sidecar: bool) -> int:
+    from .processors.individual import TransactionYearAdder
+
+    # Runs when the CSV changed; a sidecar derived from its old contents is stale
+    # and recomputed (a current one is kept)
+    return TransactionYearAdder(individual_dir, sidecar=sidecar).process_all(cycle=cycle)
+
+
+def _run_individual_summarize(data_dir: Path, individual_dir: Path, output_file: Path) -> None:
+    from .processors.individual import IndividualSummarizer
+
+    IndividualSummarizer(data_dir, individual_dir, output_file).summarize_all()
+
+
+def _merge_update_state(config: Config, dataset: str) -> Callable[[Any], None]:
+    """Build a callback that merges a worker's cycle states into the state file.
+
+    States of the changes that succeeded are saved even when others failed,
+    so the next run does not redo them; the stage then fails.
+    """
+
+    def merge(outcome: tuple[dict[str, dict[str, Any]], int]) -> None:
+        cycle_states, failed = outcome
+        if cycle_states:
+            state = UpdateState.load(config.state_file)
+            for cycle, raw in cycle_states.items():
+                state.cycles.setdefault(dataset, {})[cycle] = CycleState(**raw)
+            state.save(config.state_file)
+        if failed > 0:
+            raise RuntimeError(f"{failed} update(s) failed for {dataset}")
+
+    return merge
+
+
+def build_stages(
+    config: Config,
+    config_path: Path,
+    individual_dir: Path,
+    individual_output: Path,
+    crosswalk_file: Path,
+    cycles: list[int],
+    include_update: bool = True,
+    sidecar: bool = False,
+) -> list[Stage]:
+    """Build the pipeline stages and resolve their dependencies.
+
+    Args:
+        config: Loaded configuration
+        config_path: Path to datasets.yaml (passed to update workers)
+        individual_dir: Directory containing individual contribution files
+        individual_output: Output path for the individual contribution summary
+        crosswalk_file: Output path for the bioguide crosswalk
+        cycles: Cycles checked by the update stages
+        include_update: If False, omit the network-driven update stages
+        sidecar: If True, add-year writes derived-column sidecars instead of
+            rewriting the individual contribution files
+
+    Returns:
+        Stages in declaration order with depends_on populated
+    """
+    data_dir = config.data_dir
+    stages: list[Stage] = []
+
+    if include_update:
+        datasets = {**config.combine_datasets, **config.summarize_datasets}
+        for name, dataset in datasets.items():
+            if name in SHARED_SOURCE_DATASETS:
+                continue
+
+            outputs = [data_dir / dataset.output_file]
+            for shared, source in SHARED_SOURCE_DATASETS.items():
+                if source == name and shared in datasets:
+                    outputs.append(data_dir / datasets[shared].output_file)
+
+            stages.append(
+                Stage(
+                    name=f"update:{name}",
+                    inputs=[config_path],
+                    outputs=outputs,
+                    action=_run_dataset_update,
+                    args=(config_path, data_dir, name, cycles),
+                    # Remote changes are detected by the stage itself via ETags
+                    always_run=True,
+                    on_complete=_merge_update_state(config, name),
+                )
+            )
+
+    candidate_file = data_dir / config.combine_datasets["candidate_registrations"].output_file
+    committee_file = data_dir / config.combine_datasets["committee_registrations"].output_file
+
+    stages.append(
+        Stage(
+            name="bioguide",
+            inputs=[candidate_file, data_dir / "bioguide_ids" / "congress_api_members.json"],
+            outputs=[crosswalk_file],
+            action=_run_bioguide,
+            args=(data_dir, crosswalk_file),
+        )
+    )
+
+    individual_files = sorted(individual_dir.glob("*_individual_contributions.csv"))
+    add_year_outputs: list[Path] = []
+    for file_path in individual_files:
+        cycle = int(file_path.stem.split("_")[0])
+        outputs = [get_sidecar_path(file_path)] if sidecar else [file_path]
+        add_year_outputs.extend(outputs)
+        stages.append(
+            Stage(
+                name=f"individual:add-year:{cycle}",
+                inputs=[file_path],
+                outputs=outputs,
+                action=_run_add_year,
+                args=(individual_dir, cycle, sidecar),
+            )
+        )
+
+    summarize_inputs = individual_files + (add_year_outputs if sidecar else [])
+    stages.append(
+        Stage(
+            name="individual:summarize",
+            inputs=[committee_file, candidate_file, crosswalk_file] + summarize_inputs,
+            outputs=[individual_output],
+            action=_run_individual_summarize,
+            args=(data_dir, individual_dir, individual_output),
+        )
+    )
+
+    resolve_dependencies(stages)
+    return stages
+
+
+def resolve_dependencies(stages: list[Stage]) -> None:
+    """Populate depends_on from the stages' inputs and outputs.
+
+    A stage depends on every other stage that produces one of its inputs.
+    Stages that rewrite their own inputs in place do not depend on themselves.
+    """
+    producers: dict[Path, str] = {}
+    for stage in stages:
+        for output in stage.outputs:
+            producers[output] = stage.name
+
+    for stage in stages:
+        stage.depends_on = {
+            producers[path]
+            for path in stage.inputs
+            if path in producers and producers[path] != stage.name
+        }
+
+
+def is_up_to_date(
+    stage: Stage,
+    state: PipelineState,
+    fingerprints: dict[str, dict[str, Any] | None],
+) -> bool:
+    """Check whether a stage can be skipped."""
+    if stage.always_run:
+        return False
+    if any(not output.exists() for output in stage.outputs):
+        return False
+    return state.stages.get(stage.name) == fingerprints
+
+
+def print_plan(stages: list[Stage], state: PipelineState) -> None:
+    """Print each stage with its dependencies and current staleness."""
+    from .utils.fingerprint import fingerprint_files
+
+    for stage in stages:
+        if stage.always_run:
+            status = "[cyan]always[/cyan]"
+        elif is_up_to_date(stage, state, fingerprint_files(stage.inputs)):
+            status = "[dim]up to date[/dim]"
+        else:
+            status = "[yellow]stale[/yellow]"
+
+        deps = ", ".join(sorted(stage.depends_on)) or "-"
+        console.print(f"  {stage.name}: {status} [dim](after: {deps})[/dim]")
+
+
+def run_pipeline(
+    stages: list[Stage],
+    state: PipelineState,
+    state_file: Path,
+    jobs: int,
+    force: bool = False,
+) -> PipelineResult:
+    """Run stages in dependency order, in parallel where possible.
+
+    Args:
+        stages: Stages from build_stages
+        state: Pipeline state with fingerprints from previous runs
+        state_file: Where to persist updated state after each stage
+        jobs: Maximum number of stages running at once
+        force: If True, rebuild every stage regardless of fingerprints
+
+    Returns:
+        PipelineResult listing what ran, was skipped, failed, or was blocked
+    """
+    from .utils.fingerprint import fingerprint_files
+
+    result = PipelineResult()
+    pending = {stage.name: stage for stage in stages}
+    finished: set[str] = set()
+    unusable: set[str] = set()
+
+    # Spawn (not fork) so each worker starts with a fresh Polars thread pool
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        running: dict[Future, tuple[Stage, float]] = {}
+
+        while pending or running:
+            progressed = False
+
+            for name in list(pending):
+                stage = pending[name]
+
+                if stage.depends_on & unusable:
+                    del pending[name]
+                    unusable.add(name)
+                    result.blocked.append(name)
+                    console.print(f"[yellow]Blocked {name}: upstream stage failed[/yellow]")
+                    progressed = True
+                    continue
+
+                if not stage.depends_on <= finished:
+                    continue
+
+                del pending[name]
+                progressed = True
+
+                fingerprints = fingerprint_files(stage.inputs)
+                if not force and is_up_to_date(stage, state, fingerprints):
+                    finished.add(name)
+                    result.skipped.append(name)
+                    console.print(f"[dim]Up to date: {name}[/dim]")
+                    continue
+
+                console.print(f"[bold]Starting {name}[/bold]")
+                future = pool.submit(run_with_spans, "pipeline.stage", stage.action, *stage.args, stage=name)
+                running[future] = (stage, time.monotonic())
+
+            if not running:
+                if pending and not progressed:
+                    # Only possible with a dependency cycle
+                    for name in pending:
+                        result.blocked.append(name)
+                    console.print(f"[red]Dependency cycle among: {', '.join(pending)}[/red]")
+                    break
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, started = running.pop(future)
+                elapsed = time.monotonic() - started
+
+                try:
+                    value, spans = future.result()
+                    get_report().extend(spans)
+                    if stage.on_complete is not None:
+                        stage.on_complete(value)
+                except (Exception, SystemExit) as e:
+                    unusable.add(stage.name)
+                    result.failed.append(stage.name)
+                    console.print(f"[red]Failed {stage.name} after {elapsed:.1f}s: {e}[/red]")
+                    continue
+
+                # Record fingerprints after the run so in-place rewrites
+                # (e.g. add-year) do not make the stage look stale next time
+                state.stages[stage.name] = fingerprint_files(stage.inputs)
+                state.save(state_file)
+
+                finished.add(stage.name)
+                result.ran.append(stage.name)
+                console.print(f"[green]Finished {stage.name}[/green] ({elapsed:.1f}s)")
+
+    return result
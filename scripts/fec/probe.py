@@ -0,0 +1,204 @@
+"""Fast schema and sanity probe of downloaded FEC files.
+
+The readers tolerate ragged lines and unparseable values (so one bad row
+does not sink a multi-GB file), which also means a changed FEC layout
+reads "successfully" as garbage. Before any heavy work, probe_file reads
+the first lines of a file and a random sample of the rest, and checks:
+
+    - field counts against the configured columns (FEC lines may end in
+      a trailing "|", i.e. one extra empty field);
+    - the formats of key fields (sub_id, dates, amounts, committee and
+      candidate IDs).
+
+A few malformed lines are normal; a layout change shows up in most of them.
+"""
+
+import random
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+from .utils.instrument import span
+
+# Lines read from the start of the file, and sampled from the rest
+PROBE_HEAD_LINES = 1000
+PROBE_SAMPLE_LINES = 1000
+
+# Bytes after the head sampled from when the source cannot seek cheaply
+# (e.g. a compressed ZIP member)
+PROBE_STREAM_WINDOW = 32 * 1024 * 1024
+
+# Share of probed lines allowed a wrong field count, or a bad key value
+MAX_BAD_FIELD_RATE = 0.01
+MAX_BAD_KEY_RATE = 0.01
+
+# Formats of key fields, by kind
+KEY_FORMATS = {
+    "id": re.compile(r"\d{1,19}"),
+    "date": re.compile(r"\d{7,8}|\d{2}/\d{2}/\d{4}"),
+    "amount": re.compile(r"-?\d*\.?\d+"),
+    "committee": re.compile(r"C\d{8}"),
+    "candidate": re.compile(r"[HSP]\d[A-Z0-9]{2}\d{5}"),
+}
+
+# Key fields checked by default, by column name
+KEY_FIELDS = {
+    "sub_id": "id",
+    "transaction_dt": "date",
+    "transaction_amt": "amount",
+    "cmte_id": "committee",
+    "cand_id": "candidate",
+}
+
+# Key fields that must never be empty
+REQUIRED_KINDS = {"id", "committee"}
+
+
+@dataclass
+class ProbeResult:
+    """Field counts and key-field checks of the probed lines of one file."""
+
+    name: str
+    expected_fields: int
+    lines_checked: int = 0
+    field_counts: Counter = field(default_factory=Counter)
+    # column -> (bad values, example)
+    bad_keys: dict[str, tuple[int, str]] = field(default_factory=dict)
+    issues: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.issues
+
+
+def _head_lines(f: BinaryIO, count: int) -> list[bytes]:
+    lines = []
+    for _ in range(count):
+        line = f.readline()
+        if not line:
+            break
+        lines.append(line)
+    return lines
+
+
+def _sample_seekable(f: BinaryIO, start: int, size: int, count: int, rng: random.Random) -> list[bytes]:
+    """Sample lines at random offsets (each the line after the offset)."""
+    lines = {}
+    for offset in sorted(rng.randrange(start, size) for _ in range(count)):
+        f.seek(offset)
+        f.readline()
+        line_start = f.tell()
+        line = f.readline()
+        if line:
+            lines[line_start] = line
+    return list(lines.values())
+
+
+def _sample_stream(f: BinaryIO, window: int, count: int, rng: random.Random) -> list[bytes]:
+    """Sample lines from the next window of a stream."""
+    lines = f.read(window).split(b"\n")[1:-1]
+    return rng.sample(lines, min(count, len(lines)))
+
+
+def _read_probe_lines(
+    source: Path | BinaryIO, head_lines: int, sample_lines: int, rng: random.Random
+) -> list[bytes]:
+    if isinstance(source, Path):
+        with open(source, "rb") as f:
+            lines = _head_lines(f, head_lines)
+            start, size = f.tell(), source.stat().st_size
+            if sample_lines and start < size:
+                lines += _sample_seekable(f, start, size, sample_lines, rng)
+            return lines
+
+    lines = _head_lines(source, head_lines)
+    if sample_lines:
+        lines += _sample_stream(source, PROBE_STREAM_WINDOW, sample_lines, rng)
+    return lines
+
+
+def probe_file(
+    source: Path | BinaryIO,
+    columns: list[str],
+    key_fields: dict[str, str] | None = None,
+    head_lines: int = PROBE_HEAD_LINES,
+    sample_lines: int = PROBE_SAMPLE_LINES,
+    seed: int | None = None,
+) -> ProbeResult:
+    """Probe a headerless pipe-delimited FEC file against its configured layout.
+
+    Args:
+        source: File path, or a binary stream positioned at the start (which
+            is consumed; reopen it for the full read)
+        columns: Configured column names, in file order
+        key_fields: Column -> kind in KEY_FORMATS (default: the KEY_FIELDS
+            present in columns)
+        head_lines: Lines read from the start
+        sample_lines: Lines sampled from the rest of the file
+        seed: Seed for the sample (default: random)
+
+    Returns:
+        The result; issues are set if either check fails
+    """
+    name = source.name if isinstance(source, Path) else getattr(source, "name", "stream")
+    if key_fields is None:
+        key_fields = {col: kind for col, kind in KEY_FIELDS.items() if col in columns}
+    positions = {col: columns.index(col) for col in key_fields if col in columns}
+
+    result = ProbeResult(name=str(name), expected_fields=len(columns))
+
+    with span("probe.file", file=result.name) as s:
+        lines = _read_probe_lines(source, head_lines, sample_lines, random.Random(seed))
+        s.add(rows_in=len(lines), bytes_read=sum(len(line) for line in lines))
+
+    bad_fields = 0
+    bad_keys: Counter = Counter()
+    examples: dict[str, str] = {}
+
+    for raw in lines:
+        values = raw.rstrip(b"\r\n").decode("utf-8", errors="replace").split("|")
+        if not values or values == [""]:
+            continue
+        result.lines_checked += 1
+        result.field_counts[len(values)] += 1
+
+        if len(values) == len(columns) + 1 and values[-1] == "":
+            values.pop()
+        if len(values) != len(columns):
+            bad_fields += 1
+            continue
+
+        for col, pos in positions.items():
+            kind = key_fields[col]
+            value = values[pos].strip()
+            if value == "" and kind not in REQUIRED_KINDS:
+                continue
+            if not KEY_FORMATS[kind].fullmatch(value):
+                bad_keys[col] += 1
+                examples.setdefault(col, value)
+
+    checked = result.lines_checked
+    if checked == 0:
+        result.issues.append("No lines to probe")
+        return result
+
+    if bad_fields / checked > MAX_BAD_FIELD_RATE:
+        counts = ", ".join(f"{n} fields: {seen:,}" for n, seen in result.field_counts.most_common(3))
+        result.issues.append(
+            f"{bad_fields:,} of {checked:,} probed lines do not have the {len(columns)} "
+            f"configured fields ({counts}); the file layout may have changed"
+        )
+
+    # Key fields are only checked on lines with the configured field count
+    parsed = checked - bad_fields
+    for col, bad in bad_keys.items():
+        result.bad_keys[col] = (bad, examples[col])
+        if bad / parsed > MAX_BAD_KEY_RATE:
+            result.issues.append(
+                f"{bad:,} of {parsed:,} probed {col} values are not a valid {key_fields[col]} "
+                f"(e.g. {examples[col]!r})"
+            )
+
+    return result
@@ -3,11 +3,15 @@
 import csv
 import json
 import re
+from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple
 
 import pandas as pd
 from rich.console import Console
 
+from ..utils.manifest import record_output
+
 console = Console()
 
 # Nickname mappings for name matching
@@ -185,6 +189,26 @@ PARTY_TO_FEC = {
 }
 
 
+class ParsedName(NamedTuple):
+    """Lowercase (last, first, suffix) name, with the canonical first name."""
+
+    last: str
+    first: str
+    suffix: str
+    first_canonical: str
+
+
+@dataclass(frozen=True)
+class IndexedCandidate:
+    """A candidate registration row, with its name parsed once."""
+
+    position: int
+    cand_id: str
+    cand_name: str
+    party: str
+    name: ParsedName
+
+
 class BioguideProcessor:
     """Creates FEC candidate ID to Bioguide ID crosswalk."""
 
@@ -286,26 +310,37 @@ class BioguideProcessor:
         name = name.lower().strip()
         return NICKNAME_MAP.get(name, name)
 
+    def parse_fec_name(self, fec_name: str) -> ParsedName:
+        """Parse an FEC 'Last, First Middle Jr' name for matching."""
+        last, first, suffix = self.normalize_name(fec_name)
+        return ParsedName(last, first, suffix, self.get_canonical_name(first))
+
+    def parse_member_name(self, first: str, last: str, suffix: str = "") -> ParsedName:
+        """Parse a congress member's name parts for matching."""
+        first = first.lower().strip()
+        last = last.lower().strip()
+        suffix = suffix.lower().strip() if suffix else ""
+        return ParsedName(last, first, suffix, self.get_canonical_name(first))
+
     def names_match(self, fec_name: str, first: str, last: str, suffix: str = "") -> tuple[bool, float]:
         """Compare FEC name to congress member name.
 
         Returns (match, confidence_score).
         """
-        fec_last, fec_first, fec_suffix = self.normalize_name(fec_name)
+        return self.parsed_names_match(self.parse_fec_name(fec_name), self.parse_member_name(first, last, suffix))
 
-        # Clean up names
-        first = first.lower().strip()
-        last = last.lower().strip()
-        suffix = suffix.lower().strip() if suffix else ""
+    def parsed_names_match(self, fec_name: ParsedName, member_name: ParsedName) -> tuple[bool, float]:
+        """Compare a parsed FEC name to a parsed congress member name.
+
+        Returns (match, confidence_score).
+        """
+        fec_last, fec_first, fec_suffix, fec_first_canonical = fec_name
+        last, first, suffix, first_canonical = member_name
 
         # Exact last name match is required
         if fec_last != last:
             return (False, 0.0)
 
-        # Check first name
-        fec_first_canonical = self.get_canonical_name(fec_first)
-        first_canonical = self.get_canonical_name(first)
-
         # Exact first name match
         if fec_first == first:
             if fec_suffix == suffix or not suffix:
@@ -373,18 +408,43 @@ class BioguideProcessor:
 
         return cycles
 
+    def build_candidate_index(
+        self, candidates_df: pd.DataFrame
+    ) -> dict[tuple[str, str, int], list[IndexedCandidate]]:
+        """Index candidate registrations by (state, office, cycle).
+
+        Each distinct FEC name is parsed once; rows without a name or ID
+        are left out, as match_by_name would skip them.
+        """
+        columns = candidates_df[["cand_office_st", "cand_office", "cand_id", "cand_name", "cand_pty_affiliation"]]
+        columns = columns.fillna("")
+        cycles = candidates_df["election_cycle"].astype(int)
+
+        index: dict[tuple[str, str, int], list[IndexedCandidate]] = {}
+        parsed: dict[str, ParsedName] = {}
+        rows = zip(
+            columns["cand_office_st"], columns["cand_office"], cycles,
+            columns["cand_id"], columns["cand_name"], columns["cand_pty_affiliation"],
+        )
+        for position, (state, office, cycle, cand_id, cand_name, party) in enumerate(rows):
+            if not cand_name or not cand_id:
+                continue
+            if cand_name not in parsed:
+                parsed[cand_name] = self.parse_fec_name(cand_name)
+            index.setdefault((state, office, cycle), []).append(
+                IndexedCandidate(position, cand_id, cand_name, party, parsed[cand_name])
+            )
+        return index
+
     def match_by_name(
         self, members_without_fec: list[dict], candidates_df: pd.DataFrame
     ) -> list[dict]:
         """Match Congress members to FEC candidates by name, state, office, and time."""
         matches = []
 
-        # Preprocess candidates dataframe for faster lookups
-        # Group by state, office type
-        candidates_df["cand_office"] = candidates_df["cand_office"].fillna("")
-        candidates_df["cand_office_st"] = candidates_df["cand_office_st"].fillna("")
-        candidates_df["cand_pty_affiliation"] = candidates_df["cand_pty_affiliation"].fillna("")
-        candidates_df["election_cycle"] = candidates_df["election_cycle"].astype(int)
+        # Block candidates by state, office and cycle, so each term looks up
+        # its few candidates instead of filtering the whole frame
+        index = self.build_candidate_index(candidates_df)
 
         console.print(f"\nAttempting name matching for {len(members_without_fec)} members...")
 
@@ -400,6 +460,9 @@ class BioguideProcessor:
             if not bioguide or not last:
                 continue
 
+            member_name = self.parse_member_name(first, last, suffix)
+            nickname_name = self.parse_member_name(nickname, last, suffix) if nickname else None
+
             terms = self.get_terms_in_range(member)
             if not terms:
                 continue
@@ -422,32 +485,24 @@ class BioguideProcessor:
                 # Map party to FEC code
                 fec_party = PARTY_TO_FEC.get(party, "")
 
-                # Filter candidates by state, office, and cycle
-                mask = (
-                    (candidates_df["cand_office_st"] == state)
-                    & (candidates_df["cand_office"] == office_code)
-                    & (candidates_df["election_cycle"].isin(cycles))
+                # Candidates in the term's state, office, and cycles, in file order
+                candidates = sorted(
+                    (c for cycle in set(cycles) for c in index.get((state, office_code, cycle), [])),
+                    key=lambda c: c.position,
                 )
-                filtered = candidates_df[mask]
-
-                if filtered.empty:
-                    continue
 
                 # Try to match by name
-                for _, row in filtered.iterrows():
-                    cand_name = row.get("cand_name", "")
-                    cand_party = row.get("cand_pty_affiliation", "")
-                    cand_id = row.get("cand_id", "")
-
-                    if not cand_name or not cand_id:
-                        continue
+                for candidate in candidates:
+                    cand_name = candidate.cand_name
+                    cand_party = candidate.party
+                    cand_id = candidate.cand_id
 
                     # Try matching with formal first name first
-                    is_match, name_score = self.names_match(cand_name, first, last, suffix)
+                    is_match, name_score = self.parsed_names_match(candidate.name, member_name)
 
                     # If no match, try with nickname
-                    if not is_match and nickname:
-                        is_match, name_score = self.names_match(cand_name, nickname, last, suffix)
+                    if not is_match and nickname_name:
+                        is_match, name_score = self.parsed_names_match(candidate.name, nickname_name)
 
                     if not is_match:
                         continue
@@ -666,12 +721,15 @@ class BioguideProcessor:
 
         # Write output
         console.print(f"\nWriting to {self.output_file}...")
-        with open(self.output_file, "w", newline="") as f:
+        temp_path = self.output_file.with_suffix(".csv.tmp")
+        with open(temp_path, "w", newline="") as f:
             writer = csv.DictWriter(
                 f, fieldnames=["cand_id", "bioguide_id", "match_method", "confidence"]
             )
             writer.writeheader()
             writer.writerows(crosswalk)
+        temp_path.rename(self.output_file)
+        record_output(self.output_file, rows=len(crosswalk))
 
         console.print(f"[green]Done![/green] Wrote {len(crosswalk):,} rows to {self.output_file.name}")
 
@@ -6,9 +6,12 @@ import polars as pl
 from rich.console import Console
 
 from ..config import CombineDataset
-from ..utils.io import atomic_write_csv, read_fec_pipe_delimited
+from ..utils.instrument import file_size, span
+from ..utils.io import atomic_write_csv, read_fec_pipe_delimited_blocks
 from ..utils.dates import convert_to_iso_date
 from ..utils.names import capitalize_name
+from ..utils.quarantine import Quarantine, get_quarantine_path
+from ..utils.transforms import map_distinct
 
 console = Console()
 
@@ -16,9 +19,10 @@ console = Console()
 class CombineProcessor:
     """Processes combine-strategy datasets (simple concatenation)."""
 
-    def __init__(self, dataset: CombineDataset, data_dir: Path):
+    def __init__(self, dataset: CombineDataset, data_dir: Path, quarantine: bool = False):
         self.dataset = dataset
         self.data_dir = data_dir
+        self.quarantine = quarantine
 
     def process_cycle(self, input_file: Path, cycle: int) -> pl.DataFrame:
         """Process a single cycle's data file.
@@ -32,35 +36,46 @@ class CombineProcessor:
         """
         console.print(f"    Processing {input_file.name}...")
 
-        # Read pipe-delimited file using shared utility
-        df = read_fec_pipe_delimited(input_file, self.dataset.columns)
-
-        # Apply name capitalization if configured
-        if self.dataset.name_columns:
-            for col in self.dataset.name_columns:
-                if col in df.columns:
-                    df = df.with_columns(
-                        pl.col(col)
-                        .map_elements(capitalize_name, return_dtype=pl.Utf8)
-                        .alias(col)
-                    )
-
-        # Apply date conversion to ISO 8601 if configured
-        if self.dataset.date_columns:
-            for col in self.dataset.date_columns:
-                if col in df.columns:
-                    df = df.with_columns(
-                        pl.col(col)
-                        .map_elements(convert_to_iso_date, return_dtype=pl.Utf8)
-                        .alias(col)
-                    )
-
-        # Prepend election_cycle column
-        df = df.with_columns(pl.lit(cycle).alias("election_cycle"))
-
-        # Reorder to put election_cycle first
-        columns = ["election_cycle"] + self.dataset.columns
-        df = df.select(columns)
+        with span("combine.process_cycle", dataset=self.dataset.name, cycle=cycle) as s:
+            quarantine = (
+                Quarantine(get_quarantine_path(self.data_dir, self.dataset.name, cycle))
+                if self.quarantine
+                else None
+            )
+
+            # Read pipe-delimited file using shared utility
+            df = read_fec_pipe_delimited_blocks(input_file, self.dataset.columns, quarantine=quarantine)
+            s.add(rows_in=len(df), bytes_read=file_size(input_file))
+
+            if quarantine is not None and quarantine.rows:
+                s.add(rows_quarantined=quarantine.rows)
+                console.print(f"    [yellow]{quarantine.summary()}[/yellow]")
+
+            # Apply name capitalization if configured (once per distinct name;
+            # registrations repeat the same names across many rows)
+            if self.dataset.name_columns:
+                for col in self.dataset.name_columns:
+                    if col in df.columns:
+                        df = df.with_columns(
+                            map_distinct(pl.col(col), capitalize_name, pl.Utf8).alias(col)
+                        )
+
+            # Apply date conversion to ISO 8601 if configured (once per distinct date)
+            if self.dataset.date_columns:
+                for col in self.dataset.date_columns:
+                    if col in df.columns:
+                        df = df.with_columns(
+                            map_distinct(pl.col(col), convert_to_iso_date, pl.Utf8).alias(col)
+                        )
+
+            # Prepend election_cycle column
+            df = df.with_columns(pl.lit(cycle, dtype=pl.Int64).alias("election_cycle"))
+
+            # Reorder to put election_cycle first
+            columns = ["election_cycle"] + self.dataset.columns
+            df = df.select(columns)
+
+            s.add(rows_out=len(df))
 
         console.print(f"    → {len(df):,} rows")
         return df
@@ -75,7 +90,10 @@ class CombineProcessor:
         if not output_path.exists():
             return None
 
-        return pl.read_csv(output_path)
+        with span("combine.read_existing", dataset=self.dataset.name) as s:
+            df = pl.read_csv(output_path)
+            s.add(bytes_read=file_size(output_path), rows_out=len(df))
+        return df
 
     def remove_cycle(self, df: pl.DataFrame, cycle: int) -> pl.DataFrame:
         """Remove all rows for a given cycle."""
@@ -86,7 +104,8 @@ class CombineProcessor:
         if existing is None:
             return new_data
 
-        return pl.concat([existing, new_data])
+        # Relaxed so new cycles match dtypes inferred when re-reading the CSV
+        return pl.concat([existing, new_data], how="vertical_relaxed")
 
     def write_output(self, df: pl.DataFrame, backup: bool = True) -> None:
         """Write output file with optional backup."""
@@ -96,7 +115,9 @@ class CombineProcessor:
         df = df.sort("election_cycle")
 
         # Write atomically using shared utility
-        atomic_write_csv(df, output_path, backup=backup)
+        with span("combine.write_output", dataset=self.dataset.name) as s:
+            atomic_write_csv(df, output_path, backup=backup)
+            s.add(rows_out=len(df), bytes_written=file_size(output_path))
 
         console.print(f"    Wrote {output_path.name}: {len(df):,} rows")
 
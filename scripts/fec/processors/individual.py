@@ -1,17 +1,46 @@
 """Processors for individual contributions data."""
 
 import asyncio
+import hashlib
+import multiprocessing
+import os
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import polars as pl
 from rich.console import Console
 
-from ..utils.dates import extract_year_from_date, extract_month_from_date
-from ..utils.io import atomic_write_csv, read_fec_csv, read_fec_pipe_delimited
+from ..probe import probe_file
+from ..utils.cache import FrameCache, get_default_cache_dir
+from ..utils.dates import convert_to_iso_date, extract_year_from_date, extract_month_from_date
+from ..utils.ids import IdDictionary, get_id_dictionary_path
+from ..utils.instrument import file_size, get_report, run_with_spans, span
+from ..utils.io import (
+    SIDECAR_KEY_COLUMN,
+    atomic_write_csv,
+    collect_streaming,
+    get_sidecar_path,
+    is_sidecar_current,
+    read_fec_csv,
+    read_fec_csv_blocks,
+    read_fec_pipe_delimited_blocks,
+    restamp_sidecar,
+    sidecar_metadata,
+)
+from ..utils.manifest import record_output
+from ..utils.money import cents_to_dollars, parse_cents
 from ..utils.names import capitalize_name
-from ..utils.progress import create_download_progress, create_spinner_progress
+from ..utils.profiling import capture_plan
+from ..utils.progress import (
+    ReadProgress,
+    create_download_progress,
+    create_processing_progress,
+    create_spinner_progress,
+)
+from ..utils.quarantine import Quarantine, get_quarantine_path
+from ..utils.transforms import map_distinct
 from ..async_utils.download import download_with_retry
 
 console = Console()
@@ -23,6 +52,26 @@ ELECTION_CYCLES = list(range(1980, 2028, 2))  # 1980, 1982, ..., 2026
 # Candidate committee types (House, Senate, Presidential)
 CANDIDATE_COMMITTEE_TYPES = {"H", "S", "P"}
 
+# Bump when the derived lookup tables change shape, to invalidate cached copies
+LOOKUP_CACHE_VERSION = 1
+
+# Bump when per-cycle aggregation logic changes, to invalidate cached partials
+CYCLE_CACHE_VERSION = 4
+
+# Estimated peak memory of one process_cycle worker, as a multiple of its input size.
+# process_cycle only materializes six projected columns of candidate-committee rows.
+WORKER_MEMORY_FACTOR = 0.5
+
+# Columns of the individual contribution files needed by IndividualSummarizer
+INDIVIDUAL_SUMMARY_COLUMNS = [
+    "cmte_id",
+    "sub_id",
+    "memo_cd",
+    "amndt_ind",
+    "transaction_dt",
+    "transaction_amt",
+]
+
 
 def get_fec_url(cycle: int) -> str:
     """Build FEC URL for individual contributions ZIP file."""
@@ -30,12 +79,70 @@ def get_fec_url(cycle: int) -> str:
     return f"{FEC_BASE_URL}/{cycle}/indiv{year_suffix}.zip"
 
 
+def get_available_memory() -> int | None:
+    """Get available system memory in bytes, or None if unknown."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def get_max_parallel_cycles(input_files: list[Path], requested: int) -> int:
+    """Cap the number of parallel cycle workers by available memory.
+
+    Assumes every worker may be processing the largest file at once.
+
+    Args:
+        input_files: Files that will be processed
+        requested: Requested number of workers
+
+    Returns:
+        Number of workers to use (at least 1)
+    """
+    workers = max(1, min(requested, len(input_files)))
+
+    available = get_available_memory()
+    if available is None or not input_files:
+        return workers
+
+    largest = max(f.stat().st_size for f in input_files)
+    per_worker = max(1, int(largest * WORKER_MEMORY_FACTOR))
+    return max(1, min(workers, available // per_worker))
+
+
+def _process_cycle_worker(
+    data_dir: Path,
+    individual_dir: Path,
+    output_file: Path,
+    input_file: Path,
+    cycle: int,
+    lookup_path: Path,
+) -> pl.DataFrame:
+    """Run IndividualSummarizer.process_cycle in a worker process.
+
+    The committee lookup is read from a shared Arrow IPC file, which is
+    memory-mapped rather than copied into each worker.
+    """
+    summarizer = IndividualSummarizer(data_dir, individual_dir, output_file, use_cache=False)
+    committee_lookup = pl.read_ipc(lookup_path)
+    return summarizer.process_cycle(input_file, cycle, committee_lookup, show_progress=False)
+
+
 class IndividualDownloader:
     """Downloads and processes individual contributions from FEC."""
 
-    def __init__(self, output_dir: Path, header_file: Path):
+    def __init__(self, output_dir: Path, header_file: Path, quarantine: bool = False):
         self.output_dir = output_dir
         self.header_file = header_file
+        self.quarantine = quarantine
 
     def get_output_path(self, cycle: int) -> Path:
         """Get output CSV path for a cycle."""
@@ -64,41 +171,58 @@ class IndividualDownloader:
                     console.print(f"[red]No itcont.txt found in {zip_path.name}[/red]")
                     return False
 
+                # Check the layout on a sample before reading the whole file
+                with zf.open(itcont_name) as f:
+                    probe = probe_file(f, headers)
+                for issue in probe.issues:
+                    console.print(f"[red]  {itcont_name}: {issue}[/red]")
+                if not probe.is_valid:
+                    return False
+
                 console.print(f"  Extracting and converting {itcont_name}...")
 
-                with zf.open(itcont_name) as f:
-                    # Read pipe-delimited file
-                    df = pl.read_csv(
-                        f,
-                        separator="|",
-                        has_header=False,
-                        new_columns=headers,
-                        infer_schema_length=10000,
-                        ignore_errors=True,
-                        quote_char=None,
-                        truncate_ragged_lines=True,
-                        encoding="utf8-lossy",
+                with (
+                    span("individual.process_zip", cycle=cycle) as s,
+                    create_processing_progress(console) as progress,
+                    zf.open(itcont_name) as f,
+                ):
+                    # Read pipe-delimited file straight from the archive, with
+                    # progress following the uncompressed bytes consumed
+                    task = progress.add_task("Reading...", total=zf.getinfo(itcont_name).file_size)
+                    reader = ReadProgress(progress, task, s)
+                    quarantine = (
+                        Quarantine(get_quarantine_path(self.output_dir, "individual_contributions", cycle))
+                        if self.quarantine
+                        else None
                     )
+                    df = read_fec_pipe_delimited_blocks(f, headers, on_block=reader, quarantine=quarantine)
+                    console.print(f"  {reader.summary()}")
+                    if quarantine is not None and quarantine.rows:
+                        s.add(rows_quarantined=quarantine.rows)
+                        console.print(f"  [yellow]{quarantine.summary()}[/yellow]")
+                    progress.update(task, description="Capitalizing names and writing...")
 
                     # Apply name capitalization to contributor name fields
                     name_columns = ["name", "employer", "occupation"]
                     for col in name_columns:
                         if col in df.columns:
                             df = df.with_columns(
-                                pl.col(col)
-                                .map_elements(capitalize_name, return_dtype=pl.Utf8)
-                                .alias(col)
+                                map_distinct(pl.col(col), capitalize_name, pl.Utf8).alias(col)
                             )
 
                     # Prepend election_cycle column
-                    df = df.with_columns(pl.lit(cycle).alias("election_cycle"))
+                    df = df.with_columns(pl.lit(cycle, dtype=pl.Int64).alias("election_cycle"))
 
                     # Reorder to put election_cycle first
                     cols = ["election_cycle"] + headers
                     df = df.select(cols)
 
-                    # Write as CSV
+                    # Write as CSV; a sidecar of an earlier download no
+                    # longer lines up with the new rows
+                    get_sidecar_path(output_path).unlink(missing_ok=True)
                     df.write_csv(output_path)
+                    record_output(output_path, rows=len(df))
+                    s.add(rows_out=len(df), bytes_written=file_size(output_path))
 
             return True
 
@@ -126,20 +250,20 @@ class IndividualDownloader:
         console.print(f"\n[bold]{cycle}:[/bold] {url}")
 
         async with httpx.AsyncClient(timeout=600.0) as client:
-            with create_download_progress(console) as progress:
-                with TemporaryDirectory() as tmpdir:
-                    zip_path = Path(tmpdir) / f"indiv{str(cycle)[2:]}.zip"
+            with TemporaryDirectory() as tmpdir:
+                zip_path = Path(tmpdir) / f"indiv{str(cycle)[2:]}.zip"
 
+                with create_download_progress(console) as progress:
                     success = await download_with_retry(client, url, zip_path, progress)
-                    if not success:
-                        return False
+                if not success:
+                    return False
 
-                    success = self.process_zip(zip_path, cycle, headers, output_path)
-                    if success:
-                        size_mb = output_path.stat().st_size / (1024 * 1024)
-                        console.print(f"  [green]Wrote {output_path.name} ({size_mb:.1f} MB)[/green]")
+                success = self.process_zip(zip_path, cycle, headers, output_path)
+                if success:
+                    size_mb = output_path.stat().st_size / (1024 * 1024)
+                    console.print(f"  [green]Wrote {output_path.name} ({size_mb:.1f} MB)[/green]")
 
-                    return success
+                return success
 
     def download_all(self, dry_run: bool = False, cycles: list[int] | None = None) -> tuple[int, int, int]:
         """Download all cycles.
@@ -176,10 +300,17 @@ class IndividualDownloader:
 
 
 class TransactionYearAdder:
-    """Adds transaction_year column to individual contribution files."""
+    """Adds transaction_year column to individual contribution files.
+
+    In sidecar mode, derived date columns (transaction_year, transaction_month,
+    transaction_date) are written to a compact per-cycle Parquet sidecar
+    aligned with the CSV by row number, instead of rewriting the CSV.
+    read_fec_csv zips the sidecar onto the base file transparently.
+    """
 
-    def __init__(self, input_dir: Path):
+    def __init__(self, input_dir: Path, sidecar: bool = False):
         self.input_dir = input_dir
+        self.sidecar = sidecar
 
     def process_file(self, input_file: Path, dry_run: bool = False, force: bool = False) -> int:
         """Add transaction_year column to a CSV file.
@@ -192,13 +323,19 @@ class TransactionYearAdder:
         Returns:
             Number of rows processed
         """
+        if self.sidecar:
+            return self.write_sidecar(input_file, dry_run=dry_run, force=force)
+
         console.print(f"Processing {input_file.name}...")
 
-        with create_spinner_progress(console) as progress:
-            task = progress.add_task("Reading file...", total=None)
+        with (
+            span("individual.add_year", file=input_file.name) as s,
+            create_processing_progress(console) as progress,
+        ):
+            task = progress.add_task("Reading file...", total=file_size(input_file))
 
-            # Read the CSV
-            df = read_fec_csv(input_file)
+            # Read the CSV (without any sidecar, since the base file is rewritten)
+            df = read_fec_csv_blocks(input_file, with_sidecar=False, on_block=ReadProgress(progress, task, s))
 
             # Check if transaction_year already exists
             if "transaction_year" in df.columns and not force:
@@ -213,9 +350,7 @@ class TransactionYearAdder:
 
             # Extract year from transaction_dt
             df = df.with_columns(
-                pl.col("transaction_dt")
-                .cast(pl.Utf8)
-                .map_elements(extract_year_from_date, return_dtype=pl.Int64)
+                map_distinct(pl.col("transaction_dt").cast(pl.Utf8), extract_year_from_date, pl.Int64)
                 .alias("transaction_year")
             )
 
@@ -234,14 +369,78 @@ class TransactionYearAdder:
 
             progress.update(task, description="Writing file...")
 
-            # Write atomically
+            # Write atomically (rows stay in place, so a current sidecar still lines up)
+            keep_sidecar = is_sidecar_current(input_file)
             atomic_write_csv(df, input_file)
+            if keep_sidecar:
+                restamp_sidecar(input_file)
+            s.add(rows_out=row_count, bytes_written=file_size(input_file))
 
             progress.update(task, description="Done")
 
         console.print(f"  → {row_count:,} rows written")
         return row_count
 
+    def write_sidecar(self, input_file: Path, dry_run: bool = False, force: bool = False) -> int:
+        """Write derived date columns for a CSV file to its sidecar.
+
+        Streams the sub_id and transaction_dt columns from the CSV; the CSV
+        itself is never rewritten. The sidecar records the CSV's fingerprint,
+        and a sidecar written before the CSV last changed is recomputed.
+
+        Args:
+            input_file: Path to the individual contributions CSV
+            dry_run: If True, don't write the sidecar
+            force: If True, recompute even if a current sidecar exists
+
+        Returns:
+            Number of rows processed
+        """
+        console.print(f"Processing {input_file.name}...")
+
+        sidecar_path = get_sidecar_path(input_file)
+        if sidecar_path.exists() and not force:
+            if is_sidecar_current(input_file):
+                row_count = pl.scan_parquet(sidecar_path).select(pl.len()).collect().item()
+                console.print(f"  [yellow]Skipping: {sidecar_path.name} already exists (use --force to recompute)[/yellow]")
+                return row_count
+            console.print(f"  [yellow]{sidecar_path.name} is stale, recomputing[/yellow]")
+
+        with (
+            span("individual.add_year", file=input_file.name, sidecar=True) as s,
+            create_spinner_progress(console) as progress,
+        ):
+            s.add(bytes_read=file_size(input_file))
+            task = progress.add_task("Extracting derived date columns...", total=None)
+
+            date_str = pl.col("transaction_dt").cast(pl.Utf8)
+            derived = read_fec_csv(input_file, lazy=True, with_sidecar=False).select(
+                pl.col(SIDECAR_KEY_COLUMN),
+                map_distinct(date_str, extract_year_from_date, pl.Int64).alias("transaction_year"),
+                map_distinct(date_str, extract_month_from_date, pl.Int64).alias("transaction_month"),
+                map_distinct(date_str, convert_to_iso_date, pl.Utf8).alias("transaction_date"),
+            )
+
+            if dry_run:
+                row_count = derived.select(pl.len()).collect().item()
+                console.print(f"  [dim]Would write {row_count:,} rows to {sidecar_path.name}[/dim]")
+                return row_count
+
+            # Write atomically
+            temp_path = sidecar_path.with_suffix(".parquet.tmp")
+            derived.sink_parquet(temp_path, metadata=sidecar_metadata(input_file))
+            temp_path.rename(sidecar_path)
+            s.add(bytes_written=file_size(sidecar_path))
+
+            row_count = pl.scan_parquet(sidecar_path).select(pl.len()).collect().item()
+            record_output(sidecar_path, rows=row_count)
+
+            progress.update(task, description="Done")
+
+        size_mb = sidecar_path.stat().st_size / (1024 * 1024)
+        console.print(f"  → {row_count:,} rows written to {sidecar_path.name} ({size_mb:.1f} MB)")
+        return row_count
+
     def process_all(
         self, cycle: int | None = None, dry_run: bool = False, force: bool = False
     ) -> int:
@@ -277,13 +476,38 @@ class TransactionYearAdder:
         return total_rows
 
 
+def cycle_lookup_digest(committee_lookup: pl.DataFrame, cycle: int) -> str:
+    """Digest of the committee lookup rows one cycle's summary depends on.
+
+    Covers the IDs and their dictionary keys, since cached partials hold
+    keys. Dictionary keys are append-only, so adding IDs for other cycles
+    does not change a cycle's digest.
+    """
+    rows = (
+        committee_lookup.filter(pl.col("election_cycle") == cycle)
+        .select(["cmte_id", "cand_id", "cmte_key", "cand_key"])
+        .sort(["cmte_id", "cand_id"])
+    )
+    return hashlib.blake2b(rows.write_csv().encode(), digest_size=16).hexdigest()
+
+
 class IndividualSummarizer:
     """Aggregates individual contributions by candidate."""
 
-    def __init__(self, data_dir: Path, individual_dir: Path, output_file: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        individual_dir: Path,
+        output_file: Path,
+        cache_dir: Path | None = None,
+        use_cache: bool = True,
+        workers: int = 1,
+    ):
         self.data_dir = data_dir
         self.individual_dir = individual_dir
         self.output_file = output_file
+        self.workers = workers
+        self.cache = FrameCache(cache_dir or get_default_cache_dir(data_dir), enabled=use_cache)
 
     def normalize_name(self, name: str | None) -> str:
         """Normalize candidate name for matching."""
@@ -392,82 +616,118 @@ class IndividualSummarizer:
         console.print(f"  → {len(df):,} committee-candidate mappings")
         return df
 
+    def get_committee_lookup(self, committee_file: Path) -> pl.DataFrame:
+        """Get the committee lookup, reusing the cached copy if the source is unchanged."""
+        lookup, cached = self.cache.get_or_build(
+            "committee_lookup",
+            [committee_file],
+            lambda: self.load_committee_lookup(committee_file),
+            version=LOOKUP_CACHE_VERSION,
+        )
+        if cached:
+            console.print(f"Loaded committee lookup from cache ({len(lookup):,} mappings)")
+        return lookup
+
+    def get_bioguide_lookup(self, crosswalk_file: Path, candidate_file: Path) -> pl.DataFrame:
+        """Get the expanded bioguide crosswalk, reusing the cached copy if sources are unchanged."""
+        lookup, cached = self.cache.get_or_build(
+            "bioguide_lookup",
+            [crosswalk_file, candidate_file],
+            lambda: self.load_bioguide_crosswalk(crosswalk_file, candidate_file),
+            version=LOOKUP_CACHE_VERSION,
+        )
+        if cached:
+            console.print(f"Loaded bioguide crosswalk from cache ({len(lookup):,} mappings)")
+        return lookup
+
     def process_cycle(
-        self, input_file: Path, cycle: int, committee_lookup: pl.DataFrame
+        self,
+        input_file: Path,
+        cycle: int,
+        committee_lookup: pl.DataFrame,
+        show_progress: bool = True,
     ) -> pl.DataFrame:
-        """Process a single cycle's contributions."""
+        """Process a single cycle's contributions.
+
+        The cycle file is read in blocks: only the needed columns are parsed,
+        and each block is restricted to candidate-committee rows before the
+        rows are deduplicated and aggregated, so memory scales with
+        candidate-committee rows rather than the full width of the file.
+        Progress follows the bytes read, with rows/s and an ETA.
+
+        The committee lookup must carry integer cmte_key and cand_key columns
+        (see summarize_all); the result is grouped by cand_key.
+        """
         console.print(f"Processing {input_file.name}...")
 
-        with create_spinner_progress(console) as progress:
-            task = progress.add_task("Reading file...", total=None)
+        with (
+            span("individual.process_cycle", cycle=cycle) as s,
+            create_processing_progress(console, disable=not show_progress) as progress,
+        ):
+            task = progress.add_task("Reading and filtering...", total=file_size(input_file))
 
-            cycle_lookup = committee_lookup.filter(pl.col("election_cycle") == cycle)
+            cycle_lookup = committee_lookup.filter(pl.col("election_cycle") == cycle).select(
+                ["cmte_id", "cmte_key", "cand_key"]
+            )
 
             if len(cycle_lookup) == 0:
                 console.print(f"  [yellow]No candidate committees for cycle {cycle}[/yellow]")
                 return pl.DataFrame()
 
-            df = pl.scan_csv(
-                input_file,
-                infer_schema_length=10000,
-                ignore_errors=True,
-                encoding="utf8-lossy",
-            )
-
-            progress.update(task, description="Filtering memos and amendments...")
+            # Derived date columns come from a sidecar (or an earlier in-place
+            # add-year) when available, otherwise they are computed below
+            available = read_fec_csv(input_file, lazy=True).collect_schema().names()
+            derived = [c for c in ("transaction_year", "transaction_month") if c in available]
+            committees = cycle_lookup.select(["cmte_id", "cmte_key"]).unique()
 
-            df = df.filter(
-                (pl.col("memo_cd").is_null()) | (pl.col("memo_cd") != "X")
-            )
+            def filter_block(lf: pl.LazyFrame) -> pl.LazyFrame:
+                lf = lf.select(INDIVIDUAL_SUMMARY_COLUMNS + derived).with_columns(
+                    # Aggregate amounts as exact integer cents
+                    parse_cents(pl.col("transaction_amt"))
+                )
 
-            df = df.filter(
-                (pl.col("amndt_ind").is_null()) | (pl.col("amndt_ind") == "N")
-            )
+                # Filter memos and amendments
+                lf = lf.filter(
+                    ((pl.col("memo_cd").is_null()) | (pl.col("memo_cd") != "X"))
+                    & ((pl.col("amndt_ind").is_null()) | (pl.col("amndt_ind") == "N"))
+                )
 
-            df = df.unique(subset=["sub_id"], keep="first")
+                # Encode committee IDs as integer keys. Only candidate committees
+                # have a key, so other rows are dropped before the (expensive) dedup
+                return lf.with_columns(
+                    pl.col("cmte_id")
+                    .replace_strict(committees["cmte_id"], committees["cmte_key"], default=None)
+                    .alias("cmte_key")
+                ).filter(pl.col("cmte_key").is_not_null())
 
-            progress.update(task, description="Joining with committee lookup...")
-
-            df = df.select([
-                "election_cycle",
-                "cmte_id",
-                "transaction_dt",
-                "transaction_amt",
-            ])
-
-            df = df.collect()
+            reader = ReadProgress(progress, task, s)
+            df = read_fec_csv_blocks(input_file, transform=filter_block, on_block=reader).lazy()
+            if show_progress:
+                console.print(f"  {reader.summary()}")
 
+            df = df.unique(subset=["sub_id"], keep="first")
             df = df.join(
-                cycle_lookup.select(["cmte_id", "cand_id"]),
-                on="cmte_id",
-                how="inner",
+                cycle_lookup.lazy().select(["cmte_key", "cand_key"]), on="cmte_key", how="inner"
             )
 
-            if len(df) == 0:
-                console.print(f"  [yellow]No matching contributions for cycle {cycle}[/yellow]")
-                return pl.DataFrame()
-
-            progress.update(task, description="Extracting dates...")
-
-            df = df.with_columns(
-                pl.col("transaction_dt")
-                .cast(pl.Utf8)
-                .map_elements(extract_year_from_date, return_dtype=pl.Int64)
-                .alias("transaction_year")
-            )
+            df = df.with_columns(pl.lit(cycle, dtype=pl.Int64).alias("election_cycle"))
 
-            if cycle == 2026:
+            # Dates repeat heavily within a cycle, so parse each distinct one once
+            date_str = pl.col("transaction_dt").cast(pl.Utf8)
+            if "transaction_year" not in derived:
                 df = df.with_columns(
-                    pl.col("transaction_dt")
-                    .cast(pl.Utf8)
-                    .map_elements(extract_month_from_date, return_dtype=pl.Int64)
-                    .alias("transaction_month")
+                    map_distinct(date_str, extract_year_from_date, pl.Int64).alias("transaction_year")
                 )
-                group_cols = ["election_cycle", "cand_id", "transaction_year", "transaction_month"]
-            else:
-                group_cols = ["election_cycle", "cand_id", "transaction_year"]
 
-            progress.update(task, description="Aggregating...")
+            if cycle == 2026:
+                if "transaction_month" not in derived:
+                    df = df.with_columns(
+                        map_distinct(date_str, extract_month_from_date, pl.Int64)
+                        .alias("transaction_month")
+                    )
+                group_cols = ["election_cycle", "cand_key", "transaction_year", "transaction_month"]
+            else:
+                group_cols = ["election_cycle", "cand_key", "transaction_year"]
 
             result = (
                 df.group_by(group_cols)
@@ -484,16 +744,128 @@ class IndividualSummarizer:
                 "election_cycle",
                 "transaction_year",
                 "transaction_month",
-                "cand_id",
+                "cand_key",
                 "total_raised",
                 "transaction_count",
             ])
 
+            progress.update(task, description="Deduplicating and aggregating...")
+
+            capture_plan(f"individual_{cycle}", result, streaming=True)
+            result = collect_streaming(result)
+            s.add(rows_out=len(result))
+
             progress.update(task, description="Done")
 
+        if len(result) == 0:
+            console.print(f"  [yellow]No matching contributions for cycle {cycle}[/yellow]")
+            return pl.DataFrame()
+
         console.print(f"  → {len(result):,} candidate-year groups")
         return result
 
+    def summarize_cycles(
+        self,
+        files: list[tuple[int, Path]],
+        committee_lookup: pl.DataFrame,
+    ) -> list[pl.DataFrame]:
+        """Summarize each cycle, reusing cached partials for unchanged cycles.
+
+        A cycle's partial aggregate is reused when neither its input file nor
+        that cycle's rows of the committee lookup changed since it was
+        computed, so a refresh of the current cycle's committees leaves the
+        other cycles cached.
+
+        Args:
+            files: (cycle, path) pairs to summarize
+            committee_lookup: Committee-to-candidate lookup with integer keys
+
+        Returns:
+            Per-cycle results in the same order as files
+        """
+        results: dict[int, pl.DataFrame] = {}
+        stale: list[tuple[int, Path, str]] = []
+
+        for c, file_path in files:
+            key = self.cache.key_for(
+                [file_path],
+                lookup=cycle_lookup_digest(committee_lookup, c),
+                version=CYCLE_CACHE_VERSION,
+            )
+            cached = self.cache.load(f"individual_cycle_{c}", key)
+            if cached is not None:
+                results[c] = cached
+            else:
+                stale.append((c, file_path, key))
+
+        if results:
+            console.print(
+                f"Reusing cached summaries for {len(results)} unchanged cycle(s), "
+                f"{len(stale)} to process\n"
+            )
+
+        workers = get_max_parallel_cycles([f for _, f, _ in stale], self.workers)
+
+        if workers > 1:
+            console.print(f"Processing {len(stale)} cycle(s) with {workers} workers\n")
+            computed = self.process_cycles_parallel(
+                [(c, f) for c, f, _ in stale], committee_lookup, workers
+            )
+        else:
+            computed = {
+                c: self.process_cycle(file_path, c, committee_lookup)
+                for c, file_path, _ in stale
+            }
+
+        for c, _, key in stale:
+            self.cache.store(f"individual_cycle_{c}", key, computed[c])
+            results[c] = computed[c]
+
+        return [results[c] for c, _ in files]
+
+    def process_cycles_parallel(
+        self,
+        files: list[tuple[int, Path]],
+        committee_lookup: pl.DataFrame,
+        workers: int,
+    ) -> dict[int, pl.DataFrame]:
+        """Run process_cycle for several cycles concurrently in worker processes.
+
+        Workers share the (key-encoded) committee lookup through a temporary
+        Arrow IPC file, which is memory-mapped rather than copied.
+
+        Returns:
+            Mapping of cycle to its result
+        """
+        with TemporaryDirectory() as tmpdir:
+            lookup_path = Path(tmpdir) / "committee_lookup.arrow"
+            committee_lookup.write_ipc(lookup_path, compression="uncompressed")
+
+            # Spawn (not fork) so each worker starts with a fresh Polars thread pool
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                futures = {
+                    c: pool.submit(
+                        run_with_spans,
+                        "individual.cycle_worker",
+                        _process_cycle_worker,
+                        self.data_dir,
+                        self.individual_dir,
+                        self.output_file,
+                        file_path,
+                        c,
+                        lookup_path,
+                        cycle=c,
+                    )
+                    for c, file_path in files
+                }
+
+                results = {}
+                for c, future in futures.items():
+                    results[c], spans = future.result()
+                    get_report().extend(spans)
+                return results
+
     def summarize_all(self, cycle: int | None = None, dry_run: bool = False) -> None:
         """Aggregate all individual contributions by candidate."""
         committee_file = self.data_dir / "committee_registrations_1980-2026.csv"
@@ -501,11 +873,27 @@ class IndividualSummarizer:
             console.print(f"[red]Error: Committee file not found: {committee_file}[/red]")
             raise SystemExit(1)
 
-        committee_lookup = self.load_committee_lookup(committee_file)
+        committee_lookup = self.get_committee_lookup(committee_file)
 
         bioguide_file = self.data_dir / "cand_id_bioguide_crosswalk.csv"
         candidate_file = self.data_dir / "candidate_registrations_1980-2026.csv"
-        bioguide_lookup = self.load_bioguide_crosswalk(bioguide_file, candidate_file)
+        bioguide_lookup = self.get_bioguide_lookup(bioguide_file, candidate_file)
+
+        # Joins and group-bys run on integer keys from the persistent ID dictionary
+        ids = IdDictionary(get_id_dictionary_path(self.data_dir))
+        ids.update(
+            pl.concat([
+                committee_lookup["cmte_id"].cast(pl.Utf8),
+                committee_lookup["cand_id"].cast(pl.Utf8),
+                bioguide_lookup["cand_id"].cast(pl.Utf8),
+            ])
+        )
+        ids.save()
+
+        committee_lookup = committee_lookup.with_columns(
+            ids.encode(pl.col("cmte_id")).alias("cmte_key"),
+            ids.encode(pl.col("cand_id")).alias("cand_key"),
+        )
 
         if cycle:
             files = [(cycle, self.individual_dir / f"{cycle}_individual_contributions.csv")]
@@ -524,11 +912,9 @@ class IndividualSummarizer:
 
         console.print(f"\nFound {len(files)} file(s) to process\n")
 
-        all_results = []
-        for c, file_path in files:
-            result = self.process_cycle(file_path, c, committee_lookup)
-            if len(result) > 0:
-                all_results.append(result)
+        with span("individual.summarize_cycles", cycles=[c for c, _ in files]):
+            cycle_results = self.summarize_cycles(files, committee_lookup)
+        all_results = [result for result in cycle_results if len(result) > 0]
 
         if not all_results:
             console.print("[yellow]No results to write[/yellow]")
@@ -539,10 +925,16 @@ class IndividualSummarizer:
 
         if len(bioguide_lookup) > 0:
             console.print("Joining with bioguide crosswalk...")
-            combined = combined.join(bioguide_lookup, on="cand_id", how="left")
+            bioguide_lookup = bioguide_lookup.select(
+                ids.encode(pl.col("cand_id").cast(pl.Utf8)).alias("cand_key"), "bioguide_id"
+            )
+            combined = combined.join(bioguide_lookup, on="cand_key", how="left")
         else:
             combined = combined.with_columns(pl.lit(None).cast(pl.Utf8).alias("bioguide_id"))
 
+        # Output files keep the FEC ID strings
+        combined = combined.with_columns(ids.decode(pl.col("cand_key")).alias("cand_id"))
+
         combined = combined.select([
             "election_cycle",
             "transaction_year",
@@ -555,6 +947,9 @@ class IndividualSummarizer:
 
         combined = combined.sort(["election_cycle", "transaction_year", "transaction_month", "cand_id"])
 
+        # Per-cycle totals are kept in cents; convert to dollars only for output
+        combined = combined.with_columns(cents_to_dollars(pl.col("total_raised")))
+
         console.print(f"  → {len(combined):,} total rows")
 
         if dry_run:
@@ -564,6 +959,8 @@ class IndividualSummarizer:
             return
 
         console.print(f"\nWriting to {self.output_file}...")
-        atomic_write_csv(combined, self.output_file)
+        with span("individual.write_output") as s:
+            atomic_write_csv(combined, self.output_file)
+            s.add(rows_out=len(combined), bytes_written=file_size(self.output_file))
 
         console.print(f"[green]Done![/green] Wrote {len(combined):,} rows to {self.output_file.name}")
@@ -7,9 +7,14 @@ from rich.console import Console
 
 from ..config import SummarizeDataset
 from ..utils.dates import extract_year_from_date
-from ..utils.io import atomic_write_csv, read_fec_pipe_delimited
+from ..utils.instrument import file_size, span
+from ..utils.io import atomic_write_csv, read_fec_pipe_delimited_blocks
+from ..utils.money import cents_to_dollars, dollars_to_cents
 from ..utils.names import capitalize_name
-from ..utils.progress import create_spinner_progress
+from ..utils.profiling import capture_plan
+from ..utils.progress import ReadProgress, create_processing_progress
+from ..utils.quarantine import Quarantine, get_quarantine_path
+from ..utils.transforms import map_distinct
 
 console = Console()
 
@@ -17,9 +22,10 @@ console = Console()
 class SummarizeProcessor:
     """Processes summarize-strategy datasets (aggregation with deduplication)."""
 
-    def __init__(self, dataset: SummarizeDataset, data_dir: Path):
+    def __init__(self, dataset: SummarizeDataset, data_dir: Path, quarantine: bool = False):
         self.dataset = dataset
         self.data_dir = data_dir
+        self.quarantine = quarantine
 
     def process_cycle(self, input_file: Path, cycle: int) -> pl.DataFrame:
         """Process a single cycle's data file with filtering and aggregation.
@@ -33,57 +39,50 @@ class SummarizeProcessor:
         """
         console.print(f"    Processing {input_file.name}...")
 
-        with create_spinner_progress(console) as progress:
-            task = progress.add_task("Reading file...", total=None)
-
-            # Read pipe-delimited file with lazy evaluation for memory efficiency
-            df = read_fec_pipe_delimited(input_file, self.dataset.input_columns, lazy=True)
-
-            progress.update(task, description="Filtering memos and amendments...")
-
-            # Filter out memo transactions (memo_cd = 'X')
-            df = df.filter(
-                (pl.col(self.dataset.memo_field).is_null())
-                | (pl.col(self.dataset.memo_field) != "X")
+        with (
+            span("summarize.process_cycle", dataset=self.dataset.name, cycle=cycle) as s,
+            create_processing_progress(console) as progress,
+        ):
+            task = progress.add_task("Reading and filtering...", total=file_size(input_file))
+            reader = ReadProgress(progress, task, s)
+            quarantine = (
+                Quarantine(get_quarantine_path(self.data_dir, self.dataset.name, cycle))
+                if self.quarantine
+                else None
             )
 
-            # Filter out amendments (amndt_ind != 'N')
-            df = df.filter(
-                (pl.col(self.dataset.amendment_field).is_null())
-                | (pl.col(self.dataset.amendment_field) == "N")
-            )
+            # Read the pipe-delimited file in blocks, with amounts as exact
+            # integer cents, keeping only the rows and columns aggregated below
+            df = read_fec_pipe_delimited_blocks(
+                input_file,
+                self.dataset.input_columns,
+                amount_columns=[self.dataset.amount_field],
+                transform=self._filter_block,
+                on_block=reader,
+                quarantine=quarantine,
+            ).lazy()
+            console.print(f"    {reader.summary()}")
+
+            if quarantine is not None and quarantine.rows:
+                s.add(rows_quarantined=quarantine.rows)
+                console.print(f"    [yellow]{quarantine.summary()}[/yellow]")
 
             # Deduplicate by sub_id
             df = df.unique(subset=[self.dataset.sub_id_field], keep="first")
 
             progress.update(task, description="Extracting transaction year...")
 
-            # Extract transaction_year from date field
-            # Use map_elements for the date parsing
+            # Extract transaction_year from date field, parsing each distinct
+            # date once rather than once per transaction
             df = df.with_columns(
-                pl.col(self.dataset.date_field)
-                .map_elements(extract_year_from_date, return_dtype=pl.Int64)
+                map_distinct(pl.col(self.dataset.date_field).cast(pl.Utf8), extract_year_from_date, pl.Int64)
                 .alias("transaction_year")
             )
 
             progress.update(task, description="Aggregating...")
 
-            # Add election_cycle
-            df = df.with_columns(pl.lit(cycle).alias("election_cycle"))
-
-            # Build the columns for grouping based on column_mapping
-            group_cols = []
-            for out_col in self.dataset.group_by:
-                if out_col in ("election_cycle", "transaction_year"):
-                    group_cols.append(pl.col(out_col))
-                elif out_col in self.dataset.column_mapping:
-                    in_col = self.dataset.column_mapping[out_col]
-                    group_cols.append(pl.col(in_col).alias(out_col))
-                else:
-                    group_cols.append(pl.col(out_col))
-
-            # Select columns for grouping
-            select_cols = [pl.lit(cycle).alias("election_cycle"), pl.col("transaction_year")]
+            # Select columns for grouping based on column_mapping
+            select_cols = [pl.lit(cycle, dtype=pl.Int64).alias("election_cycle"), pl.col("transaction_year")]
             for out_col in self.dataset.group_by:
                 if out_col in ("election_cycle", "transaction_year"):
                     continue
@@ -97,42 +96,69 @@ class SummarizeProcessor:
 
             df = df.select(select_cols)
 
-            # Apply name capitalization if configured
-            if self.dataset.name_columns:
-                for col in self.dataset.name_columns:
-                    if col in df.columns:
-                        df = df.with_columns(
-                            pl.col(col)
-                            .map_elements(capitalize_name, return_dtype=pl.Utf8)
-                            .alias(col)
-                        )
-
-            # Group and aggregate
-            result = (
-                df.group_by(self.dataset.group_by)
-                .agg(
-                    pl.col("amount").sum().alias("total_amount"),
-                    pl.len().alias("transaction_count"),
-                )
-                .collect()
+            # Group and aggregate on the raw keys
+            df = df.group_by(self.dataset.group_by).agg(
+                pl.col("amount").sum().alias("total_amount"),
+                pl.len().alias("transaction_count"),
             )
 
+            # Apply name capitalization if configured. Capitalization is
+            # deterministic, so it runs on the aggregated keys instead of every
+            # transaction; keys that differ only in case collapse to the same
+            # name and are merged by re-aggregating.
+            name_columns = [col for col in self.dataset.name_columns if col in self.dataset.group_by]
+            if name_columns:
+                df = df.with_columns(
+                    map_distinct(pl.col(col), capitalize_name, pl.Utf8).alias(col)
+                    for col in name_columns
+                ).group_by(self.dataset.group_by).agg(
+                    pl.col("total_amount").sum(),
+                    pl.col("transaction_count").sum(),
+                )
+
+            # Sums stay exact in cents until write_output
+            capture_plan(f"summarize_{self.dataset.name}_{cycle}", df)
+            result = df.collect()
+            s.add(rows_out=len(result))
+
             progress.update(task, description="Done")
 
         console.print(f"    → {len(result):,} aggregated rows")
         return result
 
+    def _filter_block(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Drop memos and amendments from a block and keep the columns used."""
+        ds = self.dataset
+
+        # Filter out memo transactions (memo_cd = 'X')
+        lf = lf.filter(pl.col(ds.memo_field).is_null() | (pl.col(ds.memo_field) != "X"))
+
+        # Filter out amendments (amndt_ind != 'N')
+        lf = lf.filter(pl.col(ds.amendment_field).is_null() | (pl.col(ds.amendment_field) == "N"))
+
+        columns = [ds.sub_id_field, ds.date_field, ds.amount_field]
+        for out_col in ds.group_by:
+            if out_col not in ("election_cycle", "transaction_year"):
+                columns.append(ds.column_mapping.get(out_col, out_col))
+        return lf.select(list(dict.fromkeys(columns)))
+
     def get_output_path(self) -> Path:
         """Get the output file path."""
         return self.data_dir / self.dataset.output_file
 
     def read_existing(self) -> pl.DataFrame | None:
-        """Read existing output file if it exists."""
+        """Read existing output file if it exists (amounts in cents)."""
         output_path = self.get_output_path()
         if not output_path.exists():
             return None
 
-        return pl.read_csv(output_path)
+        with span("summarize.read_existing", dataset=self.dataset.name) as s:
+            # Typed explicitly: inference from leading rows must not pick an integer type
+            df = pl.read_csv(output_path, schema_overrides={"total_amount": pl.Float64}).with_columns(
+                dollars_to_cents(pl.col("total_amount"))
+            )
+            s.add(bytes_read=file_size(output_path), rows_out=len(df))
+        return df
 
     def remove_cycle(self, df: pl.DataFrame, cycle: int) -> pl.DataFrame:
         """Remove all rows for a given cycle."""
@@ -143,7 +169,8 @@ class SummarizeProcessor:
         if existing is None:
             return new_data
 
-        return pl.concat([existing, new_data])
+        # Relaxed so new cycles match dtypes inferred when re-reading the CSV
+        return pl.concat([existing, new_data], how="vertical_relaxed")
 
     def write_output(self, df: pl.DataFrame, backup: bool = True) -> None:
         """Write output file with optional backup."""
@@ -153,8 +180,13 @@ class SummarizeProcessor:
         sort_cols = [col for col in self.dataset.group_by if col in df.columns]
         df = df.sort(sort_cols)
 
+        # Amounts are exact in cents; written as exact dollar text
+        df = df.with_columns(cents_to_dollars(pl.col("total_amount")))
+
         # Write atomically using shared utility
-        atomic_write_csv(df, output_path, backup=backup)
+        with span("summarize.write_output", dataset=self.dataset.name) as s:
+            atomic_write_csv(df, output_path, backup=backup)
+            s.add(rows_out=len(df), bytes_written=file_size(output_path))
 
         console.print(f"    Wrote {output_path.name}: {len(df):,} rows")
 
@@ -1,18 +1,36 @@
 """Shared utilities for FEC data processing."""
 
+from .cache import FrameCache
 from .dates import extract_year_from_date, extract_month_from_date, convert_to_iso_date
-from .io import atomic_write_csv, read_fec_csv, read_fec_pipe_delimited
+from .fingerprint import FileFingerprint, fingerprint_file
+from .ids import IdDictionary
+from .instrument import get_report, span
+from .io import atomic_write_csv, get_sidecar_path, read_fec_csv, read_fec_pipe_delimited
+from .money import cents_to_dollars, dollars_to_cents, parse_cents
 from .names import capitalize_name
-from .progress import create_download_progress, create_spinner_progress
+from .progress import create_download_progress, create_processing_progress, create_spinner_progress
+from .transforms import map_distinct
 
 __all__ = [
+    "FrameCache",
     "extract_year_from_date",
     "extract_month_from_date",
     "convert_to_iso_date",
+    "FileFingerprint",
+    "fingerprint_file",
+    "IdDictionary",
+    "get_report",
+    "span",
     "atomic_write_csv",
+    "get_sidecar_path",
     "read_fec_csv",
     "read_fec_pipe_delimited",
+    "cents_to_dollars",
+    "dollars_to_cents",
+    "parse_cents",
     "capitalize_name",
     "create_download_progress",
+    "create_processing_progress",
     "create_spinner_progress",
+    "map_distinct",
 ]
@@ -0,0 +1,109 @@
+"""Persistent on-disk cache for derived DataFrames.
+
+Derived tables are stored as Arrow IPC files so they can be memory-mapped
+on load. Each entry is keyed by the fingerprints (size, mtime, sampled hash)
+of the source files it was built from, so a changed source invalidates it.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+import polars as pl
+
+from .fingerprint import combined_digest, fingerprint_files
+
+# Cache directory name, created next to the data directory
+CACHE_DIR_NAME = ".fec_cache"
+
+
+def get_default_cache_dir(data_dir: Path) -> Path:
+    """Get the default cache directory for a data directory."""
+    return data_dir.parent / CACHE_DIR_NAME
+
+
+class FrameCache:
+    """Stores DataFrames as Arrow IPC files keyed by source fingerprints."""
+
+    def __init__(self, cache_dir: Path, enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+
+    def path_for(self, name: str) -> Path:
+        """Get the Arrow IPC path for a cache entry."""
+        return self.cache_dir / f"{name}.arrow"
+
+    def _meta_path(self, name: str) -> Path:
+        return self.cache_dir / f"{name}.json"
+
+    def key_for(self, sources: list[Path], **extra: Any) -> str:
+        """Compute the cache key for a set of source files plus extra key material."""
+        return combined_digest(fingerprint_files(sources), **extra)
+
+    def load(self, name: str, key: str) -> pl.DataFrame | None:
+        """Load a cache entry if present and built with the given key."""
+        if not self.enabled:
+            return None
+
+        data_path = self.path_for(name)
+        meta_path = self._meta_path(name)
+        if not data_path.exists() or not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if meta.get("key") != key:
+            return None
+
+        # Uncompressed IPC files are memory-mapped by Polars on read
+        return pl.read_ipc(data_path)
+
+    def store(self, name: str, key: str, df: pl.DataFrame) -> None:
+        """Write a cache entry atomically (data first, then metadata)."""
+        if not self.enabled:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        data_path = self.path_for(name)
+        temp_path = data_path.with_suffix(".arrow.tmp")
+        df.write_ipc(temp_path, compression="uncompressed")
+        temp_path.rename(data_path)
+
+        meta_path = self._meta_path(name)
+        temp_meta = meta_path.with_suffix(".json.tmp")
+        with open(temp_meta, "w") as f:
+            json.dump({"key": key, "rows": len(df)}, f)
+        temp_meta.rename(meta_path)
+
+    def get_or_build(
+        self,
+        name: str,
+        sources: list[Path],
+        build: Callable[[], pl.DataFrame],
+        **extra: Any,
+    ) -> tuple[pl.DataFrame, bool]:
+        """Load a cache entry, or build and store it if missing or stale.
+
+        Args:
+            name: Cache entry name
+            sources: Files the entry is derived from
+            build: Function that builds the DataFrame from the sources
+            **extra: Additional key material (e.g. a builder version)
+
+        Returns:
+            Tuple of (DataFrame, True if it was loaded from cache)
+        """
+        key = self.key_for(sources, **extra)
+
+        cached = self.load(name, key)
+        if cached is not None:
+            return cached, True
+
+        df = build()
+        self.store(name, key, df)
+        return df, False
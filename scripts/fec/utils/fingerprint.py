@@ -0,0 +1,101 @@
+"""File fingerprinting utilities.
+
+A fingerprint identifies the contents of a file cheaply enough to be
+recomputed on every run, even for multi-GB individual contribution files.
+It combines the file size and modification time with a hash of sampled
+blocks from the start, middle, and end of the file.
+"""
+
+import hashlib
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+# Size of each sampled block used for the content hash
+SAMPLE_BLOCK_SIZE = 1024 * 1024  # 1 MB
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Size, mtime, and sampled content hash of a file."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "FileFingerprint":
+        return cls(
+            size=raw["size"],
+            mtime_ns=raw["mtime_ns"],
+            digest=raw["digest"],
+        )
+
+
+def _sampled_digest(path: Path, size: int) -> str:
+    """Hash the first, middle, and last blocks of a file."""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str(size).encode())
+
+    with open(path, "rb") as f:
+        if size <= 3 * SAMPLE_BLOCK_SIZE:
+            hasher.update(f.read())
+        else:
+            for offset in (0, size // 2, size - SAMPLE_BLOCK_SIZE):
+                f.seek(offset)
+                hasher.update(f.read(SAMPLE_BLOCK_SIZE))
+
+    return hasher.hexdigest()
+
+
+def fingerprint_file(path: Path) -> FileFingerprint | None:
+    """Compute the fingerprint of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        FileFingerprint, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    return FileFingerprint(
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        digest=_sampled_digest(path, stat.st_size),
+    )
+
+
+def fingerprint_files(paths: list[Path]) -> dict[str, dict[str, Any] | None]:
+    """Fingerprint several files, keyed by path string.
+
+    Missing files are recorded as None so that their later appearance
+    is detected as a change.
+    """
+    result: dict[str, dict[str, Any] | None] = {}
+    for path in paths:
+        fp = fingerprint_file(path)
+        result[str(path)] = fp.to_dict() if fp else None
+    return result
+
+
+def combined_digest(fingerprints: dict[str, dict[str, Any] | None], **extra: Any) -> str:
+    """Reduce a set of fingerprints (plus extra key material) to one digest."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for path in sorted(fingerprints):
+        fp = fingerprints[path]
+        hasher.update(path.encode())
+        if fp is None:
+            hasher.update(b"missing")
+        else:
+            hasher.update(f"{fp['size']}:{fp['mtime_ns']}:{fp['digest']}".encode())
+    for key in sorted(extra):
+        hasher.update(f"{key}={extra[key]}".encode())
+    return hasher.hexdigest()
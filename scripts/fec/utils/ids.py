@@ -0,0 +1,85 @@
+"""Persistent integer dictionary for FEC committee and candidate IDs.
+
+FEC IDs are 9-character strings (C00000042, H2NY00123, ...). Joins and
+group-bys on them are much cheaper when the IDs are first replaced by dense
+32-bit integer keys. The dictionary is global (committee and candidate IDs
+share one key space, as their prefixes never collide) and append-only, so a
+key assigned once stays valid for every later run.
+"""
+
+from pathlib import Path
+
+import polars as pl
+
+# Dictionary file, stored next to the update state file
+ID_DICTIONARY_FILE = ".fec_id_dictionary.arrow"
+
+# Dtype of the integer keys
+ID_KEY_DTYPE = pl.UInt32
+
+
+def get_id_dictionary_path(data_dir: Path) -> Path:
+    """Get the ID dictionary path for a data directory."""
+    return data_dir.parent / ID_DICTIONARY_FILE
+
+
+class IdDictionary:
+    """Append-only mapping of FEC ID strings to dense UInt32 keys."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.table = pl.DataFrame(schema={"fec_id": pl.Utf8, "key": ID_KEY_DTYPE})
+        self._dirty = False
+
+        if path.exists():
+            self.table = pl.read_ipc(path)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def update(self, ids: pl.Series) -> int:
+        """Assign keys to IDs not yet in the dictionary.
+
+        New IDs are sorted before numbering so the keys do not depend on the
+        order rows happened to be read in.
+
+        Returns:
+            Number of IDs added
+        """
+        candidates = ids.cast(pl.Utf8).drop_nulls().unique()
+        candidates = candidates.filter(candidates != "")
+        new_ids = candidates.filter(~candidates.is_in(self.table["fec_id"])).sort()
+        if len(new_ids) == 0:
+            return 0
+
+        start = len(self.table)
+        added = pl.DataFrame({
+            "fec_id": new_ids,
+            "key": pl.int_range(start, start + len(new_ids), dtype=ID_KEY_DTYPE, eager=True),
+        })
+        self.table = pl.concat([self.table, added])
+        self._dirty = True
+        return len(added)
+
+    def encode(self, expr: pl.Expr) -> pl.Expr:
+        """Map an ID column to its integer keys (unknown IDs become null)."""
+        return expr.replace_strict(
+            self.table["fec_id"], self.table["key"], default=None, return_dtype=ID_KEY_DTYPE
+        )
+
+    def decode(self, expr: pl.Expr) -> pl.Expr:
+        """Map an integer key column back to ID strings."""
+        return expr.replace_strict(
+            self.table["key"], self.table["fec_id"], default=None, return_dtype=pl.Utf8
+        )
+
+    def save(self) -> None:
+        """Write the dictionary atomically if IDs were added."""
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".arrow.tmp")
+        self.table.write_ipc(temp_path, compression="uncompressed")
+        temp_path.rename(self.path)
+        self._dirty = False
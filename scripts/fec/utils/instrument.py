@@ -0,0 +1,225 @@
+"""Lightweight per-stage instrumentation.
+
+Stages are wrapped in spans, which record wall time, CPU time, rows in and
+out, bytes read and written, and the process's peak RSS when the span ends:
+
+    with span("summarize.process_cycle", dataset=name, cycle=cycle) as s:
+        s.add(bytes_read=input_file.stat().st_size)
+        ...
+        s.add(rows_out=len(result))
+
+Spans nest, and every finished span is kept in the process-wide run report,
+which `--report run.json` writes when the command finishes. Work done in
+worker processes is run through run_with_spans, so its spans can be merged
+back into the parent's report.
+"""
+
+import contextvars
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Span path of the innermost open span in the current thread/task
+_current: contextvars.ContextVar[str | None] = contextvars.ContextVar("fec_span", default=None)
+
+
+def peak_rss_mb() -> float | None:
+    """Peak RSS of this process and its finished children, in MB."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    scale = 1 if sys.platform == "darwin" else 1024
+    return peak * scale / (1024 * 1024)
+
+
+def file_size(path: Path) -> int:
+    """Size of a file in bytes, or 0 if it does not exist."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+@dataclass
+class Span:
+    """Measurements of one instrumented stage."""
+
+    name: str
+    path: str
+    attrs: dict[str, Any] = field(default_factory=dict)
+    started_at: str = ""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows_in: int = 0
+    rows_out: int = 0
+    rows_quarantined: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    peak_rss_mb: float | None = None
+    error: str | None = None
+
+    def add(
+        self,
+        rows_in: int = 0,
+        rows_out: int = 0,
+        bytes_read: int = 0,
+        bytes_written: int = 0,
+        rows_quarantined: int = 0,
+    ) -> None:
+        """Add to the span's counters."""
+        self.rows_in += rows_in
+        self.rows_out += rows_out
+        self.rows_quarantined += rows_quarantined
+        self.bytes_read += bytes_read
+        self.bytes_written += bytes_written
+
+    def set(self, **attrs: Any) -> None:
+        """Attach extra attributes to the span."""
+        self.attrs.update(attrs)
+
+
+class RunReport:
+    """Collects finished spans for the machine-readable run report."""
+
+    def __init__(self):
+        self.command: str = " ".join(sys.argv[1:])
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def extend(self, spans: list[Span]) -> None:
+        """Add spans recorded in a worker process, nested under the open span."""
+        parent = _current.get()
+        with self._lock:
+            for s in spans:
+                if parent:
+                    s.path = f"{parent}/{s.path}"
+                self.spans.append(s)
+
+    def stages(self) -> dict[str, dict[str, Any]]:
+        """Span totals by name, for comparing runs."""
+        totals: dict[str, dict[str, Any]] = {}
+        for s in self.spans:
+            stage = totals.setdefault(s.name, {
+                "count": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "rows_in": 0,
+                "rows_out": 0, "rows_quarantined": 0, "bytes_read": 0, "bytes_written": 0, "errors": 0,
+            })
+            stage["count"] += 1
+            stage["wall_seconds"] += s.wall_seconds
+            stage["cpu_seconds"] += s.cpu_seconds
+            stage["rows_in"] += s.rows_in
+            stage["rows_out"] += s.rows_out
+            stage["rows_quarantined"] += s.rows_quarantined
+            stage["bytes_read"] += s.bytes_read
+            stage["bytes_written"] += s.bytes_written
+            stage["errors"] += s.error is not None
+
+        for stage in totals.values():
+            wall = stage["wall_seconds"]
+            stage["rows_in_per_sec"] = stage["rows_in"] / wall if wall > 0 else None
+        return totals
+
+    def to_dict(self) -> dict[str, Any]:
+        import polars as pl
+
+        return {
+            "command": self.command,
+            "started_at": self.started_at.isoformat(),
+            "wall_seconds": time.perf_counter() - self._started,
+            "peak_rss_mb": peak_rss_mb(),
+            "python_version": platform.python_version(),
+            "polars_version": pl.__version__,
+            "cpu_count": os.cpu_count(),
+            "stages": self.stages(),
+            "spans": [asdict(s) for s in self.spans],
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the report as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+
+_report = RunReport()
+
+
+def get_report() -> RunReport:
+    """The current process's run report."""
+    return _report
+
+
+def reset_report() -> RunReport:
+    """Start a new run report, discarding recorded spans."""
+    global _report
+    _report = RunReport()
+    return _report
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span]:
+    """Instrument a stage.
+
+    Args:
+        name: Stage name, dotted by component (e.g. "combine.process_cycle")
+        **attrs: Attributes identifying this instance (dataset, cycle, file...)
+
+    Yields:
+        The span, whose counters can be updated while it is open
+    """
+    parent = _current.get()
+    s = Span(
+        name=name,
+        path=f"{parent}/{name}" if parent else name,
+        attrs=attrs,
+        started_at=datetime.now().isoformat(),
+    )
+    token = _current.set(s.path)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    try:
+        yield s
+    except BaseException as e:
+        s.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        s.wall_seconds = time.perf_counter() - wall_start
+        s.cpu_seconds = time.process_time() - cpu_start
+        s.peak_rss_mb = peak_rss_mb()
+        _current.reset(token)
+        _report.record(s)
+
+
+def run_with_spans(name: str, func: Callable[..., T], *args: Any, **attrs: Any) -> tuple[T, list[Span]]:
+    """Run a function in a span and return its result with the spans recorded.
+
+    Meant as the target of a worker-process task; the parent passes the
+    spans to get_report().extend().
+    """
+    report = reset_report()
+    with span(name, **attrs):
+        value = func(*args)
+    return value, report.spans
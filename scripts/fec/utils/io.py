@@ -1,10 +1,17 @@
 """I/O utilities for FEC data processing."""
 
+import io
+import json
 from pathlib import Path
-from typing import overload, Literal
+from typing import BinaryIO, Callable, Iterator, overload, Literal
 
 import polars as pl
 
+from .fingerprint import fingerprint_file
+from .manifest import record_output
+from .money import parse_cents
+from .quarantine import Quarantine
+
 
 # Standard Polars read parameters for FEC data
 FEC_READ_PARAMS = {
@@ -13,6 +20,12 @@ FEC_READ_PARAMS = {
     "encoding": "utf8-lossy",
 }
 
+# Input bytes parsed at a time by the block readers
+DEFAULT_BLOCK_SIZE = 64 * 1024 * 1024
+
+# Called by the block readers with (bytes, rows) after each block
+BlockCallback = Callable[[int, int], None]
+
 
 def atomic_write_csv(
     df: pl.DataFrame,
@@ -22,7 +35,8 @@ def atomic_write_csv(
     """Write CSV atomically using temp file + rename pattern.
 
     This ensures that the output file is never in a partial state.
-    If the write fails, the original file remains intact.
+    If the write fails, the original file remains intact. The committed
+    file is recorded in its directory's checksum manifest.
 
     Args:
         df: DataFrame to write
@@ -36,6 +50,144 @@ def atomic_write_csv(
     temp_path = output_path.with_suffix(".csv.tmp")
     df.write_csv(temp_path)
     temp_path.rename(output_path)
+    record_output(output_path, rows=len(df))
+
+
+def stream_rewrite_csv(
+    path: Path,
+    transform: Callable[[pl.LazyFrame], pl.LazyFrame],
+    backup: bool = False,
+    chunk_rows: int | None = None,
+) -> int:
+    """Rewrite a CSV file through a lazy transform without loading it into memory.
+
+    The file is scanned, transformed, and streamed in batches to a temp file,
+    which then atomically replaces the original and is recorded in the
+    checksum manifest, whose hashing pass also counts the rows. The rewrite
+    keeps every row in place, so a current derived-column sidecar is
+    re-stamped to match the rewritten file.
+
+    Args:
+        path: Path to the CSV file
+        transform: Function applying column transforms to the scan
+        backup: If True, keep the original as .csv.bak
+        chunk_rows: Rows per streaming batch (bounds memory); None for the Polars default
+
+    Returns:
+        Number of rows written
+    """
+    temp_path = path.with_suffix(".csv.tmp")
+    keep_sidecar = is_sidecar_current(path)
+    lf = transform(read_fec_csv(path, lazy=True, with_sidecar=False))
+
+    options = {"streaming_chunk_size": chunk_rows} if chunk_rows else {}
+    with pl.Config(**options):
+        lf.sink_csv(temp_path)
+
+    if backup:
+        path.rename(path.with_suffix(".csv.bak"))
+    temp_path.rename(path)
+
+    row_count = record_output(path, count_rows=True).rows
+    if keep_sidecar:
+        restamp_sidecar(path)
+    return row_count
+
+
+def collect_streaming(lf: pl.LazyFrame) -> pl.DataFrame:
+    """Collect a LazyFrame with the Polars streaming engine.
+
+    The streaming engine processes the input in batches, so peak memory is
+    bounded by the query's intermediate state rather than the input size.
+
+    Args:
+        lf: LazyFrame to collect
+
+    Returns:
+        Collected DataFrame
+    """
+    try:
+        return lf.collect(engine="streaming")
+    except (TypeError, ValueError):
+        # Older Polars releases only support the streaming flag
+        return lf.collect(streaming=True)
+
+
+# Suffix of the per-file sidecar holding derived columns
+SIDECAR_SUFFIX = ".derived.parquet"
+
+# Sidecar column used to check alignment with the base file
+SIDECAR_KEY_COLUMN = "sub_id"
+
+# Sidecar Parquet metadata key recording the base file it was derived from
+SIDECAR_BASE_KEY = "fec_base_file"
+
+
+def get_sidecar_path(path: Path) -> Path:
+    """Get the derived-column sidecar path for a CSV file."""
+    return path.with_suffix(SIDECAR_SUFFIX)
+
+
+def sidecar_metadata(path: Path) -> dict[str, str]:
+    """Parquet metadata tying a sidecar to the current contents of its base file.
+
+    Records the size and sampled content hash of the base file's fingerprint
+    (not its mtime, so copies of a data directory keep their sidecars).
+    """
+    fp = fingerprint_file(path)
+    if fp is None:
+        raise FileNotFoundError(path)
+    return {SIDECAR_BASE_KEY: json.dumps({"size": fp.size, "digest": fp.digest})}
+
+
+def is_sidecar_current(path: Path) -> bool:
+    """Check that a file's sidecar exists and was derived from its current contents.
+
+    Sidecars written before the base file was replaced (e.g. by a new
+    download), and sidecars without the metadata, are stale.
+    """
+    sidecar_path = get_sidecar_path(path)
+    if not sidecar_path.exists():
+        return False
+    recorded = pl.read_parquet_metadata(sidecar_path).get(SIDECAR_BASE_KEY)
+    return recorded == sidecar_metadata(path)[SIDECAR_BASE_KEY]
+
+
+def _check_sidecar(path: Path, sidecar_path: Path) -> None:
+    if not is_sidecar_current(path):
+        raise ValueError(
+            f"{sidecar_path.name} is stale: {path.name} changed since it was written "
+            "(rerun individual add-year --sidecar)"
+        )
+
+
+def restamp_sidecar(path: Path) -> None:
+    """Record a file's current contents in its sidecar after a row-preserving rewrite."""
+    sidecar_path = get_sidecar_path(path)
+    temp_path = sidecar_path.with_suffix(".parquet.tmp")
+    pl.scan_parquet(sidecar_path).sink_parquet(temp_path, metadata=sidecar_metadata(path))
+    temp_path.rename(sidecar_path)
+    record_output(sidecar_path, rows=pl.scan_parquet(sidecar_path).select(pl.len()).collect().item())
+
+
+def _scan_with_sidecar(path: Path, sidecar_path: Path) -> pl.LazyFrame:
+    """Zip a sidecar's derived columns onto a scan of its base file.
+
+    The sidecar is aligned with the base file by row number, so it must have
+    been derived from the file's current contents (ValueError otherwise).
+    Derived columns are placed after the first (election_cycle) column,
+    matching the layout of files rewritten in place, and replace any
+    same-named base columns.
+    """
+    _check_sidecar(path, sidecar_path)
+    base = pl.scan_csv(path, **FEC_READ_PARAMS)
+    derived = pl.scan_parquet(sidecar_path).drop(SIDECAR_KEY_COLUMN)
+
+    derived_columns = derived.collect_schema().names()
+    base_columns = [c for c in base.collect_schema().names() if c not in derived_columns]
+
+    combined = pl.concat([base.select(base_columns), derived], how="horizontal")
+    return combined.select(base_columns[:1] + derived_columns + base_columns[1:])
 
 
 @overload
@@ -43,6 +195,7 @@ def read_fec_csv(
     path: Path,
     columns: list[str] | None = None,
     lazy: Literal[False] = False,
+    with_sidecar: bool = True,
 ) -> pl.DataFrame: ...
 
 
@@ -51,6 +204,7 @@ def read_fec_csv(
     path: Path,
     columns: list[str] | None = None,
     lazy: Literal[True] = True,
+    with_sidecar: bool = True,
 ) -> pl.LazyFrame: ...
 
 
@@ -58,6 +212,7 @@ def read_fec_csv(
     path: Path,
     columns: list[str] | None = None,
     lazy: bool = False,
+    with_sidecar: bool = True,
 ) -> pl.DataFrame | pl.LazyFrame:
     """Read a CSV file with standardized FEC parameters.
 
@@ -66,19 +221,32 @@ def read_fec_csv(
     - ignore_errors=True (skip malformed rows)
     - encoding="utf8-lossy" (handle encoding issues)
 
+    If a derived-column sidecar (see TransactionYearAdder) exists next to
+    the file, its columns are zipped onto the result transparently. A stale
+    sidecar (the file changed since it was written) raises ValueError.
+
     Args:
         path: Path to the CSV file
         columns: List of column names to read (None for all)
         lazy: If True, return LazyFrame for memory efficiency
+        with_sidecar: If False, ignore any sidecar (e.g. when rewriting the base file)
 
     Returns:
         DataFrame or LazyFrame with the CSV contents
     """
+    sidecar_path = get_sidecar_path(path)
+    if with_sidecar and sidecar_path.exists():
+        lf = _scan_with_sidecar(path, sidecar_path)
+        if columns:
+            lf = lf.select(columns)
+        return lf if lazy else lf.collect()
+
     if lazy:
-        return pl.scan_csv(
+        lf = pl.scan_csv(
             path,
             **FEC_READ_PARAMS,
         )
+        return lf.select(columns) if columns else lf
     else:
         return pl.read_csv(
             path,
@@ -92,6 +260,7 @@ def read_fec_pipe_delimited(
     path: Path,
     columns: list[str],
     lazy: Literal[False] = False,
+    amount_columns: list[str] | None = None,
 ) -> pl.DataFrame: ...
 
 
@@ -100,6 +269,7 @@ def read_fec_pipe_delimited(
     path: Path,
     columns: list[str],
     lazy: Literal[True] = True,
+    amount_columns: list[str] | None = None,
 ) -> pl.LazyFrame: ...
 
 
@@ -107,6 +277,7 @@ def read_fec_pipe_delimited(
     path: Path,
     columns: list[str],
     lazy: bool = False,
+    amount_columns: list[str] | None = None,
 ) -> pl.DataFrame | pl.LazyFrame:
     """Read a pipe-delimited FEC bulk data file.
 
@@ -117,10 +288,25 @@ def read_fec_pipe_delimited(
         path: Path to the pipe-delimited file
         columns: List of column names (required since files have no header)
         lazy: If True, return LazyFrame for memory efficiency
+        amount_columns: Dollar amount columns to parse exactly to Int64 cents
+            (see utils.money); convert back with cents_to_dollars before writing
 
     Returns:
         DataFrame or LazyFrame with the file contents
     """
+    params, amount_columns = _pipe_delimited_params(columns, amount_columns)
+
+    lf = pl.scan_csv(path, **params)
+    if amount_columns:
+        lf = lf.with_columns(parse_cents(pl.col(col)) for col in amount_columns)
+
+    return lf if lazy else lf.collect()
+
+
+def _pipe_delimited_params(
+    columns: list[str], amount_columns: list[str] | None
+) -> tuple[dict, list[str]]:
+    """Polars scan parameters for a pipe-delimited FEC file, and its amount columns."""
     params = {
         "separator": "|",
         "has_header": False,
@@ -130,7 +316,209 @@ def read_fec_pipe_delimited(
         **FEC_READ_PARAMS,
     }
 
-    if lazy:
-        return pl.scan_csv(path, **params)
+    amount_columns = [col for col in amount_columns or [] if col in columns]
+    if amount_columns:
+        # Read amounts as text so they are parsed without float rounding
+        params["schema_overrides"] = {col: pl.Utf8 for col in amount_columns}
+
+    return params, amount_columns
+
+
+def iter_line_blocks(stream: BinaryIO, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[bytes]:
+    """Read a binary stream in blocks that end on a line boundary."""
+    remainder = b""
+    while True:
+        data = stream.read(block_size)
+        if not data:
+            if remainder:
+                yield remainder
+            return
+
+        data = remainder + data
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            remainder = data
+            continue
+        remainder = data[cut:]
+        yield data[:cut]
+
+
+def _fit_first_line(data: bytes, fields: int) -> bytes:
+    """Pad or truncate the first line of a block to the given number of fields.
+
+    A block scanned with the first block's schema takes its column count
+    from its own first line, so a short, blank or long line there fails the
+    scan. Fitting it gives the row the whole-file read would (short lines
+    padded with nulls, extra fields dropped).
+    """
+    end = data.find(b"\n")
+    if end < 0:
+        end = len(data)
+    line = data[:end]
+    ending = b"\r" if line.endswith(b"\r") else b""
+    line = line[:len(line) - len(ending)]
+
+    separators = line.count(b"|")
+    if separators == fields - 1:
+        return data
+    if separators < fields - 1:
+        line += b"|" * (fields - 1 - separators)
     else:
-        return pl.read_csv(path, **params)
+        line = b"|".join(line.split(b"|")[:fields])
+    return line + ending + data[end:]
+
+
+def _count_lines(data: bytes) -> int:
+    return data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+
+
+def read_fec_pipe_delimited_blocks(
+    source: Path | BinaryIO,
+    columns: list[str],
+    amount_columns: list[str] | None = None,
+    transform: Callable[[pl.LazyFrame], pl.LazyFrame] | None = None,
+    on_block: BlockCallback | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    quarantine: Quarantine | None = None,
+) -> pl.DataFrame:
+    """Read a pipe-delimited FEC bulk data file block by block.
+
+    Equivalent to read_fec_pipe_delimited, but the input (a file, or an open
+    stream such as a ZIP member) is parsed in blocks of whole lines. Progress
+    can then be reported from the bytes actually consumed, and transform
+    (filters and projections) runs on each block, so only its output is held
+    in memory. The schema is inferred from the first block, just as
+    read_fec_pipe_delimited infers it from the start of the file.
+
+    Args:
+        source: Path or binary stream of the pipe-delimited data
+        columns: List of column names
+        amount_columns: Dollar amount columns to parse exactly to Int64 cents
+        transform: Row-wise transform applied to each block
+        on_block: Called with (bytes, rows) after each block is read
+        block_size: Bytes to parse at a time
+        quarantine: If given, malformed lines are written to it as each
+            block is read (see utils.quarantine)
+
+    Returns:
+        DataFrame with the transformed rows of all blocks
+    """
+    params, amount_columns = _pipe_delimited_params(columns, amount_columns)
+
+    block_params = {k: v for k, v in params.items() if k not in ("new_columns", "schema_overrides")}
+
+    def scan(data: bytes, schema: pl.Schema | None) -> tuple[pl.LazyFrame, pl.Schema]:
+        if schema is None:
+            lf = pl.scan_csv(io.BytesIO(data), **params)
+            return lf, lf.collect_schema()
+        data = _fit_first_line(data, len(schema))
+        return pl.scan_csv(io.BytesIO(data), schema=schema, **block_params), schema
+
+    def finish(lf: pl.LazyFrame) -> pl.LazyFrame:
+        if amount_columns:
+            lf = lf.with_columns(parse_cents(pl.col(col)) for col in amount_columns)
+        return transform(lf) if transform else lf
+
+    if quarantine is not None:
+        quarantine.begin(len(columns))
+    return _read_blocks(source, scan, finish, on_block, block_size, quarantine=quarantine)
+
+
+def read_fec_csv_blocks(
+    path: Path,
+    transform: Callable[[pl.LazyFrame], pl.LazyFrame] | None = None,
+    on_block: BlockCallback | None = None,
+    with_sidecar: bool = True,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> pl.DataFrame:
+    """Read a CSV file with standardized FEC parameters, block by block.
+
+    Equivalent to read_fec_csv (including any sidecar), but parsed in blocks
+    of whole lines so progress follows the bytes consumed and transform runs
+    on each block. Rows are counted by line, which holds for the CSV files
+    this package writes (FEC fields never contain newlines).
+
+    Args:
+        path: Path to the CSV file
+        transform: Row-wise transform applied to each block
+        on_block: Called with (bytes, rows) after each block is read
+        with_sidecar: If False, ignore any sidecar
+        block_size: Bytes to parse at a time
+
+    Returns:
+        DataFrame with the transformed rows of all blocks
+    """
+    sidecar_path = get_sidecar_path(path)
+    derived = None
+    if with_sidecar and sidecar_path.exists():
+        _check_sidecar(path, sidecar_path)
+        derived = pl.scan_parquet(sidecar_path)
+    derived_columns = derived.drop(SIDECAR_KEY_COLUMN).collect_schema().names() if derived is not None else []
+    offset = 0
+
+    def scan(data: bytes, schema: pl.Schema | None) -> tuple[pl.LazyFrame, pl.Schema]:
+        nonlocal offset
+        if schema is None:
+            lf = pl.scan_csv(io.BytesIO(data), **FEC_READ_PARAMS)
+            schema = lf.collect_schema()
+            rows = _count_lines(data) - 1
+        else:
+            lf = pl.scan_csv(io.BytesIO(data), has_header=False, schema=schema, **FEC_READ_PARAMS)
+            rows = _count_lines(data)
+
+        if derived is None:
+            return lf, schema
+
+        # Zip the sidecar rows aligned with this block (see _scan_with_sidecar)
+        block_derived = derived.slice(offset, rows).drop(SIDECAR_KEY_COLUMN).collect()
+        offset += rows
+        if len(block_derived) != rows:
+            raise ValueError(f"{sidecar_path.name} is not aligned with {path.name}")
+
+        base_columns = [c for c in schema.names() if c not in derived_columns]
+        combined = pl.concat([lf.select(base_columns), block_derived.lazy()], how="horizontal")
+        return combined.select(base_columns[:1] + derived_columns + base_columns[1:]), schema
+
+    def finish(lf: pl.LazyFrame) -> pl.LazyFrame:
+        return transform(lf) if transform else lf
+
+    return _read_blocks(path, scan, finish, on_block, block_size, has_header=True)
+
+
+def _read_blocks(
+    source: Path | BinaryIO,
+    scan: Callable[[bytes, pl.Schema | None], tuple[pl.LazyFrame, pl.Schema]],
+    finish: Callable[[pl.LazyFrame], pl.LazyFrame],
+    on_block: BlockCallback | None,
+    block_size: int,
+    has_header: bool = False,
+    quarantine: Quarantine | None = None,
+) -> pl.DataFrame:
+    """Scan each line block with the first block's schema, transform and collect."""
+    if isinstance(source, Path):
+        with open(source, "rb") as f:
+            return _read_blocks(f, scan, finish, on_block, block_size, has_header, quarantine)
+
+    frames: list[pl.DataFrame] = []
+    schema: pl.Schema | None = None
+    offset, line = 0, 1
+
+    for data in iter_line_blocks(source, block_size):
+        lf, schema = scan(data, schema)
+        if quarantine is None:
+            frames.append(finish(lf).collect())
+        else:
+            # The line check runs in the same collection as the block itself
+            frame, flagged = pl.collect_all([finish(lf), quarantine.scan_block(data)])
+            quarantine.add_block(data, flagged, offset, line)
+            frames.append(frame)
+
+        lines = _count_lines(data)
+        offset += len(data)
+        line += lines
+        if on_block is not None:
+            on_block(len(data), lines - (has_header and len(frames) == 1))
+
+    if not frames:
+        return pl.DataFrame()
+    return pl.concat(frames, how="vertical_relaxed")
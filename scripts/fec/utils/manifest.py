@@ -0,0 +1,147 @@
+"""Checksum manifest for committed output files.
+
+Every output written through atomic_write_csv (and the other commit points
+in the processors) gets a manifest entry with its size, row count and a
+content hash. Entries live in a .fec_manifest/ directory next to the
+outputs, one small JSON file per output, so processes committing
+different outputs at the same time never contend for a shared file:
+
+    data/.fec_manifest/committee_registrations_1980-2026.csv.json
+
+verify_checksums re-hashes files against their entries without parsing
+them, so a tree of any size verifies at disk bandwidth.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+MANIFEST_DIR = ".fec_manifest"
+HASH_ALGORITHM = "blake2b"
+
+# Bytes hashed per update; hashlib releases the GIL for each one, so
+# several files hash in parallel from a thread pool
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Size, row count and content hash of a committed output."""
+
+    file_name: str
+    size: int
+    rows: int | None
+    digest: str
+    algorithm: str = HASH_ALGORITHM
+    written_at: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "ManifestEntry":
+        return cls(
+            file_name=raw["file_name"],
+            size=raw["size"],
+            rows=raw.get("rows"),
+            digest=raw["digest"],
+            algorithm=raw.get("algorithm", HASH_ALGORITHM),
+            written_at=raw.get("written_at", ""),
+        )
+
+
+def hash_file(path: Path, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Hash a file's full contents in chunks of a memory map.
+
+    The file is never read into memory as a whole; pages of the map are
+    faulted in and released by the OS as the hash advances.
+    """
+    return _scan_file(path, chunk_size)[0]
+
+
+def _scan_file(path: Path, chunk_size: int, count_lines: bool = False) -> tuple[str, int | None]:
+    """Hash a file and, if asked, count its lines in the same pass."""
+    hasher = hashlib.blake2b(digest_size=16)
+    lines = 0 if count_lines else None
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return hasher.hexdigest(), lines
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for offset in range(0, size, chunk_size):
+                    hasher.update(view[offset:offset + chunk_size])
+                    if count_lines:
+                        lines += mm[offset:offset + chunk_size].count(b"\n")
+            finally:
+                view.release()
+            # A last line without a terminator still counts
+            if count_lines and mm[size - 1:size] != b"\n":
+                lines += 1
+
+    return hasher.hexdigest(), lines
+
+
+def get_manifest_dir(directory: Path) -> Path:
+    """Get the manifest directory for outputs in a directory."""
+    return directory / MANIFEST_DIR
+
+
+def _entry_path(path: Path) -> Path:
+    return get_manifest_dir(path.parent) / f"{path.name}.json"
+
+
+def record_output(path: Path, rows: int | None = None, count_rows: bool = False) -> ManifestEntry:
+    """Record a committed output's size, row count and hash in its manifest.
+
+    Args:
+        path: The output file, already in its final location
+        rows: Data rows in the file (None if unknown)
+        count_rows: Count the rows of a headed CSV while hashing it, in
+            place of rows; no field may contain a line break
+
+    Returns:
+        The recorded entry
+    """
+    digest, lines = _scan_file(path, HASH_CHUNK_SIZE, count_lines=count_rows)
+    if count_rows:
+        rows = max(lines - 1, 0)
+
+    entry = ManifestEntry(
+        file_name=path.name,
+        size=path.stat().st_size,
+        rows=rows,
+        digest=digest,
+        written_at=datetime.now().isoformat(),
+    )
+
+    entry_path = _entry_path(path)
+    entry_path.parent.mkdir(exist_ok=True)
+    temp_path = entry_path.with_suffix(".json.tmp")
+    with open(temp_path, "w") as f:
+        json.dump(entry.to_dict(), f, indent=2)
+    os.replace(temp_path, entry_path)
+
+    return entry
+
+
+def load_manifest(directory: Path) -> dict[str, ManifestEntry]:
+    """Load all manifest entries for a directory, keyed by file name."""
+    manifest_dir = get_manifest_dir(directory)
+    if not manifest_dir.exists():
+        return {}
+
+    entries = {}
+    for entry_path in sorted(manifest_dir.glob("*.json")):
+        with open(entry_path) as f:
+            entry = ManifestEntry.from_dict(json.load(f))
+        entries[entry.file_name] = entry
+    return entries
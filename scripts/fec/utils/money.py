@@ -0,0 +1,87 @@
+"""Exact money handling for FEC amount columns.
+
+Amounts are parsed from their text form to Int64 cents, so sums over
+millions of transactions are exact (and integer group-by sums are faster
+than float ones). They are formatted back to dollars only when output is
+written.
+"""
+
+import polars as pl
+
+# Dtype used for amounts while aggregating
+CENTS_DTYPE = pl.Int64
+
+
+def parse_cents(expr: pl.Expr) -> pl.Expr:
+    """Parse a dollar amount column to integer cents.
+
+    Works on the decimal text ("1234.5", "-20.00", "7") rather than through a
+    float, so no rounding error is introduced. Digits beyond the second
+    decimal place are truncated; empty or malformed values become null.
+
+    Args:
+        expr: Column expression holding dollar amounts (string or numeric)
+
+    Returns:
+        Int64 expression of amounts in cents, named like the input column
+    """
+    text = expr.cast(pl.Utf8).str.strip_chars()
+    negative = text.str.starts_with("-")
+    unsigned = text.str.strip_chars_start("+-")
+
+    parts = unsigned.str.split_exact(".", 1)
+    whole = parts.struct.field("field_0")
+    fraction = parts.struct.field("field_1").fill_null("").str.pad_end(2, "0").str.slice(0, 2)
+
+    valid = unsigned.str.contains(r"^(\d+\.?\d*|\.\d+)$")
+    cents = (
+        pl.when(whole == "").then(pl.lit("0")).otherwise(whole).cast(CENTS_DTYPE, strict=False) * 100
+        + fraction.cast(CENTS_DTYPE, strict=False)
+    )
+
+    return (
+        pl.when(valid)
+        .then(pl.when(negative).then(-cents).otherwise(cents))
+        .otherwise(None)
+        .cast(CENTS_DTYPE)
+        .name.keep()
+    )
+
+
+def cents_to_dollars(expr: pl.Expr) -> pl.Expr:
+    """Format an integer cents column as exact dollar text for output.
+
+    Amounts always have two decimals ("5000.00", "218687.55", "-0.05"), so
+    readers infer the column as Float64 however many leading values are
+    whole dollars. Going through a float instead would write values like
+    "218687.55000000002".
+
+    Args:
+        expr: Int64 expression of amounts in cents
+
+    Returns:
+        String expression of dollar amounts, named like the input column
+    """
+    cents = expr.cast(CENTS_DTYPE)
+    magnitude = cents.abs()
+    return pl.concat_str(
+        pl.when(cents < 0).then(pl.lit("-")).otherwise(pl.lit("")),
+        (magnitude // 100).cast(pl.Utf8),
+        pl.lit("."),
+        (magnitude % 100).cast(pl.Utf8).str.zfill(2),
+    ).alias(expr.meta.output_name())
+
+
+def dollars_to_cents(expr: pl.Expr) -> pl.Expr:
+    """Convert dollar amounts re-read from an output file back to cents.
+
+    Rounds to the nearest cent, so amounts written through a float by older
+    releases (e.g. "218687.55000000002") come back exact.
+
+    Args:
+        expr: Column expression holding dollar amounts (numeric)
+
+    Returns:
+        Int64 expression of amounts in cents, named like the input column
+    """
+    return (expr.cast(pl.Float64) * 100).round(0).cast(CENTS_DTYPE).name.keep()
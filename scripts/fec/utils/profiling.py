@@ -0,0 +1,162 @@
+"""Profiling for CLI runs.
+
+Profiler wraps a command and writes, under the profile directory:
+
+    {name}.pstats   cProfile statistics (deterministic mode only)
+    {name}.folded   collapsed stacks ("frame;frame;frame count" per line),
+                    ready for flamegraph.pl, speedscope or inferno
+    {name}.plans/   Polars query plans captured with capture_plan
+
+Stacks come from a sampling thread in both modes; deterministic mode also
+runs cProfile, which is exact but slows Python-heavy code. Polars work runs
+in native threads, so it shows up as time spent in the Python call that
+collects the query, and its plan is what explains that time.
+"""
+
+import cProfile
+import os
+import pstats
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
+from rich.console import Console
+
+console = Console()
+
+PROFILE_MODES = ("deterministic", "sampling")
+
+# Seconds between stack samples
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Set while profiling so spawned worker processes also capture query plans
+PLANS_DIR_ENV = "FEC_PROFILE_PLANS_DIR"
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples the Python stacks of all other threads at a fixed interval."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="fec-stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                # Skip idle threads (e.g. progress-bar refreshers) blocked in a wait
+                if frame.f_code.co_name == "wait" and frame.f_code.co_filename == threading.__file__:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                self.samples[(names.get(ident, str(ident)), *reversed(stack))] += 1
+
+    def write_folded(self, path: Path) -> None:
+        """Write samples in collapsed-stack format."""
+        with open(path, "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{';'.join(frame.replace(';', ':') for frame in stack)} {count}\n")
+
+
+class Profiler:
+    """Profiles a CLI run and writes pstats, collapsed stacks and query plans."""
+
+    def __init__(
+        self,
+        out_dir: Path,
+        name: str,
+        mode: str = "deterministic",
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+    ):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.base = out_dir / f"{stamp}_{re.sub(r'[^A-Za-z0-9_.-]+', '-', name)}"
+        self.mode = mode
+        self.sampler = StackSampler(interval)
+        self.profile = cProfile.Profile() if mode == "deterministic" else None
+
+    @property
+    def plans_dir(self) -> Path:
+        return self.base.with_name(self.base.name + ".plans")
+
+    def start(self) -> "Profiler":
+        self.base.parent.mkdir(parents=True, exist_ok=True)
+        os.environ[PLANS_DIR_ENV] = str(self.plans_dir)
+        self.sampler.start()
+        if self.profile is not None:
+            self.profile.enable()
+        return self
+
+    def stop(self) -> None:
+        """Stop profiling and write the output files."""
+        if self.profile is not None:
+            self.profile.disable()
+        self.sampler.stop()
+        os.environ.pop(PLANS_DIR_ENV, None)
+
+        written = []
+        if self.profile is not None:
+            stats_path = self.base.with_suffix(".pstats")
+            self.profile.dump_stats(stats_path)
+            written.append(stats_path)
+
+        folded_path = self.base.with_suffix(".folded")
+        self.sampler.write_folded(folded_path)
+        written.append(folded_path)
+
+        if self.plans_dir.exists():
+            written.append(self.plans_dir)
+
+        if self.profile is not None:
+            console.print("\n[bold]Top functions by cumulative time[/bold]")
+            pstats.Stats(self.profile, stream=sys.stdout).sort_stats("cumulative").print_stats(15)
+
+        console.print(f"[dim]Profile written to: {', '.join(str(p) for p in written)}[/dim]")
+
+
+def capture_plan(name: str, lf: pl.LazyFrame, streaming: bool = False) -> None:
+    """Save a LazyFrame's unoptimized and optimized plans if profiling.
+
+    Cheap no-op unless a Profiler is running in this process or the process
+    that spawned it.
+    """
+    plans_dir = os.environ.get(PLANS_DIR_ENV)
+    if not plans_dir:
+        return
+
+    try:
+        optimized = lf.explain(engine="streaming") if streaming else lf.explain()
+    except TypeError:
+        optimized = lf.explain()
+
+    path = Path(plans_dir) / f"{re.sub(r'[^A-Za-z0-9_.-]+', '-', name)}.txt"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.write(f"# {name}\n\n## Optimized plan\n\n{optimized}\n\n")
+        f.write(f"## Unoptimized plan\n\n{lf.explain(optimized=False)}\n")
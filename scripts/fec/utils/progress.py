@@ -1,16 +1,24 @@
 """Progress bar utilities for consistent UI across scripts."""
 
+import time
+
 from rich.console import Console
 from rich.progress import (
     Progress,
     BarColumn,
     DownloadColumn,
+    ProgressColumn,
     SpinnerColumn,
+    Task,
+    TaskID,
     TextColumn,
     TimeElapsedColumn,
     TimeRemainingColumn,
     TransferSpeedColumn,
 )
+from rich.text import Text
+
+from .instrument import Span
 
 
 def create_download_progress(console: Console) -> Progress:
@@ -34,7 +42,9 @@ def create_download_progress(console: Console) -> Progress:
     )
 
 
-def create_spinner_progress(console: Console, transient: bool = True) -> Progress:
+def create_spinner_progress(
+    console: Console, transient: bool = True, disable: bool = False
+) -> Progress:
     """Create a spinner progress for processing tasks.
 
     Shows a spinner with elapsed time for long-running operations.
@@ -42,6 +52,7 @@ def create_spinner_progress(console: Console, transient: bool = True) -> Progres
     Args:
         console: Rich console instance
         transient: If True, remove progress bar when done
+        disable: If True, render nothing (e.g. in worker processes)
 
     Returns:
         Configured Progress instance with spinner
@@ -52,4 +63,79 @@ def create_spinner_progress(console: Console, transient: bool = True) -> Progres
         TimeElapsedColumn(),
         console=console,
         transient=transient,
+        disable=disable,
     )
+
+
+class RowRateColumn(ProgressColumn):
+    """Rows per second, from a task's "rows" field."""
+
+    def render(self, task: Task) -> Text:
+        rows = task.fields.get("rows")
+        if not rows or not task.elapsed:
+            return Text("")
+        return Text(f"{rows / task.elapsed:,.0f} rows/s", style="progress.data.speed")
+
+
+def create_processing_progress(
+    console: Console, transient: bool = True, disable: bool = False
+) -> Progress:
+    """Create a progress bar for processing a data file.
+
+    Tasks advance by input bytes consumed, so the bar and ETA follow the
+    read; rows/s comes from the task's "rows" field (see ReadProgress).
+
+    Args:
+        console: Rich console instance
+        transient: If True, remove progress bar when done
+        disable: If True, render nothing (e.g. in worker processes)
+
+    Returns:
+        Configured Progress instance for processing
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        RowRateColumn(),
+        TimeRemainingColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=transient,
+        disable=disable,
+    )
+
+
+class ReadProgress:
+    """Reports a block reader's progress to a progress task and a span.
+
+    Pass as on_block to the block readers in utils.io. Bytes and rows read
+    are added to the task (bytes advance the bar, rows drive rows/s) and to
+    the span's bytes_read and rows_in.
+    """
+
+    def __init__(self, progress: Progress, task_id: TaskID, span: Span | None = None):
+        self.progress = progress
+        self.task_id = task_id
+        self.span = span
+        self.rows = 0
+        self.bytes = 0
+        self._started = time.perf_counter()
+        self.seconds = 0.0
+
+    def __call__(self, nbytes: int, rows: int) -> None:
+        self.rows += rows
+        self.bytes += nbytes
+        self.seconds = time.perf_counter() - self._started
+        self.progress.update(self.task_id, advance=nbytes, rows=self.rows)
+        if self.span is not None:
+            self.span.add(rows_in=rows, bytes_read=nbytes)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line read throughput, e.g. for printing after the read."""
+        return f"{self.rows:,} rows read in {self.seconds:.1f}s ({self.rows_per_sec:,.0f} rows/s)"
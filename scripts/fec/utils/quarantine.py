@@ -0,0 +1,125 @@
+"""Quarantine files for malformed lines of pipe-delimited FEC files.
+
+The pipe-delimited readers truncate lines with too many fields and pad
+lines with too few, so a malformed line otherwise disappears into a row of
+shifted or missing values. With a Quarantine passed to
+read_fec_pipe_delimited_blocks, every block is also split into lines by a
+second query collected together with the block's own (no second read of the
+file), and lines with the wrong number of fields are written with their
+byte offset, line number and reason to a per-dataset, per-cycle file:
+
+    data/.fec_quarantine/committee_registrations_2024.csv
+
+Lines may end in a trailing "|" (one extra empty field), as several FEC
+files do. Quarantined lines are still read as before; the quarantine file
+is for inspecting them.
+"""
+
+import io
+from collections import Counter
+from pathlib import Path
+
+import polars as pl
+
+QUARANTINE_DIR = ".fec_quarantine"
+
+# Splits a block into whole lines: a field separator FEC data never contains
+# (a line that does is re-checked from its raw bytes)
+_LINE_SEPARATOR = "\x1f"
+
+
+def get_quarantine_path(directory: Path, dataset: str, cycle: int) -> Path:
+    """Get the quarantine file for a dataset's cycle read into a directory."""
+    return directory / QUARANTINE_DIR / f"{dataset}_{cycle}.csv"
+
+
+class Quarantine:
+    """Collects the malformed lines of one pipe-delimited file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows = 0
+        self.reasons: Counter[str] = Counter()
+        self._fields = 0
+
+    def begin(self, fields: int) -> None:
+        """Start a read of a file with this many fields per line."""
+        self._fields = fields
+        self.rows = 0
+        self.reasons.clear()
+        self.path.unlink(missing_ok=True)
+
+    def scan_block(self, data: bytes) -> pl.LazyFrame:
+        """Query for the indexes of lines in a block whose field count is off."""
+        separators = pl.col("line").str.count_matches("|", literal=True).fill_null(0)
+        return (
+            pl.scan_csv(
+                io.BytesIO(data),
+                separator=_LINE_SEPARATOR,
+                has_header=False,
+                quote_char=None,
+                schema={"line": pl.Utf8},
+                truncate_ragged_lines=True,
+                encoding="utf8-lossy",
+            )
+            .with_row_index("index")
+            .filter(
+                (separators != self._fields - 1)
+                & ~((separators == self._fields) & pl.col("line").str.ends_with("|"))
+            )
+            .select("index")
+        )
+
+    def _reason(self, line: bytes) -> str | None:
+        fields = line.count(b"|") + 1
+        if fields == self._fields or (fields == self._fields + 1 and line.endswith(b"|")):
+            return None
+        return "too many fields" if fields > self._fields else "too few fields"
+
+    def add_block(self, data: bytes, flagged: pl.DataFrame, offset: int, first_line: int) -> None:
+        """Write a block's flagged lines.
+
+        Args:
+            data: The block
+            flagged: Result of scan_block
+            offset: Byte offset of the block in the file
+            first_line: Line number (1-based) of the block's first line
+        """
+        if flagged.is_empty():
+            return
+
+        offsets, lines, reasons, raws = [], [], [], []
+        start, line_index = 0, 0
+        for index in flagged["index"]:
+            while line_index < index:
+                start = data.index(b"\n", start) + 1
+                line_index += 1
+            end = data.find(b"\n", start)
+            raw = data[start:end if end >= 0 else len(data)].rstrip(b"\r")
+
+            reason = self._reason(raw)
+            if reason is None:
+                continue
+            fields = raw.count(b"|") + 1
+            offsets.append(offset + start)
+            lines.append(first_line + index)
+            reasons.append(f"{reason} ({fields}, expected {self._fields})")
+            raws.append(raw.decode("utf-8", errors="replace"))
+            self.reasons[reason] += 1
+
+        if not raws:
+            return
+
+        rows = pl.DataFrame(
+            {"offset": offsets, "line": lines, "reason": reasons, "raw": raws},
+            schema={"offset": pl.Int64, "line": pl.Int64, "reason": pl.Utf8, "raw": pl.Utf8},
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            rows.write_csv(f, include_header=self.rows == 0)
+        self.rows += len(rows)
+
+    def summary(self) -> str:
+        """One-line description of what was quarantined."""
+        reasons = ", ".join(f"{count:,} {reason}" for reason, count in self.reasons.most_common())
+        return f"Quarantined {self.rows:,} malformed line(s) ({reasons}) to {self.path}"
@@ -0,0 +1,34 @@
+"""Column transform helpers for FEC data processing."""
+
+from typing import Any, Callable
+
+import polars as pl
+
+
+def map_distinct(
+    expr: pl.Expr,
+    func: Callable[[Any], Any],
+    return_dtype: pl.DataType,
+) -> pl.Expr:
+    """Apply a Python function once per distinct value of a column.
+
+    Equivalent to expr.map_elements(func, return_dtype=return_dtype), but
+    func is only called for each distinct non-null value in a batch. FEC
+    date, name, employer, and occupation columns repeat heavily, so this is
+    far cheaper than calling func on every row.
+
+    Args:
+        expr: Column expression to transform
+        func: Function applied to each distinct non-null value
+        return_dtype: Polars dtype of the function's results
+
+    Returns:
+        Expression producing the transformed column (nulls stay null)
+    """
+
+    def apply(series: pl.Series) -> pl.Series:
+        distinct = series.unique().drop_nulls()
+        mapped = pl.Series([func(value) for value in distinct.to_list()], dtype=return_dtype)
+        return series.replace_strict(distinct, mapped, default=None, return_dtype=return_dtype)
+
+    return expr.map_batches(apply, return_dtype=return_dtype, is_elementwise=True)
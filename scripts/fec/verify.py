@@ -1,16 +1,34 @@
 """Verification and validation for FEC data."""
 
-from dataclasses import dataclass
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
 
 import polars as pl
 from rich.console import Console
 from rich.table import Table
 
 from .config import Config
+from .utils.fingerprint import FileFingerprint, fingerprint_file
+from .utils.instrument import file_size, span
+from .utils.manifest import ManifestEntry, hash_file, load_manifest
 
 console = Console()
 
+VERIFY_CACHE_FILE = ".fec_verify_cache.json"
+
+# Bump when validation checks change, to invalidate cached results
+VERIFY_CACHE_VERSION = 2
+
+# Summarized amounts above this are flagged as likely data issues ($1 trillion)
+EXTREME_AMOUNT_THRESHOLD = 1_000_000_000_000
+
+# Amount column summed per cycle alongside the cycle counts (first present)
+CYCLE_AMOUNT_COLUMNS = ("total_amount", "ttl_receipts")
+
 
 @dataclass
 class ValidationResult:
@@ -24,169 +42,380 @@ class ValidationResult:
     min_cycle: int | None
     max_cycle: int | None
     issues: list[str]
+    cycle_counts: dict[int, int] = field(default_factory=dict)
+    cycle_amounts: dict[int, float] = field(default_factory=dict)
 
     @property
     def is_valid(self) -> bool:
         return len(self.issues) == 0
 
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "ValidationResult":
+        return cls(**{
+            **raw,
+            "cycle_counts": {int(c): n for c, n in raw.get("cycle_counts", {}).items()},
+            "cycle_amounts": {int(c): a for c, a in raw.get("cycle_amounts", {}).items()},
+        })
+
+
+@dataclass
+class VerifyCache:
+    """Validation results recorded per file, with the fingerprint validated."""
+
+    files: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, cache_file: Path) -> "VerifyCache":
+        """Load cache from JSON file."""
+        if not cache_file.exists():
+            return cls()
+
+        with open(cache_file) as f:
+            raw = json.load(f)
+
+        if raw.get("version") != VERIFY_CACHE_VERSION:
+            return cls()
+        return cls(files=raw.get("files", {}))
+
+    def save(self, cache_file: Path) -> None:
+        """Save cache to JSON file."""
+        with open(cache_file, "w") as f:
+            json.dump({"version": VERIFY_CACHE_VERSION, "files": self.files}, f, indent=2)
+
+    def get(
+        self, file_name: str, fingerprint: FileFingerprint, check_amounts: bool
+    ) -> ValidationResult | None:
+        """Get the cached result for a file, if its fingerprint is unchanged."""
+        entry = self.files.get(file_name)
+        if (
+            entry is None
+            or entry["check_amounts"] != check_amounts
+            or FileFingerprint.from_dict(entry["fingerprint"]) != fingerprint
+        ):
+            return None
+        return ValidationResult.from_dict(entry["result"])
+
+    def put(
+        self, fingerprint: FileFingerprint, check_amounts: bool, result: ValidationResult
+    ) -> None:
+        self.files[result.file_name] = {
+            "fingerprint": fingerprint.to_dict(),
+            "check_amounts": check_amounts,
+            "result": asdict(result),
+        }
+
+
+def get_verify_cache_file(config: Config) -> Path:
+    """Get the verification cache path (next to the update state file)."""
+    return config.state_file.with_name(VERIFY_CACHE_FILE)
+
+
+def _missing_result(file_name: str, issue: str) -> ValidationResult:
+    return ValidationResult(
+        file_name=file_name,
+        row_count=0,
+        column_count=0,
+        has_election_cycle=False,
+        null_election_cycle=0,
+        min_cycle=None,
+        max_cycle=None,
+        issues=[issue],
+    )
+
 
-def validate_file(file_path: Path) -> ValidationResult:
-    """Validate a single CSV file."""
+def _scan(file_path: Path) -> pl.LazyFrame:
+    # Use infer_schema_length=10000 and treat mixed types as strings
+    return pl.scan_csv(file_path, infer_schema_length=10000, ignore_errors=True)
+
+
+def validate_file(
+    file_path: Path, check_amounts: bool = False, cycle_counts: bool = False
+) -> ValidationResult:
+    """Validate a single CSV file.
+
+    All checks are computed from one lazy scan that reads only the columns
+    they need (election_cycle, and total_amount/transaction_count when
+    checking amounts).
+
+    Args:
+        file_path: CSV file to validate
+        check_amounts: If True, also check summarized amounts and counts
+        cycle_counts: If True, also count rows (and sum the amount column,
+            see CYCLE_AMOUNT_COLUMNS) per election cycle
+
+    Returns:
+        Validation result
+    """
     issues: list[str] = []
 
     try:
-        # Use infer_schema_length=10000 and treat mixed types as strings
-        df = pl.read_csv(file_path, infer_schema_length=10000, ignore_errors=True)
+        lf = _scan(file_path)
+        columns = lf.collect_schema().names()
+
+        has_election_cycle = "election_cycle" in columns
+        metrics = [pl.len().alias("row_count")]
+        if has_election_cycle:
+            cycle = pl.col("election_cycle")
+            metrics += [
+                cycle.null_count().alias("null_election_cycle"),
+                cycle.min().alias("min_cycle"),
+                cycle.max().alias("max_cycle"),
+            ]
+        if check_amounts and "total_amount" in columns:
+            metrics.append(
+                (pl.col("total_amount").abs() > EXTREME_AMOUNT_THRESHOLD).sum().alias("extreme_amounts")
+            )
+            if "transaction_count" in columns:
+                metrics.append((pl.col("transaction_count") <= 0).sum().alias("nonpositive_counts"))
+
+        queries = [lf.select(metrics)]
+        if cycle_counts and has_election_cycle:
+            per_cycle = [pl.len().alias("rows")]
+            amount_column = next((c for c in CYCLE_AMOUNT_COLUMNS if c in columns), None)
+            if amount_column:
+                per_cycle.append(pl.col(amount_column).sum().alias("amount"))
+            queries.append(lf.group_by("election_cycle").agg(per_cycle).sort("election_cycle"))
+
+        # Collected together, so the file is scanned once
+        frames = pl.collect_all(queries)
     except Exception as e:
-        return ValidationResult(
-            file_name=file_path.name,
-            row_count=0,
-            column_count=0,
-            has_election_cycle=False,
-            null_election_cycle=0,
-            min_cycle=None,
-            max_cycle=None,
-            issues=[f"Failed to read file: {e}"],
-        )
+        return _missing_result(file_path.name, f"Failed to read file: {e}")
 
-    row_count = len(df)
-    column_count = len(df.columns)
-
-    # Check for election_cycle column
-    has_election_cycle = "election_cycle" in df.columns
+    stats = frames[0].row(0, named=True)
+    row_count = stats["row_count"]
+    null_election_cycle = stats.get("null_election_cycle", 0)
 
     if not has_election_cycle:
         issues.append("Missing election_cycle column")
-        null_election_cycle = 0
-        min_cycle = None
-        max_cycle = None
-    else:
-        # Check for null election_cycle values
-        null_count = df.filter(pl.col("election_cycle").is_null()).height
-        null_election_cycle = null_count
-        if null_count > 0:
-            issues.append(f"{null_count:,} null election_cycle values")
-
-        # Get cycle range
-        cycles = df.select("election_cycle").unique().sort("election_cycle")
-        if len(cycles) > 0:
-            min_cycle = cycles.item(0, 0)
-            max_cycle = cycles.item(-1, 0)
-        else:
-            min_cycle = None
-            max_cycle = None
+    elif null_election_cycle > 0:
+        issues.append(f"{null_election_cycle:,} null election_cycle values")
 
     # Check for reasonable row count
     if row_count == 0:
         issues.append("File is empty")
 
+    # Check for extremely large amounts (potential data issues)
+    if stats.get("extreme_amounts"):
+        issues.append(f"{stats['extreme_amounts']} rows with amounts > $1 trillion")
+
+    # Check for reasonable transaction counts
+    if stats.get("nonpositive_counts"):
+        issues.append(f"{stats['nonpositive_counts']} rows with zero/negative transaction_count")
+
+    counts, amounts = {}, {}
+    if len(frames) > 1:
+        for row in frames[1].drop_nulls("election_cycle").iter_rows(named=True):
+            counts[row["election_cycle"]] = row["rows"]
+            if "amount" in row:
+                amounts[row["election_cycle"]] = float(row["amount"])
+
     return ValidationResult(
         file_name=file_path.name,
         row_count=row_count,
-        column_count=column_count,
+        column_count=len(columns),
         has_election_cycle=has_election_cycle,
         null_election_cycle=null_election_cycle,
-        min_cycle=min_cycle,
-        max_cycle=max_cycle,
+        min_cycle=stats.get("min_cycle"),
+        max_cycle=stats.get("max_cycle"),
         issues=issues,
+        cycle_counts=counts,
+        cycle_amounts=amounts,
     )
 
 
-def validate_transaction_amounts(file_path: Path) -> list[str]:
-    """Validate transaction amounts in summarized files."""
-    issues: list[str] = []
+def get_cycle_counts(file_path: Path) -> dict[int, int]:
+    """Get row counts per election cycle."""
+    return validate_file(file_path, cycle_counts=True).cycle_counts
+
+
+def _verify_output(
+    file_path: Path,
+    file_name: str,
+    check_amounts: bool,
+    cycle_counts: bool,
+    cache: VerifyCache | None,
+) -> tuple[ValidationResult, FileFingerprint | None, bool]:
+    """Validate one output file, or reuse its cached result.
+
+    Returns:
+        Tuple of (result, fingerprint, whether the result came from the cache)
+    """
+    fingerprint = fingerprint_file(file_path) if cache is not None else None
+    if cache is not None and fingerprint is not None:
+        cached = cache.get(file_name, fingerprint, check_amounts)
+        if cached is not None:
+            return cached, fingerprint, True
+
+    if not file_path.exists():
+        return _missing_result(file_name, "File not found"), None, False
+
+    with span("verify.validate_file", file=file_path.name) as s:
+        result = validate_file(file_path, check_amounts=check_amounts, cycle_counts=cycle_counts)
+        s.add(rows_in=result.row_count, bytes_read=file_size(file_path))
+    return result, fingerprint, False
+
+
+def verify_all(
+    config: Config,
+    cycle_counts: bool = False,
+    workers: int | None = None,
+    use_cache: bool = True,
+) -> list[ValidationResult]:
+    """Verify all data files.
+
+    Files are validated concurrently in a thread pool; Polars releases the
+    GIL while scanning, so the scans run in parallel.
+
+    With the cache, results (including per-cycle counts, which are then
+    always collected) are stored next to the update state file, keyed by
+    each file's fingerprint (size, mtime and sampled content hash), and
+    only files whose fingerprint changed are validated again.
+
+    Args:
+        config: Configuration
+        cycle_counts: If True, also count rows per election cycle (in the same scan)
+        workers: Threads to use (default: one per file, up to the CPU count)
+        use_cache: If False, validate every file and leave the cache untouched
+
+    Returns:
+        Results in dataset order (combine datasets, then summarize datasets)
+    """
+    console.print("\n[bold]Validating data files...[/bold]\n")
 
-    try:
-        df = pl.read_csv(file_path, infer_schema_length=10000, ignore_errors=True)
-    except Exception:
-        return ["Could not read file"]
+    cache_file = get_verify_cache_file(config)
+    cache = VerifyCache.load(cache_file) if use_cache else None
+    cycle_counts = cycle_counts or use_cache
 
-    if "total_amount" not in df.columns:
-        return []  # Not a summarized file
+    # Transaction summaries also get amount checks
+    outputs = [(ds.output_file, False) for ds in config.combine_datasets.values()]
+    outputs += [(ds.output_file, True) for ds in config.summarize_datasets.values()]
 
-    # Check for extremely large amounts (potential data issues)
-    extreme_threshold = 1_000_000_000_000  # $1 trillion
-    extreme_count = df.filter(pl.col("total_amount").abs() > extreme_threshold).height
-    if extreme_count > 0:
-        issues.append(f"{extreme_count} rows with amounts > $1 trillion")
+    max_workers = workers or max(1, min(len(outputs), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(
+                _verify_output, config.data_dir / name, name, check_amounts, cycle_counts, cache
+            )
+            for name, check_amounts in outputs
+        ]
+        verified = [future.result() for future in futures]
+
+    if cache is not None:
+        reused = sum(cached for _, _, cached in verified)
+        if reused:
+            console.print(
+                f"Reused cached results for {reused} unchanged file(s), "
+                f"validated {len(verified) - reused}\n"
+            )
 
-    # Check for reasonable transaction counts
-    if "transaction_count" in df.columns:
-        zero_count = df.filter(pl.col("transaction_count") <= 0).height
-        if zero_count > 0:
-            issues.append(f"{zero_count} rows with zero/negative transaction_count")
+        for (result, fingerprint, cached), (_, check_amounts) in zip(verified, outputs):
+            if fingerprint is not None and not cached:
+                cache.put(fingerprint, check_amounts, result)
+        cache.save(cache_file)
 
-    return issues
+    return [result for result, _, _ in verified]
 
 
-def get_cycle_counts(file_path: Path) -> dict[int, int]:
-    """Get row counts per election cycle."""
-    try:
-        df = pl.read_csv(file_path, infer_schema_length=10000, ignore_errors=True)
-        if "election_cycle" not in df.columns:
-            return {}
-
-        counts = (
-            df.group_by("election_cycle")
-            .count()
-            .sort("election_cycle")
-        )
+@dataclass
+class ChecksumResult:
+    """Result of checking a file against its manifest entry."""
 
-        return {row[0]: row[1] for row in counts.iter_rows()}
-    except Exception:
-        return {}
+    path: Path
+    size: int
+    rows: int | None
+    issues: list[str]
 
+    @property
+    def is_valid(self) -> bool:
+        return len(self.issues) == 0
 
-def verify_all(config: Config) -> list[ValidationResult]:
-    """Verify all data files."""
-    results: list[ValidationResult] = []
 
-    console.print("\n[bold]Validating data files...[/bold]\n")
+def check_checksum(path: Path, entry: ManifestEntry) -> ChecksumResult:
+    """Check a file's size and content hash against its manifest entry."""
+    issues: list[str] = []
 
-    # Validate combine datasets
-    for name, dataset in config.combine_datasets.items():
-        file_path = config.data_dir / dataset.output_file
-        if file_path.exists():
-            result = validate_file(file_path)
-            results.append(result)
+    with span("verify.checksum", file=path.name) as s:
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return ChecksumResult(path, 0, entry.rows, ["File not found"])
+
+        if size != entry.size:
+            issues.append(f"Size changed: {entry.size:,} → {size:,} bytes")
+        elif hash_file(path) != entry.digest:
+            s.add(bytes_read=size)
+            issues.append("Content hash does not match manifest")
         else:
-            results.append(
-                ValidationResult(
-                    file_name=dataset.output_file,
-                    row_count=0,
-                    column_count=0,
-                    has_election_cycle=False,
-                    null_election_cycle=0,
-                    min_cycle=None,
-                    max_cycle=None,
-                    issues=["File not found"],
-                )
-            )
+            s.add(bytes_read=size)
 
-    # Validate summarize datasets
-    for name, dataset in config.summarize_datasets.items():
-        file_path = config.data_dir / dataset.output_file
-        if file_path.exists():
-            result = validate_file(file_path)
-            # Additional validation for transaction files
-            amount_issues = validate_transaction_amounts(file_path)
-            result.issues.extend(amount_issues)
-            results.append(result)
-        else:
-            results.append(
-                ValidationResult(
-                    file_name=dataset.output_file,
-                    row_count=0,
-                    column_count=0,
-                    has_election_cycle=False,
-                    null_election_cycle=0,
-                    min_cycle=None,
-                    max_cycle=None,
-                    issues=["File not found"],
-                )
-            )
+    return ChecksumResult(path, size, entry.rows, issues)
 
-    return results
+
+def verify_checksums(
+    directories: list[Path], workers: int | None = None
+) -> tuple[list[ChecksumResult], list[Path]]:
+    """Verify output files against their checksum manifests.
+
+    Files are hashed concurrently in a thread pool, without being parsed.
+
+    Args:
+        directories: Directories whose manifests to check
+        workers: Threads to use (default: the CPU count)
+
+    Returns:
+        Tuple of (results for files with manifest entries, untracked data
+        files with no entry)
+    """
+    console.print("\n[bold]Verifying checksums...[/bold]\n")
+
+    checks: list[tuple[Path, ManifestEntry]] = []
+    untracked: list[Path] = []
+    for directory in directories:
+        manifest = load_manifest(directory)
+        checks += [(directory / name, entry) for name, entry in sorted(manifest.items())]
+        untracked += [
+            path for pattern in ("*.csv", "*.parquet")
+            for path in sorted(directory.glob(pattern))
+            if path.name not in manifest
+        ]
+
+    max_workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(lambda check: check_checksum(*check), checks))
+
+    return results, untracked
+
+
+def print_checksum_report(results: list[ChecksumResult], untracked: list[Path]) -> None:
+    """Print a formatted checksum report."""
+    table = Table(title="Checksum Report")
+    table.add_column("File", style="cyan")
+    table.add_column("Rows", justify="right")
+    table.add_column("Size (MB)", justify="right")
+    table.add_column("Status", justify="center")
+
+    for result in results:
+        table.add_row(
+            f"{result.path.parent.name}/{result.path.name}",
+            f"{result.rows:,}" if result.rows is not None else "",
+            f"{result.size / (1024 * 1024):,.1f}",
+            "[green]✓[/green]" if result.is_valid else "[red]✗[/red]",
+        )
+
+    console.print(table)
+
+    if untracked:
+        console.print(f"\n[yellow]{len(untracked)} file(s) not in a manifest (written before manifests existed?):[/yellow]")
+        for path in untracked:
+            console.print(f"  • {path.parent.name}/{path.name}")
+
+    if any(not r.is_valid for r in results):
+        console.print("\n[bold red]Checksum mismatches:[/bold red]")
+        for result in results:
+            for issue in result.issues:
+                console.print(f"  • {result.path.parent.name}/{result.path.name}: {issue}")
+    else:
+        console.print("\n[green]All checksums match![/green]")
 
 
 def print_verification_report(results: list[ValidationResult]) -> None:
@@ -226,20 +455,19 @@ def print_verification_report(results: list[ValidationResult]) -> None:
         console.print("\n[green]All validations passed![/green]")
 
 
-def print_cycle_summary(config: Config) -> None:
-    """Print row counts per cycle for all files."""
-    console.print("\n[bold]Row counts by election cycle:[/bold]\n")
+def print_cycle_summary(results: list[ValidationResult]) -> None:
+    """Print row counts per cycle for all files.
 
-    for name, dataset in list(config.combine_datasets.items()) + list(config.summarize_datasets.items()):
-        file_path = config.data_dir / dataset.output_file
-        if not file_path.exists():
-            continue
+    Uses the counts collected by verify_all(cycle_counts=True).
+    """
+    console.print("\n[bold]Row counts by election cycle:[/bold]\n")
 
-        counts = get_cycle_counts(file_path)
+    for result in results:
+        counts = result.cycle_counts
         if not counts:
             continue
 
-        console.print(f"[cyan]{dataset.output_file}[/cyan]")
+        console.print(f"[cyan]{result.file_name}[/cyan]")
         # Show last 5 cycles
         recent_cycles = sorted(counts.keys())[-5:]
         for cycle in recent_cycles:
@@ -0,0 +1,290 @@
+"""Anomaly detection on the history of per-cycle row counts and totals.
+
+verify keeps, next to the update state file, a compact history of the row
+count and amount sum of every dataset's cycles as of each run that changed
+them. The current values come from the verify cache, so checking a run
+only re-scans the files it rewrote.
+
+A cycle whose values changed since the last snapshot is flagged when:
+
+    - against the previous snapshot, the change is an outlier among the
+      cycle's earlier run-over-run changes (robust z-score of log ratios),
+      or, with too little history, at least MAX_CHANGE_RATIO either way;
+    - against the same phase of the cycle four years earlier (presidential
+      vs midterm), the ratio is an outlier among the dataset's other
+      completed cycles.
+
+A drop to zero rows is always flagged.
+"""
+
+import json
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from .config import Config, get_current_cycle
+from .verify import ValidationResult
+
+console = Console()
+
+VERIFY_HISTORY_FILE = ".fec_verify_history.json"
+VERIFY_HISTORY_VERSION = 1
+
+# Snapshots kept per dataset and cycle
+HISTORY_LENGTH = 20
+
+# Earlier changes needed before outliers are judged by z-score
+MIN_HISTORY = 4
+
+# Robust z-score (median/MAD of log ratios) above which a change is unusual
+Z_THRESHOLD = 3.5
+
+# Ratio flagged without enough history, and the smallest ratio ever flagged
+MAX_CHANGE_RATIO = 2.0
+MIN_CHANGE_RATIO = 1.25
+
+# Cycles back to the same phase of the election calendar
+PHASE_CYCLES = 4
+
+METRICS = ("rows", "amount")
+
+
+@dataclass
+class Anomaly:
+    """An unusual change in one dataset cycle's row count or total."""
+
+    file_name: str
+    cycle: int
+    metric: str
+    baseline: str
+    expected: float
+    actual: float
+    z_score: float | None = None
+
+    @property
+    def change(self) -> float:
+        if self.expected == 0:
+            return math.inf
+        return self.actual / self.expected - 1
+
+
+def _log_ratio(current: float | None, previous: float | None) -> float | None:
+    if current is None or previous is None or current <= 0 or previous <= 0:
+        return None
+    return math.log(current / previous)
+
+
+def _robust_z(value: float, sample: list[float]) -> float:
+    """Distance of value from the sample's median, in scaled MADs."""
+    center = median(sample)
+    mad = median(abs(x - center) for x in sample) * 1.4826
+    if mad == 0:
+        return 0.0 if value == center else math.inf
+    return (value - center) / mad
+
+
+def _is_outlier(delta: float, sample: list[float]) -> tuple[bool, float | None]:
+    """Judge a log ratio against earlier ones; returns (flagged, z-score)."""
+    if len(sample) < MIN_HISTORY:
+        return abs(delta) >= math.log(MAX_CHANGE_RATIO), None
+    z = _robust_z(delta, sample)
+    return abs(z) > Z_THRESHOLD and abs(delta) >= math.log(MIN_CHANGE_RATIO), z
+
+
+@dataclass
+class VerifyHistory:
+    """Snapshots of per-cycle row counts and amount sums, per output file."""
+
+    # file name -> cycle (as str) -> [{"at", "rows", "amount"}, ...], oldest first
+    files: dict[str, dict[str, list[dict[str, Any]]]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, history_file: Path) -> "VerifyHistory":
+        """Load history from JSON file."""
+        if not history_file.exists():
+            return cls()
+
+        with open(history_file) as f:
+            raw = json.load(f)
+
+        if raw.get("version") != VERIFY_HISTORY_VERSION:
+            return cls()
+        return cls(files=raw.get("files", {}))
+
+    def save(self, history_file: Path) -> None:
+        """Save history to JSON file."""
+        with open(history_file, "w") as f:
+            json.dump({"version": VERIFY_HISTORY_VERSION, "files": self.files}, f, indent=2)
+
+    def snapshots(self, file_name: str, cycle: int) -> list[dict[str, Any]]:
+        return self.files.get(file_name, {}).get(str(cycle), [])
+
+    def record(self, results: list[ValidationResult]) -> None:
+        """Append a snapshot for every cycle whose values changed.
+
+        Cycles that disappeared from a file are recorded with zero rows.
+        """
+        at = datetime.now().isoformat(timespec="seconds")
+        for result in results:
+            if not result.cycle_counts:
+                continue
+            cycles = self.files.setdefault(result.file_name, {})
+            for cycle in set(result.cycle_counts) | {int(c) for c in cycles}:
+                snapshot = _current(result, cycle)
+                series = cycles.setdefault(str(cycle), [])
+                if series and all(series[-1].get(m) == snapshot[m] for m in METRICS):
+                    continue
+                series.append({"at": at, **snapshot})
+                del series[:-HISTORY_LENGTH]
+
+
+def _current(result: ValidationResult, cycle: int) -> dict[str, Any]:
+    return {
+        "rows": result.cycle_counts.get(cycle, 0),
+        # Rounded so reordered float sums of unchanged data compare equal
+        "amount": round(result.cycle_amounts[cycle], 2) if cycle in result.cycle_amounts else None,
+    }
+
+
+def get_verify_history_file(config: Config) -> Path:
+    """Get the verification history path (next to the update state file)."""
+    return config.state_file.with_name(VERIFY_HISTORY_FILE)
+
+
+def _run_over_run(
+    result: ValidationResult, cycle: int, series: list[dict[str, Any]]
+) -> list[Anomaly]:
+    anomalies = []
+    current, previous = _current(result, cycle), series[-1]
+
+    for metric in METRICS:
+        actual, expected = current[metric], previous.get(metric)
+        if actual is None or expected is None or actual == expected:
+            continue
+
+        if metric == "rows" and actual == 0:
+            anomalies.append(Anomaly(result.file_name, cycle, metric, "previous run", expected, actual))
+            continue
+
+        delta = _log_ratio(actual, expected)
+        if delta is None:
+            continue
+        earlier = [
+            d for a, b in zip(series[1:], series[:-1])
+            if (d := _log_ratio(a.get(metric), b.get(metric))) is not None
+        ]
+        flagged, z = _is_outlier(delta, earlier)
+        if flagged:
+            anomalies.append(Anomaly(result.file_name, cycle, metric, "previous run", expected, actual, z))
+
+    return anomalies
+
+
+def _cycle_over_cycle(result: ValidationResult, cycle: int) -> list[Anomaly]:
+    anomalies = []
+    # A cycle still in progress is short of its predecessors by design
+    completed = [c for c in sorted(result.cycle_counts) if c < get_current_cycle()]
+    if cycle not in completed:
+        return anomalies
+
+    for metric, values in (("rows", result.cycle_counts), ("amount", result.cycle_amounts)):
+        baseline = cycle - PHASE_CYCLES
+        delta = _log_ratio(values.get(cycle), values.get(baseline))
+        if delta is None:
+            continue
+        others = [
+            d for c in completed
+            if c != cycle and (d := _log_ratio(values.get(c), values.get(c - PHASE_CYCLES))) is not None
+        ]
+        # Only ever judged against history; a young dataset has no baseline
+        if len(others) < MIN_HISTORY:
+            continue
+        flagged, z = _is_outlier(delta, others)
+        if flagged:
+            anomalies.append(
+                Anomaly(result.file_name, cycle, metric, f"{baseline} cycle", values[baseline], values[cycle], z)
+            )
+
+    return anomalies
+
+
+def detect_anomalies(results: list[ValidationResult], history: VerifyHistory) -> list[Anomaly]:
+    """Flag unusual changes in the cycles that changed since the last snapshot.
+
+    Uses only the results' per-cycle aggregates and the history; no data is
+    read. Files with no history yet are skipped (their first snapshot is
+    the baseline).
+
+    Args:
+        results: Verification results with cycle counts (from verify_all)
+        history: History before these results are recorded
+
+    Returns:
+        Anomalies in result order
+    """
+    anomalies = []
+    for result in results:
+        if not result.cycle_counts or result.file_name not in history.files:
+            continue
+
+        known = {int(c) for c in history.files[result.file_name]}
+        for cycle in sorted(set(result.cycle_counts) | known):
+            series = history.snapshots(result.file_name, cycle)
+            if series and all(series[-1].get(m) == v for m, v in _current(result, cycle).items()):
+                continue
+
+            if series:
+                anomalies.extend(_run_over_run(result, cycle, series))
+            anomalies.extend(_cycle_over_cycle(result, cycle))
+
+    return anomalies
+
+
+def check_history(config: Config, results: list[ValidationResult]) -> list[Anomaly]:
+    """Detect anomalies against the stored history, then record the results."""
+    history_file = get_verify_history_file(config)
+    history = VerifyHistory.load(history_file)
+    anomalies = detect_anomalies(results, history)
+    history.record(results)
+    history.save(history_file)
+    return anomalies
+
+
+def print_anomalies(anomalies: list[Anomaly]) -> None:
+    """Print flagged changes, or a one-line all-clear."""
+    if not anomalies:
+        console.print("\n[green]No unusual changes in per-cycle row counts or totals.[/green]")
+        return
+
+    table = Table(title="Unusual Changes")
+    table.add_column("File", style="cyan")
+    table.add_column("Cycle", justify="right")
+    table.add_column("Metric")
+    table.add_column("Compared to")
+    table.add_column("Was", justify="right")
+    table.add_column("Now", justify="right")
+    table.add_column("Change", justify="right", style="yellow")
+
+    for anomaly in anomalies:
+        fmt = "{:,.0f}" if anomaly.metric == "rows" else "${:,.2f}"
+        change = "new" if math.isinf(anomaly.change) else f"{anomaly.change:+.0%}"
+        if anomaly.z_score is not None and not math.isinf(anomaly.z_score):
+            change += f" (z={anomaly.z_score:+.1f})"
+        table.add_row(
+            anomaly.file_name,
+            str(anomaly.cycle),
+            anomaly.metric,
+            anomaly.baseline,
+            fmt.format(anomaly.expected),
+            fmt.format(anomaly.actual),
+            change,
+        )
+
+    console.print()
+    console.print(table)
@@ -0,0 +1,347 @@
+"""Streaming statistical verification of individual contribution files.
+
+The individual contribution files are far too large to read eagerly, so
+each file is scanned in blocks of whole lines with every column read as
+text, and only small per-block aggregates are kept:
+
+- row count
+- null and invalid transaction_dt rates
+- duplicate sub_id count
+- transaction_amt percentiles
+- rows with a value ignore_errors would null (the text does not parse as
+  the column's inferred type), i.e. data silently dropped by readers using
+  FEC_READ_PARAMS
+
+Duplicates and percentiles come from a hash partition of sub_id: only rows
+whose sub_id hashes into one of `key_sample_rate` buckets are kept. Copies
+of a sub_id always land in the same bucket, so duplicates within the
+partition scale up to an unbiased estimate, and memory stays bounded
+however large the file.
+
+With a sample fraction or a time budget, a random subset of blocks is
+scanned (spread over the whole file) and counts are extrapolated from the
+bytes covered.
+"""
+
+import io
+import math
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+from .utils.instrument import span
+from .utils.io import FEC_READ_PARAMS
+
+console = Console()
+
+# Bytes scanned per block
+STATS_BLOCK_SIZE = 32 * 1024 * 1024
+
+# Rows kept for the duplicate check and amount percentiles, at most
+KEY_SAMPLE_TARGET = 2_000_000
+
+AMOUNT_PERCENTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+# Rates above these are reported as issues
+MAX_INVALID_DATE_RATE = 0.01
+MAX_COERCED_RATE = 0.001
+
+DATE_FORMATS = ("%m%d%Y", "%m/%d/%Y", "%Y-%m-%d")
+
+
+@dataclass
+class IndividualFileStats:
+    """Statistics of one individual contributions file."""
+
+    file_name: str
+    size: int
+    header_size: int = 0
+    bytes_scanned: int = 0
+    rows_scanned: int = 0
+    null_transaction_dt: int = 0
+    invalid_transaction_dt: int = 0
+    rows_coerced: int = 0
+    sampled_keys: int = 0
+    duplicate_sub_ids: int = 0
+    key_sample_rate: int = 1
+    amount_percentiles: dict[float, float] = field(default_factory=dict)
+    seconds: float = 0.0
+    issues: list[str] = field(default_factory=list)
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of the file's data (bytes after the header) scanned."""
+        data_size = self.size - self.header_size
+        return self.bytes_scanned / data_size if data_size > 0 else 1.0
+
+    @property
+    def estimated_rows(self) -> int:
+        return round(self.rows_scanned / self.coverage) if self.coverage else 0
+
+    @property
+    def estimated_duplicates(self) -> int:
+        """Duplicate sub_ids, extrapolated to the whole file."""
+        return round(self.duplicate_sub_ids * self.key_sample_rate / self.coverage) if self.coverage else 0
+
+    @property
+    def is_exact(self) -> bool:
+        return self.coverage >= 1.0 and self.key_sample_rate == 1
+
+    def rate(self, count: int) -> float:
+        return count / self.rows_scanned if self.rows_scanned else 0.0
+
+    @property
+    def is_valid(self) -> bool:
+        return len(self.issues) == 0
+
+
+def _iter_blocks(
+    path: Path,
+    header_size: int,
+    block_size: int,
+    fraction: float,
+    deadline: float | None,
+    seed: int,
+) -> Iterator[bytes]:
+    """Yield blocks of whole lines, all in order or a random subset.
+
+    A line belongs to the block holding its first byte. When sampling (a
+    fraction below 1 or a deadline), blocks are visited in random order, so
+    whatever is scanned before the deadline is spread over the file.
+    """
+    size = path.stat().st_size
+    count = max(1, math.ceil((size - header_size) / block_size))
+    order = list(range(count))
+    if fraction < 1 or deadline is not None:
+        random.Random(seed).shuffle(order)
+        order = order[:max(1, math.ceil(count * fraction))]
+
+    with open(path, "rb") as f:
+        for n, i in enumerate(order):
+            if deadline is not None and n > 0 and time.monotonic() > deadline:
+                return
+
+            start = header_size + i * block_size
+            end = min(start + block_size, size)
+            if start > header_size:
+                # Skip the line that began in the previous block
+                f.seek(start - 1)
+                f.readline()
+            else:
+                f.seek(start)
+
+            if f.tell() >= end:
+                continue
+            data = f.read(end - f.tell())
+            if data and not data.endswith(b"\n"):
+                # Finish the last line (one starting at end belongs to the next block)
+                data += f.readline()
+            if data:
+                yield data
+
+
+def _valid_date(col: pl.Expr) -> pl.Expr:
+    """Whether a text date parses in one of the formats the repo handles.
+
+    7-digit dates are MDDYYYY (MMDDYYYY with the leading zero lost).
+    """
+    text = col.str.strip_chars()
+    text = pl.when(text.str.len_chars() == 7).then(pl.lit("0") + text).otherwise(text)
+    parsed = pl.coalesce([text.str.to_date(fmt, strict=False) for fmt in DATE_FORMATS])
+    return parsed.is_not_null()
+
+
+def scan_individual_file(
+    path: Path,
+    fraction: float = 1.0,
+    time_budget: float | None = None,
+    block_size: int = STATS_BLOCK_SIZE,
+    seed: int = 0,
+) -> IndividualFileStats:
+    """Scan an individual contributions file for statistics with bounded memory.
+
+    Args:
+        path: Individual contributions CSV
+        fraction: Fraction of blocks to scan (1.0 scans the whole file)
+        time_budget: Stop sampling blocks after this many seconds
+        block_size: Bytes per block
+        seed: Random seed for block sampling
+
+    Returns:
+        Statistics; counts cover the scanned rows, estimates the whole file
+    """
+    started = time.monotonic()
+    deadline = started + time_budget if time_budget is not None else None
+    stats = IndividualFileStats(file_name=path.name, size=path.stat().st_size)
+
+    with open(path, "rb") as f:
+        header_line = f.readline()
+        head = f.read(1024 * 1024)
+    header_size = stats.header_size = len(header_line)
+    columns = header_line.decode("utf-8", "replace").strip().split(",")
+
+    # Types readers infer with FEC_READ_PARAMS; text that does not parse as
+    # its column's type is what ignore_errors turns into nulls
+    inferred = pl.scan_csv(path, **FEC_READ_PARAMS).collect_schema()
+    typed = [c for c in columns if c in inferred and inferred[c] != pl.Utf8]
+
+    # Keep about KEY_SAMPLE_TARGET rows of the expected scan for the key sample
+    avg_line = len(head) / max(head.count(b"\n"), 1)
+    expected_rows = (stats.size - header_size) * fraction / max(avg_line, 1)
+    stats.key_sample_rate = max(1, math.ceil(expected_rows / KEY_SAMPLE_TARGET))
+
+    text_schema = {c: pl.Utf8 for c in columns}
+    dt = pl.col("transaction_dt")
+    metrics = [
+        pl.len().alias("rows"),
+        dt.is_null().sum().alias("null_dt"),
+        (dt.is_not_null() & ~_valid_date(dt)).sum().alias("invalid_dt"),
+        pl.any_horizontal(
+            [pl.col(c).is_not_null() & pl.col(c).cast(inferred[c], strict=False).is_null() for c in typed]
+            or [pl.lit(False)]
+        ).sum().alias("coerced"),
+    ]
+    in_sample = pl.col("sub_id").hash(seed=0) % stats.key_sample_rate == 0
+
+    key_frames: list[pl.DataFrame] = []
+    with span("verify.individual_stats", file=path.name) as s:
+        for data in _iter_blocks(path, header_size, block_size, fraction, deadline, seed):
+            lf = pl.scan_csv(
+                io.BytesIO(data),
+                has_header=False,
+                schema=text_schema,
+                encoding="utf8-lossy",
+                truncate_ragged_lines=True,
+            )
+            block, keys = pl.collect_all([
+                lf.select(metrics),
+                lf.filter(in_sample).select(
+                    "sub_id", pl.col("transaction_amt").cast(pl.Float64, strict=False)
+                ),
+            ])
+            row = block.row(0, named=True)
+            stats.bytes_scanned += len(data)
+            stats.rows_scanned += row["rows"]
+            stats.null_transaction_dt += row["null_dt"]
+            stats.invalid_transaction_dt += row["invalid_dt"]
+            stats.rows_coerced += row["coerced"]
+            key_frames.append(keys)
+
+        s.add(rows_in=stats.rows_scanned, bytes_read=stats.bytes_scanned)
+
+    if key_frames:
+        keys = pl.concat(key_frames)
+        stats.sampled_keys = len(keys)
+        stats.duplicate_sub_ids = len(keys) - keys["sub_id"].n_unique()
+        amounts = keys["transaction_amt"].drop_nulls()
+        if len(amounts):
+            stats.amount_percentiles = {q: amounts.quantile(q) for q in AMOUNT_PERCENTILES}
+
+    stats.seconds = time.monotonic() - started
+    _add_issues(stats)
+    return stats
+
+
+def _add_issues(stats: IndividualFileStats) -> None:
+    if stats.rows_scanned == 0:
+        stats.issues.append("File is empty")
+        return
+
+    approx = "" if stats.is_exact else "~"
+    if stats.duplicate_sub_ids:
+        stats.issues.append(f"{approx}{stats.estimated_duplicates:,} duplicate sub_id rows")
+    if stats.rate(stats.invalid_transaction_dt) > MAX_INVALID_DATE_RATE:
+        stats.issues.append(f"{stats.rate(stats.invalid_transaction_dt):.2%} invalid transaction_dt values")
+    if stats.rate(stats.rows_coerced) > MAX_COERCED_RATE:
+        stats.issues.append(f"{stats.rate(stats.rows_coerced):.2%} rows with values nulled by ignore_errors")
+
+
+def verify_individual(
+    individual_dir: Path,
+    cycles: list[int] | None = None,
+    fraction: float = 1.0,
+    time_budget: float | None = None,
+    workers: int | None = None,
+) -> list[IndividualFileStats]:
+    """Scan individual contribution files for statistics, per cycle in parallel.
+
+    Args:
+        individual_dir: Directory of {cycle}_individual_contributions.csv files
+        cycles: Only these cycles (default: all files)
+        fraction: Fraction of each file to sample
+        time_budget: Total seconds to spend; each file gets an equal share
+            of the worker time
+        workers: Files scanned at once (default: one per file, up to the CPU count)
+
+    Returns:
+        Statistics in cycle order
+    """
+    files = sorted(individual_dir.glob("*_individual_contributions.csv"))
+    if cycles:
+        files = [f for f in files if int(f.name.split("_")[0]) in cycles]
+
+    console.print(f"\n[bold]Scanning {len(files)} individual contribution file(s)...[/bold]\n")
+    if not files:
+        return []
+
+    max_workers = workers or max(1, min(len(files), os.cpu_count() or 1))
+    file_budget = None
+    if time_budget is not None:
+        file_budget = time_budget / math.ceil(len(files) / max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(
+            lambda path: scan_individual_file(path, fraction=fraction, time_budget=file_budget),
+            files,
+        ))
+
+
+def print_individual_report(results: list[IndividualFileStats]) -> None:
+    """Print a formatted statistics report for individual contribution files."""
+    table = Table(title="Individual Contributions Statistics")
+    table.add_column("File", style="cyan")
+    table.add_column("Rows", justify="right")
+    table.add_column("Scanned", justify="right")
+    table.add_column("Null dt", justify="right")
+    table.add_column("Bad dt", justify="right")
+    table.add_column("Dup sub_id", justify="right")
+    table.add_column("Nulled", justify="right")
+    table.add_column("Amt p1/p50/p99", justify="right")
+    table.add_column("OK", justify="center")
+
+    for result in results:
+        approx = "" if result.coverage >= 1.0 else "~"
+        dup_approx = "" if result.is_exact else "~"
+        pct = result.amount_percentiles
+        amounts = f"{pct[0.01]:,.0f}/{pct[0.5]:,.0f}/{pct[0.99]:,.0f}" if pct else ""
+
+        table.add_row(
+            result.file_name,
+            f"{approx}{result.estimated_rows:,}",
+            f"{result.coverage:.0%}",
+            f"{result.rate(result.null_transaction_dt):.2%}",
+            f"{result.rate(result.invalid_transaction_dt):.2%}",
+            f"{dup_approx}{result.estimated_duplicates:,}",
+            f"{result.rate(result.rows_coerced):.2%}",
+            amounts,
+            "[green]✓[/green]" if result.is_valid else "[red]✗[/red]",
+        )
+
+    console.print(table)
+
+    has_issues = any(r.issues for r in results)
+    if has_issues:
+        console.print("\n[bold red]Issues found:[/bold red]")
+        for result in results:
+            for issue in result.issues:
+                console.print(f"  • {result.file_name}: {issue}")
+    else:
+        console.print("\n[green]All individual contribution files passed![/green]")
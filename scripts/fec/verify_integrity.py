@@ -0,0 +1,213 @@
+"""Cross-dataset referential-integrity checks.
+
+Committee and candidate IDs in the dependent datasets should exist in the
+registration files for the same cycle. The registration files are read
+once into compact per-cycle key sets (distinct election_cycle/ID pairs;
+FEC IDs fit inline in Polars' string views). Every dependent dataset is
+then streamed against them with an anti-join, so only orphans are ever
+materialized.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+from .config import Config
+from .utils.instrument import span
+from .utils.io import collect_streaming
+
+console = Console()
+
+COMMITTEES = "committees"
+CANDIDATES = "candidates"
+
+# Key sets: reference name -> (registration dataset, ID column)
+KEY_SOURCES = {
+    COMMITTEES: ("committee_registrations", "cmte_id"),
+    CANDIDATES: ("candidate_registrations", "cand_id"),
+}
+
+# Dependent dataset, ID column, and the key set it must be found in
+INTEGRITY_RULES = [
+    ("committee_to_candidate_summaries", "cmte_id", COMMITTEES),
+    ("candidate_committee_links", "cmte_id", COMMITTEES),
+    ("candidate_committee_links", "cand_id", CANDIDATES),
+    ("committee_transaction_summaries", "source_cmte_id", COMMITTEES),
+    ("expenditures_by_category", "cmte_id", COMMITTEES),
+    ("pac_party_summaries", "cmte_id", COMMITTEES),
+    ("house_senate_campaign_summaries", "cand_id", CANDIDATES),
+]
+
+# The crosswalk has no cycle; its cand_ids must be registered in some cycle
+CROSSWALK_FILE = "cand_id_bioguide_crosswalk.csv"
+
+# Orphan IDs listed per cycle
+ORPHAN_SAMPLE_SIZE = 5
+
+
+@dataclass
+class IntegrityResult:
+    """Orphan IDs of one dependent column."""
+
+    file_name: str
+    column: str
+    reference: str
+    same_cycle: bool = True
+    rows_checked: int = 0
+    # cycle (None for the crosswalk) -> (orphan rows, distinct orphan IDs, sample IDs)
+    orphans: dict[int | None, tuple[int, int, list[str]]] = field(default_factory=dict)
+    issues: list[str] = field(default_factory=list)
+
+    @property
+    def orphan_rows(self) -> int:
+        return sum(rows for rows, _, _ in self.orphans.values())
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.issues and not self.orphans
+
+
+def build_key_sets(config: Config) -> dict[str, pl.DataFrame]:
+    """Read the registration files once into per-cycle key sets.
+
+    Returns:
+        Reference name -> distinct (election_cycle, id) pairs
+    """
+    key_sets = {}
+    for reference, (dataset, column) in KEY_SOURCES.items():
+        path = config.data_dir / config.combine_datasets[dataset].output_file
+        with span("verify.integrity_keys", file=path.name) as s:
+            keys = (
+                pl.scan_csv(path, infer_schema=False)
+                .select(pl.col("election_cycle").cast(pl.Int64, strict=False), pl.col(column).alias("id"))
+                .drop_nulls()
+                .unique()
+            )
+            key_sets[reference] = collect_streaming(keys)
+            s.add(rows_out=len(key_sets[reference]))
+    return key_sets
+
+
+def check_column(
+    path: Path,
+    column: str,
+    reference: str,
+    keys: pl.DataFrame,
+    by_cycle: bool = True,
+) -> IntegrityResult:
+    """Stream one dependent column against a key set and collect its orphans.
+
+    Args:
+        path: Dependent CSV file
+        column: ID column to check
+        reference: Name of the key set
+        keys: Key set from build_key_sets
+        by_cycle: If True, IDs must be registered in the row's own cycle;
+            otherwise in any cycle
+    """
+    result = IntegrityResult(file_name=path.name, column=column, reference=reference, same_cycle=by_cycle)
+    if not path.exists():
+        result.issues.append("File not found")
+        return result
+
+    with span("verify.integrity_check", file=path.name, column=column) as s:
+        lf = pl.scan_csv(path, infer_schema=False)
+        if column not in lf.collect_schema().names():
+            result.issues.append(f"Missing {column} column")
+            return result
+
+        cycle = pl.col("election_cycle").cast(pl.Int64, strict=False) if by_cycle else pl.lit(None, pl.Int64)
+        ids = lf.select(cycle.alias("election_cycle"), pl.col(column).alias("id")).filter(
+            pl.col("id").is_not_null() & (pl.col("id") != "")
+        )
+
+        if by_cycle:
+            orphans = ids.join(keys.lazy(), on=["election_cycle", "id"], how="anti")
+        else:
+            orphans = ids.join(keys.lazy().select("id").unique(), on="id", how="anti")
+
+        summary = orphans.group_by("election_cycle").agg(
+            pl.len().alias("rows"),
+            pl.col("id").n_unique().alias("distinct"),
+            pl.col("id").unique(maintain_order=True).head(ORPHAN_SAMPLE_SIZE).alias("sample"),
+        ).sort("election_cycle")
+
+        checked, summary = pl.collect_all([ids.select(pl.len()), summary])
+        result.rows_checked = checked.item()
+        s.add(rows_in=result.rows_checked)
+
+    for cycle_value, rows, distinct, sample in summary.iter_rows():
+        result.orphans[cycle_value] = (rows, distinct, list(sample))
+    return result
+
+
+def verify_integrity(config: Config, workers: int | None = None) -> list[IntegrityResult]:
+    """Check every dependent dataset's IDs against the registration files.
+
+    Args:
+        config: Configuration
+        workers: Columns checked at once (default: the CPU count)
+
+    Returns:
+        One result per rule, then the crosswalk check if the crosswalk exists
+    """
+    console.print("\n[bold]Checking referential integrity...[/bold]\n")
+
+    key_sets = build_key_sets(config)
+    datasets = {**config.combine_datasets, **config.summarize_datasets}
+
+    checks = [
+        (config.data_dir / datasets[dataset].output_file, column, reference, key_sets[reference], True)
+        for dataset, column, reference in INTEGRITY_RULES
+        if dataset in datasets
+    ]
+    crosswalk = config.data_dir / CROSSWALK_FILE
+    if crosswalk.exists():
+        checks.append((crosswalk, "cand_id", CANDIDATES, key_sets[CANDIDATES], False))
+
+    max_workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda check: check_column(*check), checks))
+
+
+def print_integrity_report(results: list[IntegrityResult]) -> None:
+    """Print orphan counts per column, with samples per cycle."""
+    table = Table(title="Referential Integrity Report")
+    table.add_column("File", style="cyan")
+    table.add_column("Column")
+    table.add_column("Must exist in")
+    table.add_column("Rows", justify="right")
+    table.add_column("Orphan rows", justify="right")
+    table.add_column("Status", justify="center")
+
+    for result in results:
+        table.add_row(
+            result.file_name,
+            result.column,
+            f"{result.reference} ({'same' if result.same_cycle else 'any'} cycle)",
+            f"{result.rows_checked:,}",
+            f"{result.orphan_rows:,}",
+            "[green]✓[/green]" if result.is_valid else "[red]✗[/red]",
+        )
+
+    console.print(table)
+
+    if all(result.is_valid for result in results):
+        console.print("\n[green]No orphan IDs found![/green]")
+        return
+
+    console.print("\n[bold red]Orphans found:[/bold red]")
+    for result in results:
+        for issue in result.issues:
+            console.print(f"  • {result.file_name}: {issue}")
+        for cycle, (rows, distinct, sample) in result.orphans.items():
+            where = f" in {cycle}" if cycle is not None else ""
+            console.print(
+                f"  • {result.file_name}.{result.column}{where}: {distinct:,} unknown "
+                f"{result.reference[:-1]} ID(s) in {rows:,} rows, e.g. {', '.join(sample)}"
+            )
@@ -18,6 +18,7 @@ console = Console()
 SCRIPT_DIR = Path(__file__).parent.parent
 CONFIG_PATH = SCRIPT_DIR / "config" / "datasets.yaml"
 DATA_DIR = SCRIPT_DIR.parent / "data"
+PROFILE_DIR = SCRIPT_DIR.parent / "profiles"
 
 
 @click.group()
@@ -33,13 +34,47 @@ DATA_DIR = SCRIPT_DIR.parent / "data"
     default=DATA_DIR,
     help="Path to data directory",
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the command (pstats and collapsed stacks)",
+)
+@click.option(
+    "--profile-mode",
+    type=click.Choice(["deterministic", "sampling"]),
+    default="deterministic",
+    show_default=True,
+    help="cProfile plus stack sampling, or stack sampling only (lower overhead)",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=PROFILE_DIR,
+    show_default=True,
+    help="Directory for profile output",
+)
 @click.pass_context
-def cli(ctx: click.Context, config: Path, data_dir: Path) -> None:
+def cli(
+    ctx: click.Context,
+    config: Path,
+    data_dir: Path,
+    profile: bool,
+    profile_mode: str,
+    profile_dir: Path,
+) -> None:
     """FEC Data Update Workflow.
 
     Check for updates, download new data, and integrate into existing files.
     """
     ctx.ensure_object(dict)
+
+    if profile:
+        # Shared with the fec package, which sits next to this one
+        from fec.utils.profiling import Profiler
+
+        profiler = Profiler(profile_dir, f"fec_update_{ctx.invoked_subcommand}", mode=profile_mode)
+        ctx.call_on_close(profiler.stop)
+        profiler.start()
     ctx.obj["config"] = Config.load(config, data_dir)
     ctx.obj["state"] = UpdateState.load(ctx.obj["config"].state_file)
 
@@ -0,0 +1,44 @@
+"""Per-cycle caching of individual contribution summaries."""
+
+from pathlib import Path
+
+import polars as pl
+
+from fec.processors.individual import IndividualSummarizer
+
+
+def lookup(rows: list[tuple[int, str, str, int, int]]) -> pl.DataFrame:
+    return pl.DataFrame(
+        rows,
+        schema=["election_cycle", "cmte_id", "cand_id", "cmte_key", "cand_key"],
+        orient="row",
+    )
+
+
+def test_committee_change_only_recomputes_its_cycle(tmp_path: Path, monkeypatch):
+    files = []
+    for cycle in (2022, 2024):
+        path = tmp_path / f"{cycle}_individual_contributions.csv"
+        path.write_text(f"election_cycle,sub_id\n{cycle},1\n")
+        files.append((cycle, path))
+
+    summarizer = IndividualSummarizer(tmp_path, tmp_path, tmp_path / "out.csv", cache_dir=tmp_path / "cache")
+    processed = []
+
+    def process_cycle(input_file, cycle, committee_lookup, show_progress=True):
+        processed.append(cycle)
+        return pl.DataFrame({"election_cycle": [cycle], "total_raised": [100]})
+
+    monkeypatch.setattr(summarizer, "process_cycle", process_cycle)
+
+    committees = lookup([(2022, "C00000001", "H2XX00001", 1, 2), (2024, "C00000003", "H4XX00001", 3, 4)])
+    summarizer.summarize_cycles(files, committees)
+    assert processed == [2022, 2024]
+
+    # A refresh adds a 2024 committee (and new dictionary keys)
+    processed.clear()
+    committees = pl.concat([committees, lookup([(2024, "C00000005", "H4XX00002", 5, 6)])])
+    results = summarizer.summarize_cycles(files, committees)
+
+    assert processed == [2024]
+    assert [r["election_cycle"].item() for r in results] == [2022, 2024]
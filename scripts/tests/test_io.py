@@ -0,0 +1,42 @@
+"""Block readers must match whole-file reads wherever blocks are cut."""
+
+import io
+
+import pytest
+
+from fec.utils.io import read_fec_pipe_delimited, read_fec_pipe_delimited_blocks
+
+COLUMNS = ["sub_id", "name", "memo"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        # A short line starting a later block
+        b"1|a|x\n2|b|y\n3|c\n7|k|l\n",
+        # A blank line starting a later block
+        b"1|a|x\n2|b|y\n\n7|k|l\n8|m|n\n",
+        # CRLF line endings
+        b"1|a|x\r\n2|b|y\r\n3|c\r\n7|k|l\r\n",
+    ],
+)
+@pytest.mark.parametrize("block_size", [1, 6, 12, 1024])
+def test_pipe_delimited_blocks_match_whole_file(data: bytes, block_size: int):
+    expected = read_fec_pipe_delimited(io.BytesIO(data), COLUMNS)
+    actual = read_fec_pipe_delimited_blocks(io.BytesIO(data), COLUMNS, block_size=block_size)
+
+    assert actual.rows() == expected.rows()
+
+
+def test_short_line_is_padded():
+    df = read_fec_pipe_delimited_blocks(io.BytesIO(b"1|a|x\n2|b|y\n3|c\n7|k|l\n"), COLUMNS, block_size=12)
+
+    assert df.rows() == [(1, "a", "x"), (2, "b", "y"), (3, "c", None), (7, "k", "l")]
+
+
+@pytest.mark.parametrize("block_size", [1, 6])
+def test_long_line_is_truncated(block_size: int):
+    data = b"1|a|x\n2|b|y|\n3|c|d|e\n4|f|g\n"
+    df = read_fec_pipe_delimited_blocks(io.BytesIO(data), COLUMNS, block_size=block_size)
+
+    assert df.rows() == [(1, "a", "x"), (2, "b", "y"), (3, "c", "d"), (4, "f", "g")]
@@ -0,0 +1,59 @@
+"""Fused migrations of partly converted files."""
+
+from pathlib import Path
+
+from fec.migrate import FileMigration, apply_migration, plan_migration
+from fec.utils.io import read_fec_csv
+
+
+def write_mixed(path: Path, first: str, second: str) -> None:
+    path.write_text(
+        "cand_id,cand_name,filing_dt\n"
+        + "".join(f"H0XX0000{i},SMITH BOB,{first}\n" for i in range(1500))
+        + "".join(f"H4XX0000{i},SMITH BOB,{second}\n" for i in range(1500))
+    )
+
+
+def migrate(path: Path) -> list[str]:
+    plan = plan_migration(FileMigration(path, date_columns=["filing_dt"], backup=False))
+    assert plan.date_columns == ["filing_dt"]
+    apply_migration(plan)
+    return read_fec_csv(path, with_sidecar=False)["filing_dt"].unique().sort().to_list()
+
+
+def test_mixed_dates_keep_iso_values(tmp_path: Path):
+    path = tmp_path / "candidates.csv"
+    write_mixed(path, "12/31/1980", "2024-12-31")
+
+    assert migrate(path) == ["1980-12-31", "2024-12-31"]
+
+
+def test_mixed_dates_found_past_the_head(tmp_path: Path):
+    path = tmp_path / "candidates.csv"
+    write_mixed(path, "2024-12-31", "12/31/1980")
+
+    assert migrate(path) == ["1980-12-31", "2024-12-31"]
+
+    # Fully converted now, so nothing is pending
+    plan = plan_migration(FileMigration(path, date_columns=["filing_dt"]))
+    assert not plan.is_pending
+
+
+def test_all_caps_names_found_past_the_head(tmp_path: Path):
+    path = tmp_path / "candidates.csv"
+    path.write_text(
+        "cand_id,cand_name,filing_dt\n"
+        + "".join(f"H0XX0000{i},\"DeSantis, Ron\",1980-12-31\n" for i in range(1500))
+        + "".join(f"H4XX0000{i},PAC 54,2024-12-31\n" for i in range(10))
+        + "".join(f"H4XX0001{i},\"SMITH, BOB\",2024-12-31\n" for i in range(1500))
+    )
+
+    plan = plan_migration(FileMigration(path, name_columns=["cand_name"], backup=False))
+    assert plan.name_columns == ["cand_name"]
+    assert plan.samples == [("SMITH, BOB", "Smith, Bob")]
+    apply_migration(plan)
+
+    names = read_fec_csv(path, with_sidecar=False)["cand_name"].unique().sort().to_list()
+    # Names already capitalized are left alone
+    assert names == ["DeSantis, Ron", "PAC 54", "Smith, Bob"]
+    assert not plan_migration(FileMigration(path, name_columns=["cand_name"])).is_pending
@@ -0,0 +1,29 @@
+"""Exact cents arithmetic and dollar formatting."""
+
+import polars as pl
+
+from fec.utils.money import cents_to_dollars, dollars_to_cents, parse_cents
+
+
+def test_parse_cents():
+    df = pl.DataFrame({"amt": ["1234.5", "-20.00", "7", ".05", "", "abc", None]})
+    assert df.select(parse_cents(pl.col("amt")))["amt"].to_list() == [123450, -2000, 700, 5, None, None, None]
+
+
+def test_cents_to_dollars_is_exact_text():
+    df = pl.DataFrame({"total_amount": [21868755, 500000, 129, -5, -100, 0, None]})
+    out = df.select(cents_to_dollars(pl.col("total_amount")))
+
+    assert out.columns == ["total_amount"]
+    assert out["total_amount"].to_list() == ["218687.55", "5000.00", "1.29", "-0.05", "-1.00", "0.00", None]
+    assert out.write_csv() == "total_amount\n218687.55\n5000.00\n1.29\n-0.05\n-1.00\n0.00\n\n"
+
+
+def test_dollars_to_cents_rounds_float_artifacts():
+    df = pl.DataFrame({"total_amount": [218687.55000000002, 5000.0, 1.2899999999999998, -0.05]})
+    assert df.select(dollars_to_cents(pl.col("total_amount")))["total_amount"].to_list() == [
+        21868755,
+        500000,
+        129,
+        -5,
+    ]
@@ -0,0 +1,74 @@
+"""Derived-column sidecars must match the current contents of their base file."""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from fec.processors.individual import TransactionYearAdder
+from fec.utils.io import (
+    get_sidecar_path,
+    is_sidecar_current,
+    read_fec_csv,
+    read_fec_csv_blocks,
+    stream_rewrite_csv,
+)
+from fec.utils.manifest import load_manifest
+
+HEADER = "election_cycle,cmte_id,name,transaction_dt,transaction_amt,sub_id\n"
+
+
+def write_base(path: Path, rows: list[tuple[str, str, int]]) -> None:
+    lines = [f"2024,C00000001,{name},{date},100,{sub_id}\n" for name, date, sub_id in rows]
+    path.write_text(HEADER + "".join(lines))
+
+
+@pytest.fixture
+def base(tmp_path: Path) -> Path:
+    path = tmp_path / "2024_individual_contributions.csv"
+    write_base(path, [("SMITH BOB", "01152023", 1), ("DOE JANE", "06302024", 2)])
+    TransactionYearAdder(tmp_path, sidecar=True).write_sidecar(path)
+    return path
+
+
+def test_current_sidecar_is_zipped_on(base: Path):
+    df = read_fec_csv(base)
+    assert df["transaction_year"].to_list() == [2023, 2024]
+    assert read_fec_csv_blocks(base)["transaction_year"].to_list() == [2023, 2024]
+
+
+def test_stale_sidecar_is_rejected(base: Path):
+    # Same row count, different rows: only the fingerprint tells them apart
+    write_base(base, [("ROE RICH", "03012021", 3), ("SMITH BOB", "01152023", 1)])
+
+    assert not is_sidecar_current(base)
+    with pytest.raises(ValueError, match="stale"):
+        read_fec_csv(base, lazy=True)
+    with pytest.raises(ValueError, match="stale"):
+        read_fec_csv_blocks(base)
+
+
+def test_stale_sidecar_is_recomputed(base: Path):
+    write_base(base, [("ROE RICH", "03012021", 3), ("SMITH BOB", "01152023", 1)])
+
+    TransactionYearAdder(base.parent, sidecar=True).process_all(cycle=2024)
+
+    assert is_sidecar_current(base)
+    df = read_fec_csv(base)
+    assert df.select("sub_id", "transaction_year").rows() == [(3, 2021), (1, 2023)]
+
+
+def test_row_preserving_rewrite_keeps_sidecar(base: Path):
+    rows = stream_rewrite_csv(base, lambda lf: lf.with_columns(pl.col("name").str.to_titlecase()))
+
+    assert rows == 2
+    assert load_manifest(base.parent)[base.name].rows == 2
+    assert is_sidecar_current(base)
+    assert read_fec_csv(base)["transaction_year"].to_list() == [2023, 2024]
+
+
+def test_sidecar_without_fingerprint_is_stale(base: Path):
+    sidecar = get_sidecar_path(base)
+    pl.read_parquet(sidecar).write_parquet(sidecar)
+
+    assert not is_sidecar_current(base)
@@ -0,0 +1,45 @@
+"""Summarize outputs survive being written and read back."""
+
+from pathlib import Path
+
+import polars as pl
+
+from fec.config import SummarizeDataset
+from fec.processors import SummarizeProcessor
+
+
+def test_write_output_round_trips_through_read_existing(tmp_path: Path):
+    dataset = SummarizeDataset(
+        name="expenditures_by_category",
+        output_file="expenditures_by_category_2004-2026.csv",
+        fec_prefix="oppexp",
+        start_year=2004,
+        description="",
+        group_by=["election_cycle", "transaction_year", "cmte_id"],
+        column_mapping={},
+        amount_field="transaction_amt",
+        date_field="transaction_dt",
+        memo_field="memo_cd",
+        amendment_field="amndt_ind",
+        sub_id_field="sub_id",
+        input_columns=[],
+    )
+    processor = SummarizeProcessor(dataset, tmp_path)
+
+    # More than the 100 rows read_csv infers types from are whole dollars
+    cents = [500000] * 150 + [21868755, -5]
+    df = pl.DataFrame({
+        "election_cycle": [2024] * len(cents),
+        "transaction_year": [2023] * len(cents),
+        "cmte_id": [f"C{i:08d}" for i in range(len(cents))],
+        "total_amount": cents,
+        "transaction_count": [1] * len(cents),
+    })
+    processor.write_output(df, backup=False)
+
+    lines = processor.get_output_path().read_text().splitlines()
+    assert lines[1].endswith(",5000.00,1")
+    assert lines[-1].endswith(",-0.05,1")
+
+    existing = processor.read_existing()
+    assert existing["total_amount"].to_list() == cents
@@ -0,0 +1,33 @@
+"""Block iteration of individual contribution files for verification."""
+
+from pathlib import Path
+
+import pytest
+
+from fec.verify_individual import _iter_blocks
+
+HEADER = b"sub_id,name\n"
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    # Ten 10-byte lines, so every line starts exactly on a block boundary
+    path = tmp_path / "2024_individual_contributions.csv"
+    path.write_bytes(HEADER + b"".join(b"%07d,x\n" % i for i in range(10)))
+    return path
+
+
+@pytest.mark.parametrize("block_size", [3, 10, 15, 20, 100])
+def test_blocks_cover_every_line_once(path: Path, block_size: int):
+    blocks = list(_iter_blocks(path, len(HEADER), block_size, 1.0, None, seed=0))
+
+    assert b"".join(blocks) == path.read_bytes()[len(HEADER):]
+
+
+@pytest.mark.parametrize("block_size", [3, 10, 15])
+def test_sampled_blocks_do_not_overlap(path: Path, block_size: int):
+    blocks = list(_iter_blocks(path, len(HEADER), block_size, 0.5, None, seed=1))
+    lines = b"".join(blocks).splitlines()
+
+    assert lines
+    assert len(lines) == len(set(lines))